@@ -8,6 +8,8 @@ import json
 import random
 from typing import Dict, List
 
+from learning_planner import plan_learning
+
 def create_skills_radar_chart(user_skills, target_role):
     """Create a radar chart showing skill proficiency"""
     # Define role-specific skills and their importance
@@ -232,41 +234,13 @@ def generate_learning_plan(user_skills, target_role, timeline_months=6):
     if not missing_skills:
         return {"message": "You already have all the required skills!", "plan": []}
     
-    # Categorize skills by priority and difficulty
-    skill_priorities = {
-        'python': {'priority': 'high', 'weeks': 8, 'difficulty': 'medium'},
-        'sql': {'priority': 'high', 'weeks': 6, 'difficulty': 'medium'},
-        'machine learning': {'priority': 'high', 'weeks': 12, 'difficulty': 'hard'},
-        'javascript': {'priority': 'high', 'weeks': 6, 'difficulty': 'medium'},
-        'react': {'priority': 'medium', 'weeks': 8, 'difficulty': 'medium'},
-        'docker': {'priority': 'medium', 'weeks': 4, 'difficulty': 'easy'},
-        'aws': {'priority': 'medium', 'weeks': 6, 'difficulty': 'medium'},
-        'kubernetes': {'priority': 'low', 'weeks': 8, 'difficulty': 'hard'},
-        'deep learning': {'priority': 'low', 'weeks': 16, 'difficulty': 'hard'},
-    }
-    
-    # Create learning plan
-    plan = []
-    total_weeks = 0
-    
-    for skill in missing_skills:
-        skill_info = skill_priorities.get(skill.lower(), {'priority': 'medium', 'weeks': 4, 'difficulty': 'medium'})
-        
-        if total_weeks + skill_info['weeks'] <= timeline_months * 4:  # 4 weeks per month
-            plan.append({
-                'skill': skill,
-                'priority': skill_info['priority'],
-                'duration_weeks': skill_info['weeks'],
-                'difficulty': skill_info['difficulty'],
-                'start_week': total_weeks + 1,
-                'end_week': total_weeks + skill_info['weeks']
-            })
-            total_weeks += skill_info['weeks']
+    # Prerequisite-ordered schedule within the timeline, 4 weeks per month
+    plan = plan_learning(missing_skills, timeline_months * 4)
     
     return {
-        'total_duration_weeks': total_weeks,
-        'plan': plan,
-        'completion_rate': f"{len(plan)}/{len(missing_skills)} skills"
+        'total_duration_weeks': plan['total_duration_weeks'],
+        'plan': plan['plan'],
+        'completion_rate': f"{len(plan['plan'])}/{len(missing_skills)} skills"
     }
 
 def create_learning_gantt_chart(learning_plan):
@@ -9,11 +9,12 @@ import os
 from datetime import datetime
 
 # Import enhanced modules
-from resume_parser import extract_text_from_pdf
+from resume_cache import get_parsed_resume
 from utils import extract_skills, get_skills_by_category
-from skill_matcher import match_skills, get_detailed_skill_analysis
+from skill_matcher import match_skills, get_detailed_skill_analysis, find_best_role
 from course_recommender import suggest_courses
-from job_scraper import get_jobs_for_role, search_jobs_with_filters, search_jobs_by_skills, get_trending_jobs, get_job_market_stats
+from job_scraper import get_jobs_for_role, search_jobs_with_filters, search_jobs_by_skills, get_trending_jobs, get_job_market_stats, job_scraper
+from job_export import spool_job_search
 from ats_checker import get_ats_score_and_feedback
 from resume_templates import get_resume_template
 from cover_letter_generator import generate_cover_letter
@@ -422,17 +423,18 @@ def show_resume_analysis():
         # Process input
         with st.spinner("🔍 Analyzing your resume..."):
             if uploaded_file:
-                text = extract_text_from_pdf(uploaded_file)
+                # Cached by file content, so reruns skip parsing entirely
+                parsed_resume = get_parsed_resume(uploaded_file)
+                text = parsed_resume['text']
+                user_skills = parsed_resume['skills']
             else:
                 text = linkedin_text
+                user_skills = extract_skills(text)
             
             if not text:
                 st.error("❌ No text could be extracted. Please check your file.")
                 return
             
-            # Extract skills
-            user_skills = extract_skills(text)
-            
             if not user_skills:
                 st.warning("⚠️ No skills detected. Please ensure your resume contains relevant technical skills.")
                 return
@@ -464,14 +466,7 @@ def show_skills_analysis(user_skills, resume_text):
     
     # Get best matching role first
     roles = ["Data Analyst", "Backend Developer", "ML Engineer", "Frontend Developer", "DevOps Engineer"]
-    best_role = None
-    best_score = 0
-    
-    for role in roles:
-        matched, missing, score = match_skills(user_skills, role)
-        if score > best_score:
-            best_score = score
-            best_role = role
+    best_role, best_score = find_best_role(user_skills, roles)
     
     if best_role:
         # Store best role in session state
@@ -571,14 +566,7 @@ def show_job_listings(user_skills):
     
     # Get best matching role
     roles = ["Data Analyst", "Backend Developer", "ML Engineer", "Frontend Developer", "DevOps Engineer"]
-    best_role = None
-    best_score = 0
-    
-    for role in roles:
-        matched, missing, score = match_skills(user_skills, role)
-        if score > best_score:
-            best_score = score
-            best_role = role
+    best_role, best_score = find_best_role(user_skills, roles)
     
     # Role selector
     col1, col2 = st.columns([2, 1])
@@ -597,11 +585,9 @@ def show_job_listings(user_skills):
             key="location_filter_selectbox"
         )
     
-    # Get and display jobs
-    jobs = get_jobs_for_role(selected_role)
-    
-    if location_filter != "All Locations":
-        jobs = [job for job in jobs if location_filter.lower() in job.get('location', '').lower()]
+    # Get and display jobs (the CSV export below uses the same search)
+    location = location_filter if location_filter != "All Locations" else None
+    jobs = search_jobs_with_filters(role=selected_role, location=location)
     
     if jobs:
         st.markdown(f"""
@@ -631,16 +617,16 @@ def show_job_listings(user_skills):
                         st.markdown(f"**Remote Option:** {job.get('remote_option', 'Office-based')}")
                         st.markdown(f"**Posted:** {job.get('posted_date', 'Recently')}")
         
-        # Download job list
-        df = pd.DataFrame(jobs)
-        if not df.empty:
-            csv = df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download Job List (CSV)",
-                data=csv,
-                file_name=f"{selected_role}_jobs.csv",
-                mime="text/csv"
-            )
+        # Download job list, spooled from the current store only when asked for
+        if st.button("📄 Export Job List", key="prepare_job_export"):
+            filters = {'role': selected_role, 'location': location}
+            with spool_job_search(job_scraper, 'csv', filters=filters) as export_file:
+                st.download_button(
+                    label="📥 Download Job List (CSV)",
+                    data=export_file,
+                    file_name=f"{selected_role}_jobs.csv",
+                    mime="text/csv"
+                )
     else:
         st.warning("No jobs found for the selected criteria. Try different filters.")
 
@@ -3,7 +3,10 @@ import re
 import nltk
 from textstat import flesch_reading_ease, flesch_kincaid_grade
 from collections import Counter
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
 import streamlit as st
+from utils import SkillAutomaton
 
 # Download required NLTK data
 @st.cache_data
@@ -15,6 +18,137 @@ def download_nltk_data():
     except:
         pass
 
+# Role-specific keywords and weights
+ROLE_KEYWORDS = {
+    "Data Analyst": {
+        'core': ['python', 'sql', 'excel', 'data analysis', 'statistics'],
+        'tools': ['pandas', 'numpy', 'matplotlib', 'tableau', 'powerbi'],
+        'skills': ['data visualization', 'reporting', 'dashboard', 'etl'],
+        'soft': ['analytical', 'problem solving', 'communication']
+    },
+    "Backend Developer": {
+        'core': ['python', 'java', 'api', 'database', 'server'],
+        'tools': ['django', 'flask', 'spring', 'docker', 'kubernetes'],
+        'skills': ['rest api', 'microservices', 'authentication', 'security'],
+        'soft': ['debugging', 'optimization', 'scalability']
+    },
+    "ML Engineer": {
+        'core': ['machine learning', 'python', 'statistics', 'algorithms'],
+        'tools': ['tensorflow', 'pytorch', 'scikit-learn', 'jupyter', 'git'],
+        'skills': ['deep learning', 'neural networks', 'model deployment', 'mlops'],
+        'soft': ['research', 'experimentation', 'analytical thinking']
+    }
+}
+
+def get_role_keywords(role):
+    """Get the ATS keyword table for a role, falling back to Data Analyst"""
+    return ROLE_KEYWORDS.get(role, ROLE_KEYWORDS["Data Analyst"])
+
+# Section header terms checked by analyze_format
+FORMAT_SECTION_TERMS = {
+    'contact': ['email', 'phone', 'linkedin', 'github'],
+    'summary': ['summary', 'objective', 'profile', 'about'],
+    'experience': ['experience', 'employment', 'work', 'career'],
+    'education': ['education', 'degree', 'university', 'college'],
+    'skills': ['skills', 'competencies', 'technical']
+}
+
+ACTION_VERBS = [
+    'achieved', 'developed', 'managed', 'led', 'created', 'implemented',
+    'designed', 'optimized', 'analyzed', 'built', 'improved', 'increased'
+]
+
+PASSIVE_INDICATORS = ['was', 'were', 'been', 'being']
+
+STANDARD_HEADERS = ['experience', 'education', 'skills', 'summary']
+NON_STANDARD_HEADERS = ['expertise', 'qualifications', 'competencies']
+
+PROBLEMATIC_CHARS = ['@', '#', '$', '%', '^', '&', '*', '(', ')', '[', ']', '{', '}']
+BULLET_CHARS = ['•', '-', '*']
+TABLE_CHARS = ['\t', '|']
+
+# Characters the analyzers look at; only these are histogrammed
+TRACKED_CHARS = frozenset(PROBLEMATIC_CHARS + BULLET_CHARS + TABLE_CHARS)
+TRACKED_CHAR_PATTERN = re.compile('[' + ''.join(re.escape(char) for char in sorted(TRACKED_CHARS)) + ']')
+
+DATE_PATTERN = re.compile(
+    r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'  # MM/DD/YYYY or MM-DD-YYYY
+    r'|\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b'   # YYYY/MM/DD or YYYY-MM-DD
+    r'|\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b'  # Month YYYY
+)
+NUMBER_PATTERN = re.compile(r'\d+')
+
+def _collect_ats_terms():
+    terms = set(ACTION_VERBS) | set(PASSIVE_INDICATORS) | set(STANDARD_HEADERS) | set(NON_STANDARD_HEADERS)
+    for section_terms in FORMAT_SECTION_TERMS.values():
+        terms.update(section_terms)
+    for keywords in ROLE_KEYWORDS.values():
+        for words in keywords.values():
+            terms.update(word.lower() for word in words)
+    return frozenset(terms)
+
+# Every fixed term the analyzers look for; counted once per resume
+ATS_TERMS = _collect_ats_terms()
+
+# Counts every ATS term in a single scan of the resume
+ATS_TERM_AUTOMATON = SkillAutomaton({term: term for term in ATS_TERMS})
+
+class ResumeFeatures(NamedTuple):
+    """Immutable text features shared by all ATS analyzers"""
+    text: str
+    text_lower: str
+    word_count: int
+    token_counts: Mapping[str, int]
+    char_counts: Mapping[str, int]
+    term_counts: Mapping[str, int]
+    number_count: int
+    has_date: bool
+    reading_ease: Optional[float]
+
+    def has_term(self, term):
+        """Whether term occurs anywhere in the lowercased text"""
+        term = term.lower()
+        if term in self.term_counts:
+            return True
+        if term in ATS_TERMS:
+            return False
+        return term in self.text_lower
+
+    def char_total(self, chars):
+        return sum(self.char_counts.get(char, 0) for char in chars)
+
+def _count_terms(text_lower):
+    # Substring counts, as text_lower.count(term) would give for each term
+    return ATS_TERM_AUTOMATON.count_all(text_lower)
+
+def extract_text_features(text):
+    """
+    Tokenize and scan the resume once, producing the feature record every
+    analyzer reads from
+    """
+    if isinstance(text, ResumeFeatures):
+        return text
+    
+    text_lower = text.lower()
+    token_counts = Counter(text_lower.split())
+    
+    try:
+        reading_ease = flesch_reading_ease(text)
+    except:
+        reading_ease = None
+    
+    return ResumeFeatures(
+        text=text,
+        text_lower=text_lower,
+        word_count=sum(token_counts.values()),
+        token_counts=MappingProxyType(token_counts),
+        char_counts=MappingProxyType(Counter(TRACKED_CHAR_PATTERN.findall(text))),
+        term_counts=MappingProxyType(_count_terms(text_lower)),
+        number_count=len(NUMBER_PATTERN.findall(text)),
+        has_date=DATE_PATTERN.search(text) is not None,
+        reading_ease=reading_ease
+    )
+
 def get_ats_score_and_feedback(resume_text, role):
     """
     Enhanced ATS scoring with comprehensive feedback
@@ -24,51 +158,49 @@ def get_ats_score_and_feedback(resume_text, role):
     
     download_nltk_data()
     
-    # Role-specific keywords and weights
-    role_keywords = {
-        "Data Analyst": {
-            'core': ['python', 'sql', 'excel', 'data analysis', 'statistics'],
-            'tools': ['pandas', 'numpy', 'matplotlib', 'tableau', 'powerbi'],
-            'skills': ['data visualization', 'reporting', 'dashboard', 'etl'],
-            'soft': ['analytical', 'problem solving', 'communication']
-        },
-        "Backend Developer": {
-            'core': ['python', 'java', 'api', 'database', 'server'],
-            'tools': ['django', 'flask', 'spring', 'docker', 'kubernetes'],
-            'skills': ['rest api', 'microservices', 'authentication', 'security'],
-            'soft': ['debugging', 'optimization', 'scalability']
-        },
-        "ML Engineer": {
-            'core': ['machine learning', 'python', 'statistics', 'algorithms'],
-            'tools': ['tensorflow', 'pytorch', 'scikit-learn', 'jupyter', 'git'],
-            'skills': ['deep learning', 'neural networks', 'model deployment', 'mlops'],
-            'soft': ['research', 'experimentation', 'analytical thinking']
-        }
-    }
-    
-    keywords = role_keywords.get(role, role_keywords["Data Analyst"])
+    keywords = get_role_keywords(role)
+    features = extract_text_features(resume_text)
     
+    return combine_ats_results(analyze_keywords(features, keywords), analyze_resume_structure(features))
+
+def analyze_resume_structure(resume_text):
+    """
+    Run the role-independent analyzers (format, content quality and ATS
+    compatibility) so their results can be reused across roles
+    """
+    features = extract_text_features(resume_text)
+    return {
+        'format': analyze_format(features),
+        'content': analyze_content_quality(features),
+        'ats': analyze_ats_compatibility(features)
+    }
+
+def combine_ats_results(keyword_result, structure):
+    """
+    Weight keyword and structure analysis results into the final ATS score
+    and feedback list
+    """
     # Calculate different scoring components
     scores = {}
     feedback = []
     
     # 1. Keyword Matching (40% weight)
-    keyword_score, keyword_feedback = analyze_keywords(resume_text, keywords)
+    keyword_score, keyword_feedback = keyword_result
     scores['keywords'] = keyword_score * 0.4
     feedback.extend(keyword_feedback)
     
     # 2. Format and Structure (25% weight)
-    format_score, format_feedback = analyze_format(resume_text)
+    format_score, format_feedback = structure['format']
     scores['format'] = format_score * 0.25
     feedback.extend(format_feedback)
     
     # 3. Content Quality (20% weight)
-    content_score, content_feedback = analyze_content_quality(resume_text)
+    content_score, content_feedback = structure['content']
     scores['content'] = content_score * 0.20
     feedback.extend(content_feedback)
     
     # 4. ATS Compatibility (15% weight)
-    ats_score, ats_feedback = analyze_ats_compatibility(resume_text)
+    ats_score, ats_feedback = structure['ats']
     scores['ats'] = ats_score * 0.15
     feedback.extend(ats_feedback)
     
@@ -85,9 +217,32 @@ def get_ats_score_and_feedback(resume_text, role):
     
     return min(100, int(total_score)), feedback
 
+def get_ats_scores_for_roles(resume_text, roles):
+    """
+    Score one resume against several roles, running the role-independent
+    analyzers once and the keyword analysis once per distinct keyword table.
+    Returns {role: (score, feedback)}.
+    """
+    if not resume_text:
+        return {role: (0, ["No resume text provided"]) for role in roles}
+    
+    features = extract_text_features(resume_text)
+    structure = analyze_resume_structure(features)
+    keyword_results = {}
+    results = {}
+    
+    for role in roles:
+        keywords = get_role_keywords(role)
+        table_id = id(keywords)
+        if table_id not in keyword_results:
+            keyword_results[table_id] = analyze_keywords(features, keywords)
+        results[role] = combine_ats_results(keyword_results[table_id], structure)
+    
+    return results
+
 def analyze_keywords(text, keywords):
     """Analyze keyword presence and density"""
-    text_lower = text.lower()
+    features = extract_text_features(text)
     score = 0
     feedback = []
     total_possible = 0
@@ -99,7 +254,7 @@ def analyze_keywords(text, keywords):
         
         for keyword in words:
             total_possible += 1
-            if keyword.lower() in text_lower:
+            if features.has_term(keyword):
                 category_found += 1
                 found_keywords.append(keyword)
             else:
@@ -117,8 +272,8 @@ def analyze_keywords(text, keywords):
         score = (len(found_keywords) / total_possible) * 100
     
     # Check for keyword stuffing
-    word_count = len(text.split())
-    keyword_density = len(found_keywords) / word_count * 100
+    word_count = features.word_count
+    keyword_density = len(found_keywords) / word_count * 100 if word_count else 0
     
     if keyword_density > 3:
         feedback.append("⚠️ Keyword density is too high. Avoid keyword stuffing.")
@@ -130,21 +285,14 @@ def analyze_keywords(text, keywords):
 
 def analyze_format(text):
     """Analyze resume format and structure"""
+    features = extract_text_features(text)
     score = 100
     feedback = []
     
     # Check for common sections
-    sections = {
-        'contact': r'(email|phone|linkedin|github)',
-        'summary': r'(summary|objective|profile|about)',
-        'experience': r'(experience|employment|work|career)',
-        'education': r'(education|degree|university|college)',
-        'skills': r'(skills|competencies|technical)'
-    }
-    
     missing_sections = []
-    for section, pattern in sections.items():
-        if not re.search(pattern, text, re.IGNORECASE):
+    for section, terms in FORMAT_SECTION_TERMS.items():
+        if not any(features.has_term(term) for term in terms):
             missing_sections.append(section)
             score -= 15
     
@@ -152,7 +300,7 @@ def analyze_format(text):
         feedback.append(f"❌ Missing sections: {', '.join(missing_sections)}")
     
     # Check length
-    word_count = len(text.split())
+    word_count = features.word_count
     if word_count < 300:
         feedback.append("❌ Resume is too short. Aim for 300-800 words.")
         score -= 20
@@ -163,13 +311,12 @@ def analyze_format(text):
         feedback.append("✅ Good resume length!")
     
     # Check for bullet points
-    if text.count('•') + text.count('-') + text.count('*') < 5:
+    if features.char_total(BULLET_CHARS) < 5:
         feedback.append("⚠️ Use more bullet points to improve readability.")
         score -= 10
     
     # Check for numbers and metrics
-    numbers = re.findall(r'\d+', text)
-    if len(numbers) < 3:
+    if features.number_count < 3:
         feedback.append("❌ Add more quantifiable achievements (numbers, percentages, etc.).")
         score -= 15
     
@@ -177,12 +324,13 @@ def analyze_format(text):
 
 def analyze_content_quality(text):
     """Analyze content quality and readability"""
+    features = extract_text_features(text)
     score = 100
     feedback = []
     
     # Check readability
-    try:
-        reading_ease = flesch_reading_ease(text)
+    reading_ease = features.reading_ease
+    if reading_ease is not None:
         if reading_ease < 30:
             feedback.append("❌ Text is too complex. Simplify language for better readability.")
             score -= 20
@@ -191,37 +339,24 @@ def analyze_content_quality(text):
             score -= 10
         else:
             feedback.append("✅ Good readability level!")
-    except:
-        pass
     
     # Check for action verbs
-    action_verbs = [
-        'achieved', 'developed', 'managed', 'led', 'created', 'implemented',
-        'designed', 'optimized', 'analyzed', 'built', 'improved', 'increased'
-    ]
-    
-    found_verbs = 0
-    for verb in action_verbs:
-        if verb in text.lower():
-            found_verbs += 1
+    found_verbs = sum(1 for verb in ACTION_VERBS if features.has_term(verb))
     
     if found_verbs < 3:
         feedback.append("❌ Use more action verbs to describe your achievements.")
         score -= 15
     
     # Check for passive voice (basic check)
-    passive_indicators = ['was', 'were', 'been', 'being']
-    passive_count = sum(text.lower().count(indicator) for indicator in passive_indicators)
-    total_words = len(text.split())
+    passive_count = sum(features.term_counts.get(indicator, 0) for indicator in PASSIVE_INDICATORS)
+    total_words = features.word_count
     
-    if passive_count / total_words > 0.1:
+    if total_words and passive_count / total_words > 0.1:
         feedback.append("⚠️ Reduce passive voice. Use more active voice statements.")
         score -= 10
     
     # Check for repetitive words
-    words = text.lower().split()
-    word_counts = Counter(words)
-    repetitive_words = [word for word, count in word_counts.items() if count > 5 and len(word) > 4]
+    repetitive_words = [word for word, count in features.token_counts.items() if count > 5 and len(word) > 4]
     
     if repetitive_words:
         feedback.append(f"⚠️ Words used too frequently: {', '.join(repetitive_words[:3])}")
@@ -231,47 +366,37 @@ def analyze_content_quality(text):
 
 def analyze_ats_compatibility(text):
     """Analyze ATS compatibility"""
+    features = extract_text_features(text)
     score = 100
     feedback = []
     
     # Check for problematic characters
-    problematic_chars = ['@', '#', '$', '%', '^', '&', '*', '(', ')', '[', ']', '{', '}']
-    char_count = sum(text.count(char) for char in problematic_chars)
+    char_count = features.char_total(PROBLEMATIC_CHARS)
     
     if char_count > 10:
         feedback.append("⚠️ Reduce special characters that might confuse ATS systems.")
         score -= 15
     
     # Check for tables/columns (basic check)
-    if '\t' in text or '|' in text:
+    if features.char_total(TABLE_CHARS):
         feedback.append("⚠️ Avoid tables and columns. Use simple formatting.")
         score -= 20
     
     # Check for standard section headers
-    standard_headers = ['experience', 'education', 'skills', 'summary']
-    non_standard_headers = ['expertise', 'qualifications', 'competencies']
-    
-    has_standard = any(header in text.lower() for header in standard_headers)
-    has_non_standard = any(header in text.lower() for header in non_standard_headers)
+    has_standard = any(features.has_term(header) for header in STANDARD_HEADERS)
+    has_non_standard = any(features.has_term(header) for header in NON_STANDARD_HEADERS)
     
     if not has_standard and has_non_standard:
         feedback.append("⚠️ Use standard section headers (Experience, Education, Skills, etc.).")
         score -= 10
     
     # Check for contact information format
-    if '@' not in text:
+    if not features.char_counts.get('@'):
         feedback.append("❌ Include email address in standard format.")
         score -= 20
     
     # Check for date formats
-    date_patterns = [
-        r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',  # MM/DD/YYYY or MM-DD-YYYY
-        r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',    # YYYY/MM/DD or YYYY-MM-DD
-        r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b'  # Month YYYY
-    ]
-    
-    date_found = any(re.search(pattern, text) for pattern in date_patterns)
-    if not date_found:
+    if not features.has_date:
         feedback.append("⚠️ Include dates in standard format (Jan 2020, 01/2020, etc.).")
         score -= 10
     
@@ -0,0 +1,79 @@
+# batch_scoring.py - Bulk resume scoring against multiple roles
+import logging
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+from utils import extract_skills
+from skill_matcher import role_registry, role_scoring_engine
+from ats_checker import get_ats_scores_for_roles
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RESULT_COLUMNS = [
+    'resume_id', 'role', 'match_score', 'matched_count', 'missing_count',
+    'ats_score', 'skills_count'
+]
+
+def score_resumes(texts: Union[Dict[str, str], Iterable[str]], roles: Optional[List[str]] = None,
+                  include_feedback: bool = False) -> pd.DataFrame:
+    """
+    Score a batch of resumes against several roles in one call.
+
+    `texts` is either a list of resume texts (ids are their positions) or a
+    dict of {resume_id: text}. Returns one row per (resume, role) with the
+    weighted role match score, matched/missing requirement counts and the
+    ATS score. Role requirements, the scoring matrix and ATS keyword tables
+    are prepared once for the whole batch.
+    """
+    if isinstance(texts, dict):
+        resume_ids = list(texts.keys())
+        resume_texts = list(texts.values())
+    else:
+        resume_texts = list(texts)
+        resume_ids = list(range(len(resume_texts)))
+
+    if roles is None:
+        roles = role_registry.role_names()
+
+    columns = RESULT_COLUMNS + (['ats_feedback'] if include_feedback else [])
+    if not resume_texts or not roles:
+        return pd.DataFrame([], columns=columns)
+
+    role_requirements = role_registry.roles()
+    for role in roles:
+        if role not in role_requirements:
+            logger.warning(f"Unknown role in batch: {role}")
+
+    # Skill extraction, then every resume against every role in one product
+    skill_lists = [extract_skills(text) for text in resume_texts]
+    score_matrix = role_scoring_engine.score_matrix(role_scoring_engine.encode_many(skill_lists))
+    role_columns = role_scoring_engine.role_index
+
+    rows = []
+    for resume_id, text, skills, match_scores in zip(resume_ids, resume_texts, skill_lists, score_matrix):
+        skills_lower = {skill.lower() for skill in skills}
+        ats_results = get_ats_scores_for_roles(text, roles)
+
+        for role in roles:
+            requirements = role_requirements.get(role)
+            if requirements is None:
+                match_score, matched_count, missing_count = 0, 0, 0
+            else:
+                if role in role_columns:
+                    match_score = int(match_scores[role_columns[role]])
+                else:
+                    # Old list-format roles are not part of the scoring matrix
+                    match_score = role_scoring_engine.score_roles(skills, [role])[role]
+                matched_count = len(requirements.required_set & skills_lower)
+                missing_count = len(requirements.required_set) - matched_count
+
+            ats_score, ats_feedback = ats_results[role]
+            row = [resume_id, role, match_score, matched_count, missing_count, ats_score, len(skills)]
+            if include_feedback:
+                row.append(ats_feedback)
+            rows.append(row)
+
+    return pd.DataFrame(rows, columns=columns)
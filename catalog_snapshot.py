@@ -0,0 +1,99 @@
+# catalog_snapshot.py - Compact serialized snapshots of the built-in catalogs
+import argparse
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import sys
+from typing import Any, Dict, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+JOB_CATALOG_PATH = os.path.join(ASSETS_DIR, "job_catalog.json.gz")
+COURSE_CATALOG_PATH = os.path.join(ASSETS_DIR, "course_catalog.json.gz")
+
+# File names written by build_shared_snapshots
+JOB_SNAPSHOT_NAME = "jobs.db"
+COURSE_SNAPSHOT_NAME = "courses.map"
+
+def load_snapshot(path: str) -> Any:
+    """Read a gzipped JSON snapshot"""
+    with gzip.open(path, 'rb') as f:
+        return json.loads(f.read())
+
+def save_snapshot(path: str, data: Any) -> int:
+    """
+    Write data as gzipped compact JSON and return the compressed size.
+    The output is byte-for-byte reproducible for the same data.
+    """
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    compressed = gzip.compress(payload, compresslevel=9, mtime=0)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(compressed)
+    os.replace(temp_path, path)
+    return len(compressed)
+
+def build_shared_snapshots(output_dir: str) -> Dict[str, str]:
+    """
+    Build the read-only snapshots that worker processes share through the
+    page cache: the job catalog as an indexed SQLite database (opened with
+    JOB_SNAPSHOT_PATH) and the course catalog as a mapped catalog (opened
+    with COURSE_SNAPSHOT_PATH). Both files are replaced atomically.
+    """
+    from job_scraper import JobScraper
+    from mapped_catalog import write_mapped_catalog
+    from sqlite_job_store import SQLiteJobStore
+
+    os.makedirs(output_dir, exist_ok=True)
+    job_path = os.path.join(output_dir, JOB_SNAPSHOT_NAME)
+    course_path = os.path.join(output_dir, COURSE_SNAPSHOT_NAME)
+
+    temp_path = f"{job_path}.tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    scraper = JobScraper()
+    job_store = SQLiteJobStore(temp_path, scraper.location_mapping)
+    job_store.load(scraper.load_job_database())
+    job_count = len(job_store)
+    job_store.close()
+    connection = sqlite3.connect(temp_path)
+    try:
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+    os.replace(temp_path, job_path)
+
+    write_mapped_catalog(course_path, load_snapshot(COURSE_CATALOG_PATH))
+    logger.info(f"Wrote {job_count} jobs to {job_path} and the course catalog to {course_path}")
+    return {'jobs': job_path, 'courses': course_path}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect or rebuild catalog snapshots")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    dump = subparsers.add_parser('dump', help="Print a snapshot as indented JSON")
+    dump.add_argument('snapshot')
+    pack = subparsers.add_parser('pack', help="Write a JSON file as a snapshot")
+    pack.add_argument('source')
+    pack.add_argument('snapshot')
+    build = subparsers.add_parser('build', help="Build shared read-only snapshots for worker processes")
+    build.add_argument('output_dir')
+    args = parser.parse_args(argv)
+
+    if args.command == 'dump':
+        json.dump(load_snapshot(args.snapshot), sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+    elif args.command == 'build':
+        build_shared_snapshots(args.output_dir)
+    else:
+        with open(args.source, 'r', encoding='utf-8') as f:
+            size = save_snapshot(args.snapshot, json.load(f))
+        logger.info(f"Wrote {args.snapshot} ({size} bytes)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
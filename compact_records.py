@@ -0,0 +1,189 @@
+# compact_records.py - Compact in-memory records for catalog entries
+import logging
+from typing import Any, Dict, Hashable, List
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Posting fields packed into JobRecord slots
+JOB_TEXT_FIELDS = ('company', 'title', 'location', 'link', 'salary', 'experience', 'posted_date', 'description')
+JOB_LIST_FIELDS = ('requirements', 'benefits')
+JOB_ENUM_FIELDS = ('company_size', 'job_type', 'remote_option')
+JOB_FIELDS = JOB_TEXT_FIELDS + JOB_LIST_FIELDS + JOB_ENUM_FIELDS
+
+# Fields that are unique per posting, so pooling them would only grow the pool
+UNPOOLED_FIELDS = frozenset({'link', 'description'})
+
+def _pool_key(value: Any) -> tuple:
+    # Keyed by type too, so 1, 1.0 and True are not folded together
+    if type(value) is tuple:
+        return (tuple, tuple(map(type, value)), value)
+    return (type(value), value)
+
+class ValuePool:
+    """
+    Keeps one shared object per distinct value, so repeated strings,
+    numbers and tuples of them are stored once. Every intern is counted,
+    and a value leaves the pool when release has been called as often.
+    """
+    def __init__(self):
+        self._values: Dict[tuple, Any] = {}
+        self._counts: Dict[tuple, int] = {}
+
+    def __len__(self):
+        return len(self._values)
+
+    def intern(self, value: Any) -> Any:
+        key = _pool_key(value)
+        try:
+            value = self._values.setdefault(key, value)
+        except TypeError:
+            # Unhashable values are kept as they are
+            return value
+        self._counts[key] = self._counts.get(key, 0) + 1
+        return value
+
+    def release(self, value: Any) -> None:
+        """Drop one reference taken by intern"""
+        key = _pool_key(value)
+        try:
+            count = self._counts.get(key)
+        except TypeError:
+            return
+        if count is None:
+            return
+        if count > 1:
+            self._counts[key] = count - 1
+        else:
+            del self._counts[key]
+            del self._values[key]
+
+    def intern_list(self, values: List) -> tuple:
+        """A list as a pooled tuple of pooled items"""
+        return self.intern(tuple(self.intern(value) for value in values))
+
+    def release_list(self, values: tuple) -> None:
+        """Drop the references taken by intern_list"""
+        for value in values:
+            self.release(value)
+        self.release(values)
+
+class EnumCodec:
+    """
+    Small integer ids for the values of a low-cardinality field. Encodes
+    are counted like ValuePool interns; the id of a released value is
+    reused by the next new value.
+    """
+    def __init__(self):
+        self.values: List[Hashable] = []
+        self._ids: Dict[tuple, int] = {}
+        self._counts: List[int] = []
+        self._free_ids: List[int] = []
+
+    def __len__(self):
+        return len(self._ids)
+
+    def encode(self, value: Hashable) -> int:
+        key = (type(value), value)
+        value_id = self._ids.get(key)
+        if value_id is None:
+            if self._free_ids:
+                value_id = self._free_ids.pop()
+                self.values[value_id] = value
+                self._counts[value_id] = 0
+            else:
+                value_id = len(self.values)
+                self.values.append(value)
+                self._counts.append(0)
+            self._ids[key] = value_id
+        self._counts[value_id] += 1
+        return value_id
+
+    def release(self, value_id: int) -> None:
+        """Drop one reference taken by encode"""
+        self._counts[value_id] -= 1
+        if self._counts[value_id] == 0:
+            value = self.values[value_id]
+            del self._ids[(type(value), value)]
+            self.values[value_id] = None
+            self._free_ids.append(value_id)
+
+    def decode(self, value_id: int) -> Hashable:
+        return self.values[value_id]
+
+class JobRecord:
+    """
+    One posting packed into slots: pooled strings, requirement and benefit
+    lists as pooled tuples, and enum ids for company size, job type and
+    remote option. `layout` is the pooled tuple of the posting's keys in
+    their original order, and `extra` holds any field that does not fit a
+    slot. The store also keeps per-posting derived values here rather than
+    in side tables.
+    """
+    __slots__ = JOB_FIELDS + ('role', 'layout', 'extra', 'salary_min', 'salary_max', 'experience_min',
+                              'experience_max', 'recency', 'requirement_count')
+
+class JobRecordCodec:
+    """
+    Packs posting dicts into JobRecords and unpacks them into fresh dicts.
+    Release a record when it is dropped, so values no live record uses
+    leave the pool and the enums.
+    """
+    def __init__(self):
+        self.pool = ValuePool()
+        self.enums = {field: EnumCodec() for field in JOB_ENUM_FIELDS}
+
+    def pack(self, role: str, job: Dict) -> JobRecord:
+        pool = self.pool
+        record = JobRecord()
+        record.role = pool.intern(role)
+        record.layout = pool.intern(tuple(job))
+        extra = None
+
+        for field, value in job.items():
+            if field in UNPOOLED_FIELDS:
+                setattr(record, field, value)
+            elif field in JOB_LIST_FIELDS and type(value) is list:
+                setattr(record, field, pool.intern_list(value))
+            elif field in JOB_ENUM_FIELDS and isinstance(value, Hashable):
+                setattr(record, field, self.enums[field].encode(value))
+            elif field in JOB_TEXT_FIELDS:
+                setattr(record, field, pool.intern(value))
+            else:
+                if extra is None:
+                    extra = {}
+                extra[field] = value
+        record.extra = extra
+        return record
+
+    def release(self, record: JobRecord) -> None:
+        """Drop the pool and enum references taken when the record was packed"""
+        pool = self.pool
+        extra = record.extra
+        for field in record.layout:
+            if (extra is not None and field in extra) or field in UNPOOLED_FIELDS:
+                continue
+            if field in JOB_LIST_FIELDS:
+                pool.release_list(getattr(record, field))
+            elif field in JOB_ENUM_FIELDS:
+                self.enums[field].release(getattr(record, field))
+            else:
+                pool.release(getattr(record, field))
+        pool.release(record.layout)
+        pool.release(record.role)
+
+    def unpack(self, record: JobRecord) -> Dict:
+        """The posting as a new dict with its original keys and key order"""
+        job = {}
+        extra = record.extra
+        for field in record.layout:
+            if extra is not None and field in extra:
+                job[field] = extra[field]
+            elif field in JOB_LIST_FIELDS:
+                job[field] = list(getattr(record, field))
+            elif field in JOB_ENUM_FIELDS:
+                job[field] = self.enums[field].decode(getattr(record, field))
+            else:
+                job[field] = getattr(record, field)
+        return job
@@ -0,0 +1,181 @@
+# course_index.py - Substring and prefix index over the course catalog
+import bisect
+import heapq
+import logging
+import re
+from array import array
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Texts are indexed by every n-gram up to this length
+MAX_GRAM = 3
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+def _grams(text: str, size: int) -> Set[str]:
+    return {text[start:start + size] for start in range(len(text) - size + 1)}
+
+def _index_grams(text: str) -> Set[str]:
+    grams = set()
+    for size in range(1, MAX_GRAM + 1):
+        grams.update(_grams(text, size))
+    return grams
+
+class _GramIndex:
+    """Maps n-grams to the ids of the texts containing them; hits are verified with `in`"""
+    def __init__(self):
+        self.texts: List[str] = []
+        self.postings = defaultdict(set)
+
+    def add(self, text: str) -> int:
+        text_id = len(self.texts)
+        self.texts.append(text)
+        for gram in _index_grams(text):
+            self.postings[gram].add(text_id)
+        return text_id
+
+    def containing(self, query: str) -> Set[int]:
+        """Ids of the texts that contain query as a substring"""
+        if not query:
+            return set(range(len(self.texts)))
+
+        size = min(len(query), MAX_GRAM)
+        posting_lists = sorted((self.postings.get(gram, set()) for gram in _grams(query, size)), key=len)
+        candidates = set(posting_lists[0])
+        for ids in posting_lists[1:]:
+            candidates &= ids
+            if not candidates:
+                return candidates
+        if len(query) <= MAX_GRAM:
+            return candidates
+        return {text_id for text_id in candidates if query in self.texts[text_id]}
+
+class CourseSearchIndex:
+    """
+    Courses indexed for substring and type-ahead search.
+
+    Every (skill, course) pair becomes an entry, numbered in catalog order.
+    Skill keys and lowercased course titles go into n-gram indexes, so a
+    substring query only verifies texts sharing all of its n-grams. Every
+    word of a skill key or title goes into a sorted word list, so a prefix
+    query is a bisect followed by a walk over the matching words. Results
+    are ranked by rating, with ties kept in catalog order.
+
+    Courses are not kept: an entry id maps back to its (skill, position)
+    in the catalog, and only the courses returned are looked up there, so
+    a MappedCatalog is never decoded into the heap.
+    """
+    def __init__(self, courses_database: Mapping[str, List[Dict]]):
+        self.courses_database = courses_database
+        self.skills: List[str] = []
+        self.skill_ids: Dict[str, int] = {}
+        # Per entry id, in catalog order: the course's rating, and the first
+        # entry id with the same URL (the key courses are deduplicated by)
+        self._ratings = array('d')
+        self._url_entries = array('q')
+        self._skill_entries: List[range] = []
+        self._skill_starts: List[int] = []
+        self._skill_grams = _GramIndex()
+        self._title_grams = _GramIndex()
+        # Sorted (word, entry id or -1 - skill id) pairs for prefix lookups
+        self._words: List[Tuple[str, int]] = []
+
+        url_entries = {}
+        for skill, courses in courses_database.items():
+            skill_id = len(self.skills)
+            self.skills.append(skill)
+            self.skill_ids[skill] = skill_id
+            self._skill_grams.add(skill)
+
+            start = len(self._ratings)
+            for course in courses:
+                entry_id = len(self._ratings)
+                self._ratings.append(course['rating'])
+                self._url_entries.append(url_entries.setdefault(course['url'], entry_id))
+                title = course['title'].lower()
+                self._title_grams.add(title)
+                self._words.extend((word, entry_id) for word in set(_WORD_PATTERN.findall(title)))
+            self._skill_entries.append(range(start, len(self._ratings)))
+            self._skill_starts.append(start)
+            self._words.extend((word, -1 - skill_id) for word in set(_WORD_PATTERN.findall(skill)))
+
+        self._words.sort()
+
+    def course(self, entry_id: int) -> Dict:
+        """Look up the course of an entry in the catalog"""
+        skill_id = bisect.bisect_right(self._skill_starts, entry_id) - 1
+        skill, position = self.skills[skill_id], entry_id - self._skill_starts[skill_id]
+        if hasattr(self.courses_database, 'group_record'):
+            return self.courses_database.group_record(skill, position)
+        return self.courses_database[skill][position]
+
+    def _rank(self, entry_ids: Iterable[int], limit: Optional[int] = None) -> List[Dict]:
+        # Keep the first entry per course URL, then order by rating
+        first_entries = {}
+        for entry_id in sorted(entry_ids):
+            first_entries.setdefault(self._url_entries[entry_id], entry_id)
+
+        keys = ((-self._ratings[entry_id], entry_id) for entry_id in first_entries.values())
+        ranked = sorted(keys) if limit is None else heapq.nsmallest(limit, keys)
+        return [self.course(entry_id) for _, entry_id in ranked]
+
+    def skills_containing(self, query: str) -> List[str]:
+        """Skill keys that contain the lowercased query, in catalog order"""
+        return [self.skills[skill_id] for skill_id in sorted(self._skill_grams.containing(query.lower()))]
+
+    def skills_within(self, text: str) -> List[str]:
+        """Skill keys that occur inside the lowercased text, in catalog order"""
+        text = text.lower()
+        found = set()
+        for start in range(len(text)):
+            for end in range(start + 1, len(text) + 1):
+                skill_id = self.skill_ids.get(text[start:end])
+                if skill_id is not None:
+                    found.add(skill_id)
+        return [self.skills[skill_id] for skill_id in sorted(found)]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Courses whose skill key or title contains the query, unique by URL
+        and best rated first
+        """
+        query = query.lower()
+        entry_ids = set(self._title_grams.containing(query))
+        for skill_id in self._skill_grams.containing(query):
+            entry_ids.update(self._skill_entries[skill_id])
+        return self._rank(entry_ids, limit)
+
+    def _prefix_matches(self, prefix: str) -> Tuple[Set[int], Set[int]]:
+        # (skill ids, entry ids) having a word that starts with prefix
+        skill_ids, entry_ids = set(), set()
+        position = bisect.bisect_left(self._words, (prefix, -len(self.skills) - 1))
+        while position < len(self._words) and self._words[position][0].startswith(prefix):
+            entry_id = self._words[position][1]
+            if entry_id < 0:
+                skill_ids.add(-1 - entry_id)
+            else:
+                entry_ids.add(entry_id)
+            position += 1
+        return skill_ids, entry_ids
+
+    def complete(self, prefix: str, limit: int = 10) -> Dict[str, List]:
+        """
+        Type-ahead lookup: skill keys with a word starting with the prefix
+        (catalog order) and the best rated courses whose skill or title has
+        such a word
+        """
+        prefix = prefix.lower().strip()
+        if not prefix:
+            return {'skills': [], 'courses': []}
+
+        skill_ids, entry_ids = self._prefix_matches(prefix)
+        for skill_id in skill_ids:
+            entry_ids.update(self._skill_entries[skill_id])
+        return {
+            'skills': [self.skills[skill_id] for skill_id in sorted(skill_ids)[:limit]],
+            'courses': self._rank(entry_ids, limit)
+        }
@@ -1,369 +1,69 @@
 # course_recommender.py
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional
 import requests
 import json
+import os
+import threading
+
+from catalog_snapshot import COURSE_CATALOG_PATH, load_snapshot
+from compact_records import ValuePool
+from course_index import CourseSearchIndex
+from mapped_catalog import MappedCatalog
+from learning_planner import SKILL_DEPENDENCIES, learning_planner
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class CourseRecommender:
-    def __init__(self):
-        self.courses_database = self.load_courses_database()
+    def __init__(self, snapshot_path: Optional[str] = None):
+        """
+        Courses come from a mapped catalog snapshot at `snapshot_path` (or
+        COURSE_SNAPSHOT_PATH) if given, else from the built-in catalog. The
+        catalog and its search index are loaded on first use.
+        """
+        self.snapshot_path = snapshot_path or os.environ.get('COURSE_SNAPSHOT_PATH')
+        self._courses_database = None
+        self._course_index = None
+        self._catalog_lock = threading.Lock()
+    
+    def _load_catalog(self):
+        with self._catalog_lock:
+            if self._courses_database is not None:
+                return
+            if self.snapshot_path:
+                # Read in place from the shared mapping, never copied whole
+                self._courses_database = self.load_courses_database()
+                return
+            # Providers, levels, durations and prices repeat across courses
+            pool = ValuePool()
+            self._courses_database = {
+                pool.intern(skill): [{field: pool.intern(value) for field, value in course.items()}
+                                     for course in courses]
+                for skill, courses in self.load_courses_database().items()
+            }
+    
+    @property
+    def courses_database(self) -> Mapping[str, List[Dict]]:
+        if self._courses_database is None:
+            self._load_catalog()
+        return self._courses_database
     
-    def load_courses_database(self) -> Dict[str, List[Dict]]:
+    @property
+    def course_index(self) -> CourseSearchIndex:
+        if self._course_index is None:
+            courses_database = self.courses_database
+            with self._catalog_lock:
+                if self._course_index is None:
+                    self._course_index = CourseSearchIndex(courses_database)
+        return self._course_index
+    
+    def load_courses_database(self) -> Mapping[str, List[Dict]]:
         """Load comprehensive courses database"""
-        return {
-            'python': [
-                {
-                    'title': 'Python for Everybody Specialization',
-                    'provider': 'Coursera',
-                    'url': 'https://www.coursera.org/specializations/python',
-                    'duration': '8 months',
-                    'level': 'beginner',
-                    'rating': 4.8,
-                    'price': 'Free'
-                },
-                {
-                    'title': 'Complete Python Bootcamp',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/complete-python-bootcamp/',
-                    'duration': '22 hours',
-                    'level': 'beginner',
-                    'rating': 4.6,
-                    'price': '$84.99'
-                },
-                {
-                    'title': 'Python Programming',
-                    'provider': 'edX',
-                    'url': 'https://www.edx.org/course/python-programming',
-                    'duration': '5 weeks',
-                    'level': 'beginner',
-                    'rating': 4.5,
-                    'price': 'Free'
-                }
-            ],
-            'sql': [
-                {
-                    'title': 'SQL for Data Science',
-                    'provider': 'Coursera',
-                    'url': 'https://www.coursera.org/learn/sql-for-data-science',
-                    'duration': '4 weeks',
-                    'level': 'beginner',
-                    'rating': 4.6,
-                    'price': 'Free'
-                },
-                {
-                    'title': 'The Complete SQL Bootcamp',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/the-complete-sql-bootcamp/',
-                    'duration': '9 hours',
-                    'level': 'beginner',
-                    'rating': 4.7,
-                    'price': '$84.99'
-                },
-                {
-                    'title': 'Introduction to SQL',
-                    'provider': 'Khan Academy',
-                    'url': 'https://www.khanacademy.org/computing/computer-programming/sql',
-                    'duration': 'Self-paced',
-                    'level': 'beginner',
-                    'rating': 4.4,
-                    'price': 'Free'
-                }
-            ],
-            'machine learning': [
-                {
-                    'title': 'Machine Learning Course',
-                    'provider': 'Coursera',
-                    'url': 'https://www.coursera.org/learn/machine-learning',
-                    'duration': '11 weeks',
-                    'level': 'intermediate',
-                    'rating': 4.9,
-                    'price': 'Free'
-                },
-                {
-                    'title': 'Machine Learning A-Z',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/machinelearning/',
-                    'duration': '44 hours',
-                    'level': 'intermediate',
-                    'rating': 4.5,
-                    'price': '$84.99'
-                },
-                {
-                    'title': 'Applied Machine Learning',
-                    'provider': 'edX',
-                    'url': 'https://www.edx.org/course/applied-machine-learning',
-                    'duration': '7 weeks',
-                    'level': 'intermediate',
-                    'rating': 4.6,
-                    'price': 'Free'
-                }
-            ],
-            'aws': [
-                {
-                    'title': 'AWS Certified Solutions Architect',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/aws-certified-solutions-architect-associate/',
-                    'duration': '23 hours',
-                    'level': 'intermediate',
-                    'rating': 4.6,
-                    'price': '$84.99'
-                },
-                {
-                    'title': 'AWS Fundamentals',
-                    'provider': 'AWS Training',
-                    'url': 'https://aws.amazon.com/training/digital/',
-                    'duration': 'Self-paced',
-                    'level': 'beginner',
-                    'rating': 4.7,
-                    'price': 'Free'
-                },
-                {
-                    'title': 'AWS Cloud Practitioner',
-                    'provider': 'Coursera',
-                    'url': 'https://www.coursera.org/learn/aws-cloud-practitioner-essentials',
-                    'duration': '6 weeks',
-                    'level': 'beginner',
-                    'rating': 4.5,
-                    'price': 'Free'
-                }
-            ],
-            'excel': [
-                {
-                    'title': 'Excel Skills for Data Analytics',
-                    'provider': 'Coursera',
-                    'url': 'https://www.coursera.org/learn/excel-data-analytics',
-                    'duration': '4 weeks',
-                    'level': 'beginner',
-                    'rating': 4.6,
-                    'price': 'Free'
-                },
-                {
-                    'title': 'Microsoft Excel - Advanced',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/microsoft-excel-advanced/',
-                    'duration': '7 hours',
-                    'level': 'intermediate',
-                    'rating': 4.5,
-                    'price': '$84.99'
-                },
-                {
-                    'title': 'Excel Fundamentals',
-                    'provider': 'Microsoft Learn',
-                    'url': 'https://learn.microsoft.com/en-us/training/paths/excel-fundamentals/',
-                    'duration': 'Self-paced',
-                    'level': 'beginner',
-                    'rating': 4.4,
-                    'price': 'Free'
-                }
-            ],
-            'react': [
-                {
-                    'title': 'React - The Complete Guide',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/react-the-complete-guide-incl-redux/',
-                    'duration': '48 hours',
-                    'level': 'intermediate',
-                    'rating': 4.6,
-                    'price': '$84.99'
-                },
-                {
-                    'title': 'React Basics',
-                    'provider': 'Coursera',
-                    'url': 'https://www.coursera.org/learn/react-basics',
-                    'duration': '4 weeks',
-                    'level': 'beginner',
-                    'rating': 4.5,
-                    'price': 'Free'
-                },
-                {
-                    'title': 'React Tutorial',
-                    'provider': 'freeCodeCamp',
-                    'url': 'https://www.freecodecamp.org/learn/front-end-development-libraries/',
-                    'duration': 'Self-paced',
-                    'level': 'beginner',
-                    'rating': 4.7,
-                    'price': 'Free'
-                }
-            ],
-            'javascript': [
-                {
-                    'title': 'JavaScript Algorithms and Data Structures',
-                    'provider': 'freeCodeCamp',
-                    'url': 'https://www.freecodecamp.org/learn/javascript-algorithms-and-data-structures/',
-                    'duration': 'Self-paced',
-                    'level': 'beginner',
-                    'rating': 4.8,
-                    'price': 'Free'
-                },
-                {
-                    'title': 'The Complete JavaScript Course',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/the-complete-javascript-course/',
-                    'duration': '69 hours',
-                    'level': 'beginner',
-                    'rating': 4.7,
-                    'price': '$84.99'
-                },
-                {
-                    'title': 'JavaScript Programming',
-                    'provider': 'edX',
-                    'url': 'https://www.edx.org/course/javascript-programming',
-                    'duration': '6 weeks',
-                    'level': 'beginner',
-                    'rating': 4.5,
-                    'price': 'Free'
-                }
-            ],
-            'docker': [
-                {
-                    'title': 'Docker Mastery',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/docker-mastery/',
-                    'duration': '19 hours',
-                    'level': 'intermediate',
-                    'rating': 4.6,
-                    'price': '$84.99'
-                },
-                {
-                    'title': 'Docker Fundamentals',
-                    'provider': 'Pluralsight',
-                    'url': 'https://www.pluralsight.com/courses/docker-fundamentals',
-                    'duration': '4 hours',
-                    'level': 'beginner',
-                    'rating': 4.5,
-                    'price': 'Subscription'
-                },
-                {
-                    'title': 'Docker Tutorial',
-                    'provider': 'Docker',
-                    'url': 'https://docs.docker.com/get-started/',
-                    'duration': 'Self-paced',
-                    'level': 'beginner',
-                    'rating': 4.4,
-                    'price': 'Free'
-                }
-            ],
-            'tensorflow': [
-                {
-                    'title': 'TensorFlow Developer Certificate',
-                    'provider': 'Coursera',
-                    'url': 'https://www.coursera.org/professional-certificates/tensorflow-in-practice',
-                    'duration': '4 months',
-                    'level': 'intermediate',
-                    'rating': 4.6,
-                    'price': '$49/month'
-                },
-                {
-                    'title': 'TensorFlow for Deep Learning',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/tensorflow-for-deep-learning/',
-                    'duration': '15 hours',
-                    'level': 'intermediate',
-                    'rating': 4.5,
-                    'price': '$84.99'
-                },
-                {
-                    'title': 'TensorFlow Tutorials',
-                    'provider': 'TensorFlow',
-                    'url': 'https://www.tensorflow.org/tutorials',
-                    'duration': 'Self-paced',
-                    'level': 'intermediate',
-                    'rating': 4.7,
-                    'price': 'Free'
-                }
-            ],
-            'kubernetes': [
-                {
-                    'title': 'Kubernetes for Absolute Beginners',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/kubernetes-for-absolute-beginners/',
-                    'duration': '6 hours',
-                    'level': 'beginner',
-                    'rating': 4.6,
-                    'price': '$84.99'
-                },
-                {
-                    'title': 'Kubernetes Fundamentals',
-                    'provider': 'Linux Foundation',
-                    'url': 'https://training.linuxfoundation.org/training/kubernetes-fundamentals/',
-                    'duration': 'Self-paced',
-                    'level': 'intermediate',
-                    'rating': 4.5,
-                    'price': '$299'
-                },
-                {
-                    'title': 'Kubernetes Tutorial',
-                    'provider': 'Kubernetes',
-                    'url': 'https://kubernetes.io/docs/tutorials/',
-                    'duration': 'Self-paced',
-                    'level': 'intermediate',
-                    'rating': 4.4,
-                    'price': 'Free'
-                }
-            ],
-            'data visualization': [
-                {
-                    'title': 'Data Visualization with Python',
-                    'provider': 'Coursera',
-                    'url': 'https://www.coursera.org/learn/python-for-data-visualization',
-                    'duration': '4 weeks',
-                    'level': 'intermediate',
-                    'rating': 4.6,
-                    'price': 'Free'
-                },
-                {
-                    'title': 'Tableau Fundamentals',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/tableau-fundamentals/',
-                    'duration': '8 hours',
-                    'level': 'beginner',
-                    'rating': 4.5,
-                    'price': '$84.99'
-                },
-                {
-                    'title': 'Data Visualization Basics',
-                    'provider': 'edX',
-                    'url': 'https://www.edx.org/course/data-visualization-basics',
-                    'duration': '6 weeks',
-                    'level': 'beginner',
-                    'rating': 4.4,
-                    'price': 'Free'
-                }
-            ],
-            'statistics': [
-                {
-                    'title': 'Statistics and Probability',
-                    'provider': 'Khan Academy',
-                    'url': 'https://www.khanacademy.org/math/statistics-probability',
-                    'duration': 'Self-paced',
-                    'level': 'beginner',
-                    'rating': 4.7,
-                    'price': 'Free'
-                },
-                {
-                    'title': 'Statistics for Data Science',
-                    'provider': 'Coursera',
-                    'url': 'https://www.coursera.org/learn/statistics-for-data-science',
-                    'duration': '4 weeks',
-                    'level': 'intermediate',
-                    'rating': 4.5,
-                    'price': 'Free'
-                },
-                {
-                    'title': 'Business Statistics',
-                    'provider': 'Udemy',
-                    'url': 'https://www.udemy.com/course/business-statistics/',
-                    'duration': '12 hours',
-                    'level': 'intermediate',
-                    'rating': 4.4,
-                    'price': '$84.99'
-                }
-            ]
-        }
+        if self.snapshot_path:
+            return MappedCatalog(self.snapshot_path)
+        return load_snapshot(COURSE_CATALOG_PATH)
     
     def suggest_courses(self, skill: str) -> str:
         """Get a single course URL for a skill (backwards compatibility)"""
@@ -380,11 +80,14 @@ class CourseRecommender:
         if skill_lower in self.courses_database:
             return self.courses_database[skill_lower][:limit]
         
-        # Partial match
+        # Partial match: skill keys containing the skill or contained in it
+        matched_skills = set(self.course_index.skills_containing(skill_lower))
+        matched_skills.update(self.course_index.skills_within(skill_lower))
         matches = []
-        for db_skill, courses in self.courses_database.items():
-            if skill_lower in db_skill or db_skill in skill_lower:
-                matches.extend(courses)
+        for db_skill in sorted(matched_skills, key=self.course_index.skill_ids.get):
+            matches.extend(self.courses_database[db_skill])
+            if len(matches) >= limit:
+                break
         
         if matches:
             return matches[:limit]
@@ -396,25 +99,10 @@ class CourseRecommender:
         """Get a structured learning path for multiple skills"""
         learning_path = []
         
-        # Define skill dependencies
-        skill_dependencies = {
-            'python': [],
-            'sql': [],
-            'machine learning': ['python', 'statistics'],
-            'tensorflow': ['python', 'machine learning'],
-            'pytorch': ['python', 'machine learning'],
-            'data visualization': ['python'],
-            'react': ['javascript', 'html', 'css'],
-            'docker': ['linux basics'],
-            'kubernetes': ['docker'],
-            'aws': ['linux basics'],
-            'django': ['python'],
-            'flask': ['python']
-        }
-        
-        for skill in skills:
+        # Prerequisites first, following transitive dependencies
+        for skill in learning_planner.order(skills):
             skill_lower = skill.lower()
-            prerequisites = skill_dependencies.get(skill_lower, [])
+            prerequisites = SKILL_DEPENDENCIES.get(skill_lower, [])
             courses = self.get_course_recommendations(skill, 3)
             
             learning_path.append({
@@ -425,9 +113,6 @@ class CourseRecommender:
                 'difficulty': self.estimate_difficulty(skill)
             })
         
-        # Sort by dependencies (skills with fewer dependencies first)
-        learning_path.sort(key=lambda x: len(x['prerequisites']))
-        
         return learning_path
     
     def estimate_learning_time(self, skill: str) -> str:
@@ -522,28 +207,12 @@ class CourseRecommender:
     
     def search_courses(self, query: str) -> List[Dict]:
         """Search for courses across all skills"""
-        results = []
-        query_lower = query.lower()
-        
-        for skill, courses in self.courses_database.items():
-            if query_lower in skill:
-                results.extend(courses)
-            else:
-                # Search in course titles
-                for course in courses:
-                    if query_lower in course['title'].lower():
-                        results.append(course)
-        
-        # Remove duplicates and sort by rating
-        unique_results = []
-        seen_urls = set()
-        
-        for course in results:
-            if course['url'] not in seen_urls:
-                unique_results.append(course)
-                seen_urls.add(course['url'])
-        
-        return sorted(unique_results, key=lambda x: x['rating'], reverse=True)
+        # Courses whose skill or title contains the query, unique by URL and sorted by rating
+        return self.course_index.search(query)
+    
+    def type_ahead(self, prefix: str, limit: int = 10) -> Dict[str, List]:
+        """Skill and course suggestions for a partially typed query"""
+        return self.course_index.complete(prefix, limit)
 
 # Initialize course recommender
 course_recommender = CourseRecommender()
@@ -568,3 +237,7 @@ def get_free_courses(skill: str) -> List[Dict]:
 def search_courses(query: str) -> List[Dict]:
     """Search for courses"""
     return course_recommender.search_courses(query)
+
+def type_ahead(prefix: str, limit: int = 10) -> Dict[str, List]:
+    """Get type-ahead suggestions for courses"""
+    return course_recommender.type_ahead(prefix, limit)
@@ -0,0 +1,186 @@
+# feed_stub_server.py - Local HTTP server for job feeds
+import argparse
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Union
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class _FeedRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        stub = self.server.stub
+        stub.begin_request()
+        try:
+            self._respond(stub)
+        finally:
+            stub.end_request()
+
+    def _respond(self, stub):
+        if stub.delay:
+            time.sleep(stub.delay)
+
+        feed = stub.get_feed(self.path)
+        if feed is None:
+            status = 404
+            self.send_response(status)
+            self.end_headers()
+        elif self._not_modified(feed):
+            status = 304
+            self.send_response(status)
+            self.send_header('ETag', feed['etag'])
+            self.end_headers()
+        else:
+            status = 200
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(feed['body'])))
+            self.send_header('ETag', feed['etag'])
+            self.send_header('Last-Modified', formatdate(feed['modified'], usegmt=True))
+            self.end_headers()
+            self.wfile.write(feed['body'])
+
+        stub.record_request(self.path, status, dict(self.headers))
+
+    def _not_modified(self, feed):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return if_none_match == feed['etag']
+
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return parsedate_to_datetime(if_modified_since).timestamp() >= int(feed['modified'])
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+class StubFeedServer:
+    """
+    Serves JSON job feeds from memory for local development and testing of
+    the feed ingestion.
+
+    Each path maps to a {role: [job, ...]} payload served with an ETag and
+    Last-Modified header, answering conditional requests with 304. Every
+    request is logged with its time, so callers can check concurrency and
+    rate limits, and `max_in_flight` records the most requests served at
+    once. `delay` simulates a slow upstream.
+    """
+    def __init__(self, feeds: Optional[Dict[str, Dict]] = None, host: str = '127.0.0.1', port: int = 0,
+                 delay: float = 0.0):
+        self.delay = delay
+        self.requests: List[Dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._feeds: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        for path, payload in (feeds or {}).items():
+            self.set_feed(path, payload)
+
+        self._server = ThreadingHTTPServer((host, port), _FeedRequestHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def set_feed(self, path: str, payload: Union[Dict, bytes]) -> None:
+        """
+        Publish or replace a feed; a changed payload gets a new ETag. Bytes
+        are served as they are, e.g. to test malformed feeds.
+        """
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+        with self._lock:
+            self._feeds[path] = {
+                'body': body,
+                'etag': '"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+                'modified': time.time()
+            }
+
+    def paths(self) -> List[str]:
+        with self._lock:
+            return list(self._feeds)
+
+    def get_feed(self, path: str) -> Optional[Dict]:
+        with self._lock:
+            return self._feeds.get(path)
+
+    def begin_request(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def end_request(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def record_request(self, path: str, status: int, headers: Dict[str, str]) -> None:
+        with self._lock:
+            self.requests.append({'path': path, 'status': status, 'headers': headers, 'time': time.time()})
+
+    def start(self) -> str:
+        """Serve in a background thread and return the base URL"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+def sample_feeds() -> Dict[str, Dict]:
+    """One feed per role from the built-in job catalog"""
+    from job_scraper import JobScraper
+
+    feeds = {}
+    for role, jobs in JobScraper().load_job_database().items():
+        slug = re.sub(r'[^a-z0-9]+', '-', role.lower()).strip('-')
+        feeds[f"/feeds/{slug}.json"] = {role: jobs}
+    return feeds
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve sample job feeds over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--delay', type=float, default=0.0, help="Seconds to wait before each response")
+    args = parser.parse_args()
+
+    server = StubFeedServer(sample_feeds(), args.host, args.port, args.delay)
+    server.start()
+    for path in server.paths():
+        print(server.url(path))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+if __name__ == '__main__':
+    main()
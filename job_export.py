@@ -0,0 +1,184 @@
+# job_export.py - Streaming export of job search results
+import argparse
+import csv
+import io
+import json
+import logging
+import sys
+import tempfile
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Union
+
+from job_store import ORDER_BY_ID, ORDER_BY_POSTED_DATE
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'parquet')
+DEFAULT_CHUNK_SIZE = 1000
+
+# Posting fields in catalog order; list fields are joined in CSV output
+JOB_COLUMNS = [
+    'company', 'title', 'location', 'link', 'salary', 'experience', 'posted_date', 'description',
+    'requirements', 'company_size', 'job_type', 'remote_option', 'benefits'
+]
+LIST_COLUMNS = {'requirements', 'benefits'}
+LIST_SEPARATOR = '; '
+
+def iter_job_chunks(scraper, filters: Optional[Dict] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    order_by: str = ORDER_BY_ID) -> Iterator[List[Dict]]:
+    """
+    Yield the jobs matching search_jobs_with_filters `filters` in chunks of
+    at most chunk_size, following page cursors so only one chunk is held
+    at a time. No filters exports the whole catalog.
+    """
+    cursor = None
+    while True:
+        page = scraper.search_jobs_with_filters_page(**(filters or {}), page_size=chunk_size,
+                                                     cursor=cursor, order_by=order_by)
+        if page['jobs']:
+            yield page['jobs']
+        cursor = page['next_cursor']
+        if cursor is None:
+            return
+
+def project_job(job: Dict, columns: List[str]) -> Dict:
+    """Keep only the given columns, in order, with missing fields as None"""
+    return {column: job.get(column) for column in columns}
+
+def _csv_value(column, value):
+    if value is None:
+        return ''
+    if column in LIST_COLUMNS and isinstance(value, list):
+        return LIST_SEPARATOR.join(str(item) for item in value)
+    return value
+
+def _write_csv(chunks, output, columns):
+    text_output = io.TextIOWrapper(output, encoding='utf-8', newline='')
+    try:
+        writer = csv.writer(text_output)
+        writer.writerow(columns)
+        rows = 0
+        for jobs in chunks:
+            writer.writerows([_csv_value(column, job.get(column)) for column in columns] for job in jobs)
+            rows += len(jobs)
+        return rows
+    finally:
+        text_output.flush()
+        text_output.detach()
+
+def _write_jsonl(chunks, output, columns):
+    rows = 0
+    for jobs in chunks:
+        lines = [json.dumps(project_job(job, columns), ensure_ascii=False) for job in jobs]
+        output.write(('\n'.join(lines) + '\n').encode('utf-8'))
+        rows += len(jobs)
+    return rows
+
+def _parquet_schema(pa, columns):
+    return pa.schema([
+        (column, pa.list_(pa.string()) if column in LIST_COLUMNS else pa.string())
+        for column in columns
+    ])
+
+def _parquet_value(column, value):
+    if value is None:
+        return None
+    if column in LIST_COLUMNS:
+        return [str(item) for item in value] if isinstance(value, list) else [str(value)]
+    return str(value)
+
+def _write_parquet(chunks, output, columns):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export needs pyarrow. Install with: pip install pyarrow")
+
+    # One row group per chunk, with a fixed schema so chunks always agree
+    schema = _parquet_schema(pa, columns)
+    rows = 0
+    with pq.ParquetWriter(output, schema) as writer:
+        for jobs in chunks:
+            arrays = {column: [_parquet_value(column, job.get(column)) for job in jobs] for column in columns}
+            writer.write_table(pa.table(arrays, schema=schema))
+            rows += len(jobs)
+    return rows
+
+_WRITERS = {'csv': _write_csv, 'jsonl': _write_jsonl, 'parquet': _write_parquet}
+
+def export_jobs(chunks: Iterable[List[Dict]], output: Union[str, BinaryIO], fmt: str = 'csv',
+                columns: Optional[List[str]] = None) -> int:
+    """
+    Write job chunks to a path or binary file object as CSV, JSONL or
+    Parquet, projected onto `columns` (JOB_COLUMNS by default). Each chunk
+    is written before the next is read. Returns the number of rows written.
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown export format: {fmt}. Use one of {', '.join(EXPORT_FORMATS)}")
+    columns = list(columns or JOB_COLUMNS)
+
+    if isinstance(output, str):
+        with open(output, 'wb') as f:
+            return _WRITERS[fmt](chunks, f, columns)
+    return _WRITERS[fmt](chunks, output, columns)
+
+def export_job_search(scraper, output: Union[str, BinaryIO], fmt: str = 'csv',
+                      columns: Optional[List[str]] = None, filters: Optional[Dict] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE, order_by: str = ORDER_BY_ID) -> int:
+    """Stream the results of a filtered job search (or the whole catalog) to output"""
+    return export_jobs(iter_job_chunks(scraper, filters, chunk_size, order_by), output, fmt, columns)
+
+def spool_job_search(scraper, fmt: str = 'csv', columns: Optional[List[str]] = None,
+                     filters: Optional[Dict] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     order_by: str = ORDER_BY_ID) -> io.RawIOBase:
+    """
+    Export a job search to an anonymous temporary file and return it
+    rewound, as a raw file object that st.download_button accepts
+    """
+    raw = tempfile.TemporaryFile(buffering=0)
+    try:
+        output = io.BufferedWriter(raw)
+        export_job_search(scraper, output, fmt, columns, filters, chunk_size, order_by)
+        output.flush()
+        output.detach()
+        raw.seek(0)
+    except BaseException:
+        raw.close()
+        raise
+    return raw
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export job postings as CSV, JSONL or Parquet")
+    parser.add_argument('--output', '-o', default='-', help="Output path, or - for stdout")
+    parser.add_argument('--format', '-f', choices=EXPORT_FORMATS, default='csv')
+    parser.add_argument('--columns', help="Comma-separated columns to export (default: all posting fields)")
+    parser.add_argument('--db-path', help="SQLite job catalog (default: JOB_DB_PATH or the built-in catalog)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--order-by', choices=(ORDER_BY_ID, ORDER_BY_POSTED_DATE), default=ORDER_BY_ID)
+    for name in ('role', 'location', 'experience', 'company-size', 'job-type'):
+        parser.add_argument(f'--{name}')
+    parser.add_argument('--salary-min', type=int, help="Minimum salary in USD per year")
+    parser.add_argument('--salary-max', type=int, help="Maximum salary in USD per year")
+    parser.add_argument('--experience-min', type=float, help="Minimum required experience in years")
+    parser.add_argument('--experience-max', type=float, help="Maximum required experience in years")
+    args = parser.parse_args(argv)
+
+    from job_scraper import JobScraper
+
+    scraper = JobScraper(db_path=args.db_path)
+    filters = {
+        'role': args.role, 'location': args.location, 'experience': args.experience,
+        'salary_min': args.salary_min, 'company_size': args.company_size, 'job_type': args.job_type,
+        'salary_max': args.salary_max, 'experience_min': args.experience_min,
+        'experience_max': args.experience_max
+    }
+    columns = [column.strip() for column in args.columns.split(',')] if args.columns else None
+    output = sys.stdout.buffer if args.output == '-' else args.output
+
+    rows = export_job_search(scraper, output, args.format, columns, filters, args.chunk_size, args.order_by)
+    logger.info(f"Exported {rows} jobs")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+# job_feeds.py - Concurrent job feed ingestion
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_RATE_PER_HOST = 4.0  # Requests per second to any single host
+DEFAULT_TIMEOUT = 15
+
+def posting_key(feed_url: str, job: Dict) -> str:
+    """
+    Stable key for a feed posting: the feed URL plus the posting's id, or
+    its company, title, location and posted date if it has no id
+    """
+    job_key = job.get('id') or '|'.join(str(job.get(field, '')) for field in
+                                        ('company', 'title', 'location', 'posted_date'))
+    return f"{feed_url}#{job_key}"
+
+class HostRateLimiter:
+    """Spaces requests to each host at least 1 / rate_per_host seconds apart"""
+    def __init__(self, rate_per_host: Optional[float] = DEFAULT_RATE_PER_HOST):
+        self.interval = 1.0 / rate_per_host if rate_per_host else 0.0
+        self._next_slot: Dict[str, float] = {}
+
+    async def wait(self, host: str) -> None:
+        if not self.interval:
+            return
+        # Reserve the next free slot for the host, then sleep until it
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+class FeedIngestor:
+    """
+    Refreshes many JSON job feeds concurrently and upserts their postings
+    into a job store.
+
+    A feed returns {role: [job, ...]}, the same shape as the built-in
+    catalog. Requests share one pooled HTTP session of `concurrency`
+    connections and run in worker threads, while the event loop schedules
+    them under per-host rate limits. ETag and Last-Modified validators are
+    remembered per feed and sent back, so unchanged feeds cost a 304.
+    Postings are upserted by posting_key, so only changed postings are
+    rewritten, and postings that drop out of a feed this ingestor has
+    read before are removed. Malformed roles and jobs are skipped, and a
+    feed that fails in any way is reported in its own result without
+    stopping the others.
+    """
+    def __init__(self, job_store, concurrency: int = DEFAULT_CONCURRENCY,
+                 rate_per_host: Optional[float] = DEFAULT_RATE_PER_HOST, timeout: float = DEFAULT_TIMEOUT,
+                 session: Optional[requests.Session] = None):
+        self.job_store = job_store
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.rate_limiter = HostRateLimiter(rate_per_host)
+        self.session = session or self._build_session()
+        # Feed URL -> conditional request headers from its last 200 response
+        self._validators: Dict[str, Dict[str, str]] = {}
+        # Feed URL -> posting keys it returned last time
+        self._feed_keys: Dict[str, Set[str]] = {}
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _fetch(self, url: str, headers: Dict[str, str]) -> requests.Response:
+        # Runs in a worker thread
+        return self.session.get(url, headers=headers, timeout=self.timeout)
+
+    def _remember_validators(self, url: str, response: requests.Response) -> None:
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        self._validators[url] = validators
+
+    def _apply(self, url: str, feed: Dict, record: Dict) -> None:
+        seen = set()
+        for role, jobs in feed.items():
+            if not isinstance(jobs, list):
+                logger.warning(f"Skipping role {role!r} in job feed {url}: expected a list of jobs")
+                record['skipped'] += 1
+                continue
+            for job in jobs:
+                if not isinstance(job, dict):
+                    record['skipped'] += 1
+                    continue
+                key = posting_key(url, job)
+                seen.add(key)
+                previous_id = self.job_store.key_id(key)
+                job_id = self.job_store.upsert_job(role, job, key)
+                if previous_id is None:
+                    record['added'] += 1
+                elif job_id == previous_id:
+                    record['unchanged'] += 1
+                else:
+                    record['updated'] += 1
+
+        for key in self._feed_keys.get(url, set()) - seen:
+            job_id = self.job_store.key_id(key)
+            if job_id is not None:
+                self.job_store.remove_job(job_id)
+                record['removed'] += 1
+        self._feed_keys[url] = seen
+        if record['skipped']:
+            logger.warning(f"Skipped {record['skipped']} malformed entries in job feed {url}")
+
+    async def _refresh_feed(self, url: str, semaphore: asyncio.Semaphore, executor: ThreadPoolExecutor) -> Dict:
+        record = {'url': url, 'status': 'updated', 'http_status': None, 'added': 0, 'updated': 0,
+                  'unchanged': 0, 'removed': 0, 'skipped': 0, 'error': None}
+        started = time.perf_counter()
+        async with semaphore:
+            try:
+                headers = dict(self._validators.get(url, {}))
+                # Take the host's slot only once a connection is free, so
+                # feeds queued behind a full pool do not fire back to back
+                await self.rate_limiter.wait(urlsplit(url).netloc)
+                response = await asyncio.get_running_loop().run_in_executor(executor, self._fetch, url, headers)
+                record['http_status'] = response.status_code
+                if response.status_code == 304:
+                    record['status'] = 'not_modified'
+                else:
+                    response.raise_for_status()
+                    feed = response.json()
+                    if not isinstance(feed, dict):
+                        raise ValueError("Feed must be a JSON object of {role: [job, ...]}")
+                    self._apply(url, feed, record)
+                    self._remember_validators(url, response)
+            except (requests.RequestException, ValueError) as e:
+                logger.error(f"Error refreshing job feed {url}: {str(e)}")
+                record['status'] = 'error'
+                record['error'] = str(e)
+            except Exception as e:
+                # Anything else (e.g. a store error) fails this feed only
+                logger.exception(f"Unexpected error refreshing job feed {url}")
+                record['status'] = 'error'
+                record['error'] = f"{type(e).__name__}: {e}"
+
+        record['elapsed'] = time.perf_counter() - started
+        return record
+
+    async def refresh(self, urls: Iterable[str]) -> List[Dict]:
+        """
+        Refresh every feed concurrently and return one record per feed, in
+        input order, with 'status' ('updated', 'not_modified' or 'error'),
+        'http_status', counts of 'added', 'updated', 'unchanged' and
+        'removed' postings, 'skipped' malformed entries, 'error' and
+        'elapsed'
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return await asyncio.gather(*(self._refresh_feed(url, semaphore, executor) for url in urls))
+
+    def refresh_feeds(self, urls: Iterable[str]) -> List[Dict]:
+        """Blocking wrapper around refresh for code without an event loop"""
+        return asyncio.run(self.refresh(urls))
@@ -0,0 +1,645 @@
+# job_store.py - Indexed job posting storage
+import base64
+import bisect
+import heapq
+import json
+import logging
+import re
+from collections import Counter, defaultdict
+from datetime import date
+from typing import Callable, Collection, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from compact_records import JobRecord, JobRecordCodec
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Salaries are normalized to US dollars per year
+INR_PER_USD = 83.0
+LAKH = 100000
+
+# Result orderings; keyset cursors record the sort key of the last row
+ORDER_BY_ID = 'id'                    # Catalog (insertion) order, key (id,)
+ORDER_BY_POSTED_DATE = 'posted_date'  # Newest first, key (posted_date, id)
+ORDER_BY_SCORE = 'score'              # Best skill match first, key (score, id)
+
+# Experience strings marking a posting as entry level
+ENTRY_LEVEL_KEYWORDS = ['0-1', '1-2', 'entry', 'junior', 'intern']
+
+_NUMBER_PATTERN = re.compile(r'\d+(?:[.,]\d+)*')
+_TERM_PATTERN = re.compile(r'\w+')
+
+def _parse_numbers(text: str) -> List[float]:
+    return [float(number.replace(',', '')) for number in _NUMBER_PATTERN.findall(text)]
+
+def parse_salary_range(salary: str) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Parse a salary string such as '$85,000 - $125,000' or '₹6.5 - 9.5 LPA'
+    into (min, max) US dollars per year, or (None, None) if it has no numbers
+    """
+    if not salary:
+        return None, None
+
+    numbers = _parse_numbers(salary)
+    if not numbers:
+        return None, None
+
+    salary_lower = salary.lower()
+    if '₹' in salary or 'inr' in salary_lower or 'lpa' in salary_lower:
+        multiplier = LAKH if ('lpa' in salary_lower or 'lakh' in salary_lower) else 1
+        numbers = [number * multiplier / INR_PER_USD for number in numbers]
+
+    low = numbers[0]
+    high = numbers[1] if len(numbers) > 1 else numbers[0]
+    return int(round(low)), int(round(high))
+
+def parse_experience_range(experience: str) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Parse an experience string such as '2-4 years' or '5+ years' into
+    (min, max) years; an open-ended range has max None
+    """
+    if not experience:
+        return None, None
+
+    numbers = _parse_numbers(experience)
+    if not numbers:
+        return None, None
+
+    if '+' in experience:
+        return numbers[0], None
+    if len(numbers) > 1:
+        return numbers[0], numbers[1]
+    return numbers[0], numbers[0]
+
+def location_matches(location_mapping: Dict[str, List[str]], location_lower: str, key: str) -> bool:
+    """Whether a lowercased posting location matches a location query, directly or through mapping"""
+    if location_lower in key:
+        return True
+    for mapping_key, locations in location_mapping.items():
+        if location_lower in mapping_key and any(loc.lower() in key for loc in locations):
+            return True
+    return False
+
+def is_remote_job(job: Dict, location_mapping: Dict[str, List[str]]) -> bool:
+    return location_matches(location_mapping, 'remote', job.get('location', '').lower())
+
+def is_entry_level_job(job: Dict) -> bool:
+    experience = job.get('experience', '').lower()
+    return any(keyword in experience for keyword in ENTRY_LEVEL_KEYWORDS)
+
+def text_terms(text: str) -> List[str]:
+    """Lowercased word tokens used for full-text matching"""
+    return _TERM_PATTERN.findall(text.lower())
+
+def job_text(job: Dict) -> Dict[str, str]:
+    """The full-text fields of a posting: title, description and requirements"""
+    return {
+        'title': job.get('title', ''),
+        'description': job.get('description', ''),
+        'requirements': ' '.join(job.get('requirements', []))
+    }
+
+class JobNumbers(NamedTuple):
+    """Numeric columns parsed once when a posting is added"""
+    salary_min: Optional[int]
+    salary_max: Optional[int]
+    experience_min: Optional[float]
+    experience_max: Optional[float]
+
+def parse_job_numbers(job: Dict) -> JobNumbers:
+    salary_min, salary_max = parse_salary_range(job.get('salary', ''))
+    experience_min, experience_max = parse_experience_range(job.get('experience', ''))
+    return JobNumbers(salary_min, salary_max, experience_min, experience_max)
+
+def encode_cursor(order_by: str, key: Sequence) -> str:
+    """Opaque continuation token for the row with sort key `key`"""
+    payload = json.dumps([order_by, list(key)], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str, order_by: str) -> Tuple:
+    """Sort key from a continuation token; raises ValueError if it is invalid"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        cursor_order, key = json.loads(payload)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from e
+    if cursor_order != order_by:
+        raise ValueError(f"Page cursor is for {cursor_order!r} ordering, not {order_by!r}")
+    return tuple(key)
+
+def posted_day(job: Dict) -> str:
+    """
+    A posting's posted_date normalized to 'YYYY-MM-DD', or '' if it is
+    missing or not an ISO date; undated postings sort as the oldest
+    """
+    try:
+        return date.fromisoformat(str(job.get('posted_date', ''))[:10]).isoformat()
+    except ValueError:
+        return ''
+
+def _recency_key(day: str, job_id: int) -> Tuple[int, int]:
+    # Ascending key for newest-first order, ties in id order; undated last
+    return (-date.fromisoformat(day).toordinal() if day else 0, job_id)
+
+def _page(job_ids: List[int], limit: Optional[int], offset: int, start: int = 0) -> List[int]:
+    start += offset
+    if limit is None:
+        return job_ids[start:]
+    return job_ids[start:start + limit]
+
+def _remove_sorted(job_ids: List[int], job_id: int) -> None:
+    position = bisect.bisect_left(job_ids, job_id)
+    if position < len(job_ids) and job_ids[position] == job_id:
+        del job_ids[position]
+
+class _IndexRange:
+    """
+    The job ids in positions [start, end) of a sorted (value, job_id)
+    index, read only when iterated
+    """
+    def __init__(self, index: List[Tuple], start: int, end: int):
+        self.index = index
+        self.start = start
+        self.end = end
+
+    def __len__(self):
+        return max(self.end - self.start, 0)
+
+    def __iter__(self):
+        index = self.index
+        return (index[position][1] for position in range(self.start, self.end))
+
+class _Filter:
+    """
+    One query predicate: a disjunction of posting collections (sets, sorted
+    id lists or lazy index ranges) plus a per-job check, so the planner can
+    estimate its size without materializing it
+    """
+    def __init__(self, postings: List[Collection[int]], contains: Callable[[int], bool], estimate: Optional[int] = None):
+        self.postings = postings
+        self.contains = contains
+        self.estimate = sum(len(ids) for ids in postings) if estimate is None else estimate
+
+    def materialize(self) -> Set[int]:
+        if len(self.postings) == 1:
+            return set(self.postings[0])
+        return set().union(*self.postings)
+
+class InMemoryJobStore:
+    """
+    Job postings indexed at load time for filtered search.
+
+    Every posting gets an integer id in insertion order and is indexed by
+    role, normalized location, company, company size, job type, experience
+    band and the words of its title, description and requirements.
+    Salary and experience are parsed once into numeric JobNumbers, and the
+    salary and experience bounds are kept in sorted indexes for range
+    queries. Queries
+    intersect posting lists, starting from the most selective filter.
+    Market statistics are kept as running counters, so reading them does
+    not touch the postings.
+
+    Postings are held as compact JobRecords, with the parsed numbers, role
+    and recency key in the same slots, and read back as fresh dicts.
+    """
+    def __init__(self, location_mapping: Dict[str, List[str]]):
+        self.location_mapping = location_mapping
+        self._records: Dict[int, JobRecord] = {}
+        self._codec = JobRecordCodec()
+        self._next_id = 0
+        # Live ids in ascending (insertion) order, for O(page) keyset reads
+        self._id_order: List[int] = []
+        # External posting keys (e.g. from job feeds) for upserts
+        self._key_ids: Dict[str, int] = {}
+        self._id_keys: Dict[int, str] = {}
+
+        # Role -> sorted posting ids
+        self._role_index = defaultdict(list)
+        self._location_index = defaultdict(set)
+        self._company_size_index = defaultdict(set)
+        self._job_type_index = defaultdict(set)
+        self._experience_index = defaultdict(set)
+        self._company_index = defaultdict(set)
+        # Full-text term -> posting ids over title, description and requirements
+        self._text_index = defaultdict(set)
+        # Normalized requirement skill -> posting ids
+        self._skill_index = defaultdict(set)
+        # Sorted (salary, job_id) pairs for range queries
+        self._salary_min_index = []
+        self._salary_max_index = []
+        self._experience_min_index = []
+        self._experience_max_index = []
+        # Sorted (-posted day ordinal, job_id) keys, newest first
+        self._recency_index: List[Tuple[int, int]] = []
+
+        # Running market aggregates, updated on every add and remove
+        self._location_counts = Counter()
+        self._company_size_counts = Counter()
+        self._salary_midpoint_total = 0
+        self._salary_count = 0
+        self._remote_ids: Set[int] = set()
+        self._entry_level_ids: List[int] = []
+
+    def __len__(self):
+        return len(self._records)
+
+    def load(self, job_database: Dict[str, List[Dict]]) -> None:
+        """Add every posting from a {role: [job, ...]} mapping"""
+        for role, jobs in job_database.items():
+            for job in jobs:
+                self.add_job(role, job)
+
+    def add_job(self, role: str, job: Dict, key: Optional[str] = None) -> int:
+        """Index a posting and return its id"""
+        job_id = self._next_id
+        self._next_id += 1
+        if key is not None:
+            self._key_ids[key] = job_id
+            self._id_keys[job_id] = key
+
+        record = self._codec.pack(role, job)
+        self._records[job_id] = record
+        # Ids only grow, so appending keeps the id lists sorted
+        self._id_order.append(job_id)
+
+        self._role_index[role].append(job_id)
+        self._location_index[job.get('location', '').lower()].add(job_id)
+        self._company_size_index[job.get('company_size', '').lower()].add(job_id)
+        self._job_type_index[job.get('job_type', '').lower()].add(job_id)
+        self._experience_index[job.get('experience', '').lower()].add(job_id)
+        self._company_index[job.get('company', '').lower()].add(job_id)
+        for term in self._job_terms(job):
+            self._text_index[term].add(job_id)
+
+        requirements = [requirement.lower() for requirement in job.get('requirements', [])]
+        record.requirement_count = len(requirements)
+        for requirement in set(requirements):
+            self._skill_index[requirement].add(job_id)
+
+        # Parsed numbers repeat across postings, so they share pooled objects
+        intern = self._codec.pool.intern
+        numbers = JobNumbers(*map(intern, parse_job_numbers(job)))
+        record.salary_min, record.salary_max, record.experience_min, record.experience_max = numbers
+        if numbers.salary_min is not None:
+            bisect.insort(self._salary_min_index, (numbers.salary_min, job_id))
+            bisect.insort(self._salary_max_index, (numbers.salary_max, job_id))
+        if numbers.experience_min is not None:
+            bisect.insort(self._experience_min_index, (numbers.experience_min, job_id))
+        if numbers.experience_max is not None:
+            bisect.insort(self._experience_max_index, (numbers.experience_max, job_id))
+
+        recency_key = (intern(_recency_key(posted_day(job), job_id)[0]), job_id)
+        record.recency = recency_key[0]
+        bisect.insort(self._recency_index, recency_key)
+
+        self._location_counts[job.get('location', 'Unknown')] += 1
+        self._company_size_counts[job.get('company_size', 'Unknown')] += 1
+        if numbers.salary_min is not None:
+            # Twice the midpoint, so the running total stays an exact integer
+            self._salary_midpoint_total += numbers.salary_min + numbers.salary_max
+            self._salary_count += 1
+        if is_remote_job(job, self.location_mapping):
+            self._remote_ids.add(job_id)
+        if is_entry_level_job(job):
+            self._entry_level_ids.append(job_id)
+
+        return job_id
+
+    def remove_job(self, job_id: int) -> Optional[Dict]:
+        """Drop a posting from the store and all indexes"""
+        record = self._records.pop(job_id, None)
+        if record is None:
+            return None
+        job = self._codec.unpack(record)
+        role = record.role
+        self._codec.release(record)
+        for value in (record.salary_min, record.salary_max, record.experience_min, record.experience_max,
+                      record.recency):
+            self._codec.pool.release(value)
+        key = self._id_keys.pop(job_id, None)
+        if key is not None:
+            del self._key_ids[key]
+
+        _remove_sorted(self._id_order, job_id)
+        _remove_sorted(self._role_index[role], job_id)
+        if not self._role_index[role]:
+            del self._role_index[role]
+        self._discard(self._location_index, job.get('location', '').lower(), job_id)
+        self._discard(self._company_size_index, job.get('company_size', '').lower(), job_id)
+        self._discard(self._job_type_index, job.get('job_type', '').lower(), job_id)
+        self._discard(self._experience_index, job.get('experience', '').lower(), job_id)
+        self._discard(self._company_index, job.get('company', '').lower(), job_id)
+        for term in self._job_terms(job):
+            self._discard(self._text_index, term, job_id)
+
+        for requirement in {requirement.lower() for requirement in job.get('requirements', [])}:
+            self._discard(self._skill_index, requirement, job_id)
+
+        if record.salary_min is not None:
+            del self._salary_min_index[bisect.bisect_left(self._salary_min_index, (record.salary_min, job_id))]
+            del self._salary_max_index[bisect.bisect_left(self._salary_max_index, (record.salary_max, job_id))]
+        if record.experience_min is not None:
+            del self._experience_min_index[bisect.bisect_left(self._experience_min_index,
+                                                              (record.experience_min, job_id))]
+        if record.experience_max is not None:
+            del self._experience_max_index[bisect.bisect_left(self._experience_max_index,
+                                                              (record.experience_max, job_id))]
+
+        del self._recency_index[bisect.bisect_left(self._recency_index, (record.recency, job_id))]
+
+        self._decrement(self._location_counts, job.get('location', 'Unknown'))
+        self._decrement(self._company_size_counts, job.get('company_size', 'Unknown'))
+        if record.salary_min is not None:
+            self._salary_midpoint_total -= record.salary_min + record.salary_max
+            self._salary_count -= 1
+        self._remote_ids.discard(job_id)
+        _remove_sorted(self._entry_level_ids, job_id)
+
+        return job
+
+    def upsert_job(self, role: str, job: Dict, key: str) -> int:
+        """
+        Add a posting identified by an external key, replacing the posting
+        stored under that key if it changed. Returns the posting's id, which
+        is unchanged when the posting is.
+        """
+        job_id = self._key_ids.get(key)
+        if job_id is not None:
+            record = self._records[job_id]
+            if record.role == role and self._codec.unpack(record) == job:
+                return job_id
+            self.remove_job(job_id)
+        return self.add_job(role, job, key)
+
+    def key_id(self, key: str) -> Optional[int]:
+        """Id of the posting stored under an external key"""
+        return self._key_ids.get(key)
+
+    def posted_before(self, day: str) -> List[int]:
+        """Ids of dated postings posted earlier than day (YYYY-MM-DD)"""
+        # Older postings sit between the cutoff and the undated tail
+        start = bisect.bisect_right(self._recency_index, (_recency_key(day, 0)[0], float('inf')))
+        end = bisect.bisect_left(self._recency_index, (0, -1))
+        return sorted(job_id for _, job_id in self._recency_index[start:end])
+
+    @staticmethod
+    def _job_terms(job: Dict) -> Set[str]:
+        terms = set()
+        for text in job_text(job).values():
+            terms.update(text_terms(text))
+        return terms
+
+    @staticmethod
+    def _discard(index, key, job_id):
+        ids = index.get(key)
+        if ids is None:
+            return
+        ids.discard(job_id)
+        if not ids:
+            del index[key]
+
+    @staticmethod
+    def _decrement(counter, key):
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]
+
+    def get(self, job_id: int) -> Optional[Dict]:
+        record = self._records.get(job_id)
+        return None if record is None else self._codec.unpack(record)
+
+    def get_role(self, job_id: int) -> Optional[str]:
+        record = self._records.get(job_id)
+        return None if record is None else record.role
+
+    def get_numbers(self, job_id: int) -> Optional[JobNumbers]:
+        """Parsed salary (USD per year) and experience (years) for a posting"""
+        record = self._records.get(job_id)
+        if record is None:
+            return None
+        return JobNumbers(record.salary_min, record.salary_max, record.experience_min, record.experience_max)
+
+    def job_ids(self, role: Optional[str] = None, limit: Optional[int] = None, offset: int = 0,
+                after: Optional[Tuple] = None) -> List[int]:
+        """
+        Posting ids in insertion order, optionally for one role. `after` is
+        an ORDER_BY_ID cursor key; only ids past it are returned.
+        """
+        job_ids = self._id_order if role is None else self._role_index.get(role, [])
+        start = bisect.bisect_right(job_ids, after[0]) if after else 0
+        return _page(job_ids, limit, offset, start)
+
+    def _first_ordered(self, job_ids: Iterable[int], order_by: str, after: Optional[Tuple],
+                       count: Optional[int]) -> List[int]:
+        # The first `count` (or all) of job_ids in result order past the cursor
+        if order_by == ORDER_BY_POSTED_DATE:
+            records = self._records
+            keys = ((records[job_id].recency, job_id) for job_id in job_ids)
+            if after:
+                after_key = _recency_key(*after)
+                keys = (key for key in keys if key > after_key)
+        else:
+            keys = (job_id for job_id in job_ids if job_id > after[0]) if after else job_ids
+        ordered = sorted(keys) if count is None else heapq.nsmallest(count, keys)
+        return ordered if order_by != ORDER_BY_POSTED_DATE else [job_id for _, job_id in ordered]
+
+    def trending_ids(self, limit: Optional[int] = None, offset: int = 0,
+                     after: Optional[Tuple] = None) -> List[int]:
+        """
+        Posting ids, most recently posted first, past an ORDER_BY_POSTED_DATE
+        cursor key; reads only the requested slice of the recency index
+        """
+        start = bisect.bisect_right(self._recency_index, _recency_key(*after)) if after else 0
+        return [job_id for _, job_id in _page(self._recency_index, limit, offset, start)]
+
+    def posted_since(self, day: str, limit: Optional[int] = None, offset: int = 0,
+                     after: Optional[Tuple] = None) -> List[int]:
+        """Ids of postings posted on or after day (YYYY-MM-DD), newest first"""
+        end = bisect.bisect_right(self._recency_index, (_recency_key(day, 0)[0], float('inf')))
+        start = bisect.bisect_right(self._recency_index, _recency_key(*after)) if after else 0
+        start = min(start + offset, end)
+        stop = end if limit is None else min(end, start + limit)
+        return [job_id for _, job_id in self._recency_index[start:stop]]
+
+    def entry_level_ids(self, limit: Optional[int] = None, offset: int = 0,
+                        after: Optional[Tuple] = None) -> List[int]:
+        """Ids of entry-level postings in insertion order"""
+        start = bisect.bisect_right(self._entry_level_ids, after[0]) if after else 0
+        return _page(self._entry_level_ids, limit, offset, start)
+
+    def company_ids(self, company_name: str, limit: Optional[int] = None, offset: int = 0,
+                    order_by: str = ORDER_BY_ID, after: Optional[Tuple] = None) -> List[int]:
+        """Ids of postings whose company contains company_name"""
+        return self.search(company=company_name, limit=limit, offset=offset, order_by=order_by, after=after)
+
+    def jobs(self, job_ids: Iterable[int]) -> List[Dict]:
+        unpack = self._codec.unpack
+        return [unpack(self._records[job_id]) for job_id in job_ids]
+
+    def roles(self) -> List[str]:
+        return list(self._role_index)
+
+    def market_stats(self) -> Dict:
+        """Aggregates over the current postings, read from running counters"""
+        return {
+            'total_jobs': len(self._records),
+            'location_distribution': dict(self._location_counts),
+            'company_size_distribution': dict(self._company_size_counts),
+            'average_salary': self._salary_midpoint_total / (2 * self._salary_count) if self._salary_count else 0,
+            'remote_jobs': len(self._remote_ids),
+            'entry_level_jobs': len(self._entry_level_ids)
+        }
+
+    def _substring_filter(self, index, value: str) -> _Filter:
+        # Match against the distinct indexed values, not against postings
+        value = value.lower()
+        keys = {key for key in index if value in key}
+        return _Filter([index[key] for key in keys], lambda job_id: any(job_id in index[key] for key in keys))
+
+    def _location_filter(self, location: str) -> _Filter:
+        location_lower = location.lower()
+        keys = {key for key in self._location_index if location_matches(self.location_mapping, location_lower, key)}
+        index = self._location_index
+        return _Filter([index[key] for key in keys], lambda job_id: any(job_id in index[key] for key in keys))
+
+    def _at_least_filter(self, index: List[Tuple], field: str, minimum: float) -> _Filter:
+        # Postings whose parsed `field` is at least minimum, from its sorted index
+        start = bisect.bisect_left(index, (minimum, -1))
+        records = self._records
+
+        def contains(job_id):
+            value = getattr(records[job_id], field)
+            return value is not None and value >= minimum
+
+        return _Filter([_IndexRange(index, start, len(index))], contains)
+
+    def _at_most_filter(self, index: List[Tuple], field: str, maximum: float) -> _Filter:
+        # Postings whose parsed `field` is at most maximum, from its sorted index
+        end = bisect.bisect_right(index, (maximum, float('inf')))
+        records = self._records
+
+        def contains(job_id):
+            value = getattr(records[job_id], field)
+            return value is not None and value <= maximum
+
+        return _Filter([_IndexRange(index, 0, end)], contains)
+
+    def _text_filter(self, text: str) -> List[_Filter]:
+        # One filter per query term; a posting must contain every term
+        filters = []
+        for term in set(text_terms(text)):
+            ids = self._text_index.get(term, set())
+            filters.append(_Filter([ids], ids.__contains__))
+        return filters
+
+    def search(self, role: str = None, location: str = None, experience: str = None,
+               salary_min: int = None, company_size: str = None, job_type: str = None,
+               salary_max: int = None, text: str = None, limit: Optional[int] = None,
+               offset: int = 0, company: str = None, order_by: str = ORDER_BY_ID,
+               after: Optional[Tuple] = None, experience_min: float = None,
+               experience_max: float = None) -> List[int]:
+        """
+        Ids of postings matching every given filter, in insertion order or
+        newest first (ORDER_BY_POSTED_DATE), past the `after` cursor key.
+        Salary bounds are in US dollars per year. experience_min and
+        experience_max are years, compared with the parsed lower and upper
+        bound of each posting's range; open-ended ranges ('5+ years') have
+        no upper bound and never match experience_max. `text` must match
+        every word somewhere in the title, description or requirements.
+        """
+        filters = []
+        role_filter = None
+        if role:
+            role_filter = _Filter([self._role_index.get(role, [])], lambda job_id: self._records[job_id].role == role)
+            filters.append(role_filter)
+        if location:
+            filters.append(self._location_filter(location))
+        if experience:
+            filters.append(self._substring_filter(self._experience_index, experience))
+        if salary_min:
+            filters.append(self._at_least_filter(self._salary_min_index, 'salary_min', salary_min))
+        if salary_max:
+            filters.append(self._at_most_filter(self._salary_max_index, 'salary_max', salary_max))
+        if experience_min is not None:
+            filters.append(self._at_least_filter(self._experience_min_index, 'experience_min', experience_min))
+        if experience_max is not None:
+            filters.append(self._at_most_filter(self._experience_max_index, 'experience_max', experience_max))
+        if company_size:
+            filters.append(self._substring_filter(self._company_size_index, company_size))
+        if job_type:
+            filters.append(self._substring_filter(self._job_type_index, job_type))
+        if company:
+            filters.append(self._substring_filter(self._company_index, company))
+        if text:
+            filters.extend(self._text_filter(text))
+
+        if not filters:
+            if order_by == ORDER_BY_POSTED_DATE:
+                return self.trending_ids(limit, offset, after)
+            return self.job_ids(limit=limit, offset=offset, after=after)
+
+        filters.sort(key=lambda f: f.estimate)
+        if filters[0].estimate == 0:
+            return []
+        count = None if limit is None else offset + limit
+
+        # The postings in result order: the recency index, or the id list of
+        # the role (which then needs no probing) or of the whole store
+        if order_by == ORDER_BY_POSTED_DATE:
+            ordered = self._recency_index
+            start = bisect.bisect_right(ordered, _recency_key(*after)) if after else 0
+        else:
+            ordered = self._role_index.get(role, []) if role else self._id_order
+            start = bisect.bisect_right(ordered, after[0]) if after else 0
+
+        # Walk the ordered postings from the cursor and stop once the page is
+        # full, so a page costs O(page) when matches are dense. The walk's
+        # probes are capped at the size of the most selective filter; past
+        # that, collecting its postings is the cheaper way to the page.
+        if count is not None and count < filters[0].estimate:
+            keyed = order_by == ORDER_BY_POSTED_DATE
+            probes = [f.contains for f in filters if keyed or f is not role_filter]
+            matches_all = probes[0] if len(probes) == 1 else lambda job_id: all(p(job_id) for p in probes)
+            end = min(len(ordered), start + filters[0].estimate // max(len(probes), 1))
+            matches = []
+            for position in range(start, end):
+                job_id = ordered[position][1] if keyed else ordered[position]
+                if matches_all(job_id):
+                    matches.append(job_id)
+                    if len(matches) == count:
+                        return matches[offset:]
+            if end == len(ordered):
+                return matches[offset:]
+
+        candidates = filters[0].materialize()
+        for other in filters[1:]:
+            candidates = {job_id for job_id in candidates if other.contains(job_id)}
+            if not candidates:
+                return []
+        return self._first_ordered(candidates, order_by, after, count)[offset:]
+
+    def scored_jobs_for_skills(self, skills: Iterable[str], limit: int = 10,
+                               after: Optional[Tuple] = None) -> List[Tuple[int, float]]:
+        """
+        (id, score) for the postings whose requirements best match the given
+        skills, scored as matched distinct skills / number of requirements
+        and past the `after` (score, id) cursor key. Only postings sharing at
+        least one skill are scored, and a bounded heap picks the top
+        `limit`; ties keep insertion order.
+        """
+        match_counts = defaultdict(int)
+        for skill in {skill.lower() for skill in skills}:
+            for job_id in self._skill_index.get(skill, ()):
+                match_counts[job_id] += 1
+
+        records = self._records
+        scored = ((-count / records[job_id].requirement_count, job_id) for job_id, count in match_counts.items())
+        if after:
+            after_key = (-after[0], after[1])
+            scored = (key for key in scored if key > after_key)
+        return [(job_id, -score) for score, job_id in heapq.nsmallest(limit, scored)]
+
+    def top_jobs_for_skills(self, skills: Iterable[str], limit: int = 10) -> List[int]:
+        """Ids of the postings whose requirements best match the given skills"""
+        return [job_id for job_id, _ in self.scored_jobs_for_skills(skills, limit)]
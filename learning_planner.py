@@ -0,0 +1,271 @@
+# learning_planner.py - Dependency-aware learning plans
+import copy
+import heapq
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Skill -> skills that should be learned before it
+SKILL_DEPENDENCIES = {
+    'python': [],
+    'sql': [],
+    'machine learning': ['python', 'statistics'],
+    'tensorflow': ['python', 'machine learning'],
+    'pytorch': ['python', 'machine learning'],
+    'data visualization': ['python'],
+    'react': ['javascript', 'html', 'css'],
+    'docker': ['linux basics'],
+    'kubernetes': ['docker'],
+    'aws': ['linux basics'],
+    'django': ['python'],
+    'flask': ['python']
+}
+
+# Priority, study time and difficulty used when scheduling a skill
+SKILL_PLANNING = {
+    'python': {'priority': 'high', 'weeks': 8, 'difficulty': 'medium'},
+    'sql': {'priority': 'high', 'weeks': 6, 'difficulty': 'medium'},
+    'machine learning': {'priority': 'high', 'weeks': 12, 'difficulty': 'hard'},
+    'javascript': {'priority': 'high', 'weeks': 6, 'difficulty': 'medium'},
+    'react': {'priority': 'medium', 'weeks': 8, 'difficulty': 'medium'},
+    'docker': {'priority': 'medium', 'weeks': 4, 'difficulty': 'easy'},
+    'aws': {'priority': 'medium', 'weeks': 6, 'difficulty': 'medium'},
+    'kubernetes': {'priority': 'low', 'weeks': 8, 'difficulty': 'hard'},
+    'deep learning': {'priority': 'low', 'weeks': 16, 'difficulty': 'hard'},
+}
+DEFAULT_SKILL_PLANNING = {'priority': 'medium', 'weeks': 4, 'difficulty': 'medium'}
+
+PRIORITY_WEIGHTS = {'high': 3, 'medium': 2, 'low': 1}
+
+# Above this many skills the exact search gives way to first-fit packing
+MAX_EXACT_SKILLS = 20
+DEFAULT_MAX_CACHED_PLANS = 256
+
+class LearningPlanner:
+    """
+    Orders and schedules skills over a prerequisite DAG.
+
+    Skills are ordered so that every skill comes after all of its
+    transitive prerequisites in the same request, with higher priority
+    skills first where the order is free. A plan packs skills one after
+    another into a budget of weeks, choosing the prerequisite-closed set
+    with the highest total priority (then the fewest weeks) by branch and
+    bound. Plans are cached per (skill set, budget).
+    """
+    def __init__(self, dependencies: Optional[Dict[str, List[str]]] = None,
+                 planning: Optional[Dict[str, Dict]] = None, max_cached_plans: int = DEFAULT_MAX_CACHED_PLANS):
+        self.dependencies = {
+            skill.lower(): [prerequisite.lower() for prerequisite in prerequisites]
+            for skill, prerequisites in (SKILL_DEPENDENCIES if dependencies is None else dependencies).items()
+        }
+        self.planning = {skill.lower(): info for skill, info in
+                         (SKILL_PLANNING if planning is None else planning).items()}
+        self.max_cached_plans = max_cached_plans
+        self._ancestors: Dict[str, Set[str]] = {}
+        self._plans = OrderedDict()
+        self._lock = threading.Lock()
+
+        for skill in self.dependencies:
+            self.prerequisites(skill)
+
+    def prerequisites(self, skill: str) -> Set[str]:
+        """All transitive prerequisites of a skill; raises ValueError on a cycle"""
+        skill = skill.lower()
+        if skill in self._ancestors:
+            return self._ancestors[skill]
+
+        # Iterative depth-first walk so long chains cannot hit the recursion limit
+        visiting = {skill}
+        stack = [(skill, iter(self.dependencies.get(skill, [])))]
+        while stack:
+            current, prerequisites = stack[-1]
+            prerequisite = next(prerequisites, None)
+            if prerequisite is None:
+                ancestors = set()
+                for direct in self.dependencies.get(current, []):
+                    ancestors.add(direct)
+                    ancestors |= self._ancestors[direct]
+                self._ancestors[current] = ancestors
+                visiting.discard(current)
+                stack.pop()
+            elif prerequisite in visiting:
+                raise ValueError(f"Skill dependencies form a cycle through '{prerequisite}'")
+            elif prerequisite not in self._ancestors:
+                visiting.add(prerequisite)
+                stack.append((prerequisite, iter(self.dependencies.get(prerequisite, []))))
+        return self._ancestors[skill]
+
+    def skill_planning(self, skill: str) -> Dict:
+        return self.planning.get(skill.lower(), DEFAULT_SKILL_PLANNING)
+
+    def _weight(self, skill: str) -> int:
+        return PRIORITY_WEIGHTS.get(self.skill_planning(skill)['priority'], 1)
+
+    def order(self, skills: Iterable[str]) -> List[str]:
+        """
+        Skills in prerequisite order, case-insensitively unique; ties go to
+        the higher priority skill, then to input order
+        """
+        unique = OrderedDict()
+        for skill in skills:
+            unique.setdefault(skill.lower(), skill)
+        names = list(unique)
+
+        # Edges come from transitive prerequisites, so a chain through a
+        # skill outside the request still orders the skills inside it
+        blockers = {name: self.prerequisites(name) & unique.keys() for name in names}
+        dependents = {name: [] for name in names}
+        for name, prerequisites in blockers.items():
+            for prerequisite in prerequisites:
+                dependents[prerequisite].append(name)
+
+        remaining = {name: len(prerequisites) for name, prerequisites in blockers.items()}
+        ready = [(-self._weight(name), index, name) for index, name in enumerate(names) if not remaining[name]]
+        heapq.heapify(ready)
+        positions = {name: index for index, name in enumerate(names)}
+        ordered = []
+        while ready:
+            _, _, name = heapq.heappop(ready)
+            ordered.append(unique[name])
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    heapq.heappush(ready, (-self._weight(dependent), positions[dependent], dependent))
+        return ordered
+
+    def _select(self, ordered: List[str], budget_weeks: int) -> Set[str]:
+        # Prerequisite-closed subset of ordered skills fitting the budget with
+        # the highest total weight, then the fewest weeks
+        names = [skill.lower() for skill in ordered]
+        weeks = [self.skill_planning(name)['weeks'] for name in names]
+        weights = [self._weight(name) for name in names]
+        blockers = [[names.index(prerequisite) for prerequisite in self.prerequisites(name) if prerequisite in names]
+                    for name in names]
+
+        if len(names) > MAX_EXACT_SKILLS:
+            chosen, used = set(), 0
+            for index in range(len(names)):
+                if used + weeks[index] <= budget_weeks and all(blocker in chosen for blocker in blockers[index]):
+                    chosen.add(index)
+                    used += weeks[index]
+            return {names[index] for index in chosen}
+
+        # Skill indexes by weight per week, for the fractional knapsack bound
+        by_density = sorted(range(len(names)), key=lambda index: -weights[index] / max(weeks[index], 1e-9))
+        best = {'value': -1, 'weeks': 0, 'chosen': ()}
+        chosen = []
+
+        def bound(position, weeks_left):
+            value = 0.0
+            for index in by_density:
+                if index < position:
+                    continue
+                if weeks[index] <= weeks_left:
+                    value += weights[index]
+                    weeks_left -= weeks[index]
+                else:
+                    return value + weights[index] * weeks_left / weeks[index]
+            return value
+
+        def weeks_needed(position, value_needed):
+            # Fewest weeks that could add value_needed, again fractionally
+            needed = 0.0
+            for index in by_density:
+                if index < position:
+                    continue
+                if weights[index] >= value_needed:
+                    return needed + weeks[index] * value_needed / weights[index]
+                value_needed -= weights[index]
+                needed += weeks[index]
+            return float('inf')
+
+        def search(position, value, used):
+            if value > best['value'] or (value == best['value'] and used < best['weeks']):
+                best.update(value=value, weeks=used, chosen=tuple(chosen))
+            if position == len(names):
+                return
+            # Weights are whole numbers, so the bound can be floored
+            reachable = value + int(bound(position, budget_weeks - used))
+            if reachable < best['value']:
+                return
+            if reachable == best['value'] and used + weeks_needed(position, best['value'] - value) >= best['weeks']:
+                return
+
+            selected = set(chosen)
+            if used + weeks[position] <= budget_weeks and all(blocker in selected for blocker in blockers[position]):
+                chosen.append(position)
+                search(position + 1, value + weights[position], used + weeks[position])
+                chosen.pop()
+            search(position + 1, value, used)
+
+        search(0, 0, 0)
+        return {names[index] for index in best['chosen']}
+
+    def _build_plan(self, skills: List[str], budget_weeks: int) -> Dict:
+        ordered = self.order(sorted(skills, key=lambda skill: (skill.lower(), skill)))
+        selected = self._select(ordered, budget_weeks)
+
+        plan = []
+        total_weeks = 0
+        for skill in ordered:
+            if skill.lower() not in selected:
+                continue
+            info = self.skill_planning(skill)
+            plan.append({
+                'skill': skill,
+                'priority': info['priority'],
+                'duration_weeks': info['weeks'],
+                'difficulty': info['difficulty'],
+                'start_week': total_weeks + 1,
+                'end_week': total_weeks + info['weeks']
+            })
+            total_weeks += info['weeks']
+
+        return {
+            'total_duration_weeks': total_weeks,
+            'plan': plan,
+            'deferred': [skill for skill in ordered if skill.lower() not in selected],
+            'completion_rate': f"{len(plan)}/{len(ordered)} skills"
+        }
+
+    def plan(self, skills: Iterable[str], budget_weeks: int) -> Dict:
+        """
+        Schedule skills back to back within budget_weeks. Returns
+        'total_duration_weeks', 'plan' (skill, priority, duration_weeks,
+        difficulty, start_week, end_week), 'deferred' skills that did not
+        fit and 'completion_rate'.
+        """
+        skills = list(skills)
+        key = (frozenset(skills), budget_weeks)
+        with self._lock:
+            cached = self._plans.get(key)
+            if cached is not None:
+                self._plans.move_to_end(key)
+                return copy.deepcopy(cached)
+
+        result = self._build_plan(skills, budget_weeks)
+        with self._lock:
+            self._plans[key] = result
+            while len(self._plans) > self.max_cached_plans:
+                self._plans.popitem(last=False)
+        return copy.deepcopy(result)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+# Shared planner over the built-in skill graph
+learning_planner = LearningPlanner()
+
+def order_skills(skills: Iterable[str]) -> List[str]:
+    """Order skills so prerequisites come first"""
+    return learning_planner.order(skills)
+
+def plan_learning(skills: Iterable[str], budget_weeks: int) -> Dict:
+    """Schedule skills into a budget of weeks"""
+    return learning_planner.plan(skills, budget_weeks)
@@ -0,0 +1,226 @@
+# mapped_catalog.py - Read-only memory-mapped catalog snapshots
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MAGIC = b'CCMAPCAT'
+VERSION = 1
+
+# magic, version, string count, group count, record count, then the offsets
+# of the string, group and record sections
+_HEADER = struct.Struct('<8sIIIIQQQ')
+_OFFSET = struct.Struct('<Q')
+_OFFSET_PAIR = struct.Struct('<QQ')
+_GROUP = struct.Struct('<III')  # name string id, first record, record count
+_COUNT = struct.Struct('<I')
+_TAG = struct.Struct('<B')
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+
+# Value tags; strings, dict keys and oversized ints refer to the string pool
+TAG_NONE, TAG_STR, TAG_INT, TAG_FLOAT, TAG_TRUE, TAG_FALSE, TAG_LIST, TAG_DICT, TAG_BIGINT = range(9)
+
+class _StringPoolWriter:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.strings: List[bytes] = []
+
+    def id(self, value: str) -> int:
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.ids[value] = string_id
+            self.strings.append(value.encode('utf-8'))
+        return string_id
+
+def _encode_value(value: Any, pool: _StringPoolWriter, out: bytearray) -> None:
+    if value is None:
+        out += _TAG.pack(TAG_NONE)
+    elif value is True:
+        out += _TAG.pack(TAG_TRUE)
+    elif value is False:
+        out += _TAG.pack(TAG_FALSE)
+    elif isinstance(value, str):
+        out += _TAG.pack(TAG_STR) + _COUNT.pack(pool.id(value))
+    elif isinstance(value, int):
+        if -2 ** 63 <= value < 2 ** 63:
+            out += _TAG.pack(TAG_INT) + _INT.pack(value)
+        else:
+            out += _TAG.pack(TAG_BIGINT) + _COUNT.pack(pool.id(str(value)))
+    elif isinstance(value, float):
+        out += _TAG.pack(TAG_FLOAT) + _FLOAT.pack(value)
+    elif isinstance(value, (list, tuple)):
+        out += _TAG.pack(TAG_LIST) + _COUNT.pack(len(value))
+        for item in value:
+            _encode_value(item, pool, out)
+    elif isinstance(value, dict):
+        out += _TAG.pack(TAG_DICT) + _COUNT.pack(len(value))
+        for key, item in value.items():
+            out += _COUNT.pack(pool.id(str(key)))
+            _encode_value(item, pool, out)
+    else:
+        raise TypeError(f"Cannot store {type(value).__name__} values in a mapped catalog")
+
+def write_mapped_catalog(path: str, catalog: Dict[str, List[Dict]]) -> int:
+    """
+    Write a {group: [record, ...]} catalog as a mapped snapshot and return
+    its size. Records hold JSON-like values. The file is replaced
+    atomically, so processes that have the old snapshot mapped keep
+    reading it until they reopen.
+    """
+    pool = _StringPoolWriter()
+    groups = []
+    record_offsets = [0]
+    records = bytearray()
+    for name, group_records in catalog.items():
+        groups.append((pool.id(name), len(record_offsets) - 1, len(group_records)))
+        for record in group_records:
+            _encode_value(record, pool, records)
+            record_offsets.append(len(records))
+
+    string_offsets = [0]
+    for encoded in pool.strings:
+        string_offsets.append(string_offsets[-1] + len(encoded))
+
+    strings_pos = _HEADER.size
+    groups_pos = strings_pos + _OFFSET.size * len(string_offsets) + string_offsets[-1]
+    records_pos = groups_pos + _GROUP.size * len(groups)
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(pool.strings), len(groups), len(record_offsets) - 1,
+                             strings_pos, groups_pos, records_pos))
+        f.write(b''.join(_OFFSET.pack(offset) for offset in string_offsets))
+        f.write(b''.join(pool.strings))
+        f.write(b''.join(_GROUP.pack(*group) for group in groups))
+        f.write(b''.join(_OFFSET.pack(offset) for offset in record_offsets))
+        f.write(records)
+        size = f.tell()
+    os.replace(temp_path, path)
+    return size
+
+class MappedCatalog(Mapping):
+    """
+    A catalog snapshot opened with mmap, read as {group: [record, ...]}.
+
+    Opening reads only the header and the group names, so it costs the
+    same for any catalog size. Records are decoded from the mapped pages
+    when they are looked up. The pages live in the OS page cache, so
+    every process that maps the same file shares one copy.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        try:
+            (magic, version, self._string_count, group_count, self._record_count, strings_pos, groups_pos,
+             records_pos) = _HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            magic, version = None, None
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} mapped catalog")
+
+        self._string_offsets = strings_pos
+        self._string_data = strings_pos + _OFFSET.size * (self._string_count + 1)
+        self._record_offsets = records_pos
+        self._record_data = records_pos + _OFFSET.size * (self._record_count + 1)
+        # Dict keys repeat in every record, so they are decoded once
+        self._keys: Dict[int, str] = {}
+
+        self._groups: Dict[str, range] = {}
+        for position in range(group_count):
+            name_id, first, count = _GROUP.unpack_from(self._map, groups_pos + _GROUP.size * position)
+            self._groups[self._string(name_id)] = range(first, first + count)
+
+    def close(self) -> None:
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _string(self, string_id: int) -> str:
+        start, end = _OFFSET_PAIR.unpack_from(self._map, self._string_offsets + _OFFSET.size * string_id)
+        return str(self._view[self._string_data + start:self._string_data + end], 'utf-8')
+
+    def _key(self, string_id: int) -> str:
+        key = self._keys.get(string_id)
+        if key is None:
+            key = self._keys[string_id] = self._string(string_id)
+        return key
+
+    def _decode(self, position: int):
+        # Returns (value, position after it)
+        tag = self._map[position]
+        position += 1
+        if tag == TAG_STR:
+            return self._string(_COUNT.unpack_from(self._map, position)[0]), position + _COUNT.size
+        if tag == TAG_INT:
+            return _INT.unpack_from(self._map, position)[0], position + _INT.size
+        if tag == TAG_FLOAT:
+            return _FLOAT.unpack_from(self._map, position)[0], position + _FLOAT.size
+        if tag == TAG_NONE:
+            return None, position
+        if tag == TAG_TRUE:
+            return True, position
+        if tag == TAG_FALSE:
+            return False, position
+        if tag == TAG_LIST:
+            count = _COUNT.unpack_from(self._map, position)[0]
+            position += _COUNT.size
+            items = []
+            for _ in range(count):
+                item, position = self._decode(position)
+                items.append(item)
+            return items, position
+        if tag == TAG_DICT:
+            count = _COUNT.unpack_from(self._map, position)[0]
+            position += _COUNT.size
+            value = {}
+            for _ in range(count):
+                key = self._key(_COUNT.unpack_from(self._map, position)[0])
+                value[key], position = self._decode(position + _COUNT.size)
+            return value, position
+        if tag == TAG_BIGINT:
+            return int(self._string(_COUNT.unpack_from(self._map, position)[0])), position + _COUNT.size
+        raise ValueError(f"Corrupt mapped catalog {self.path}: unknown tag {tag}")
+
+    @property
+    def record_count(self) -> int:
+        return self._record_count
+
+    def record(self, record_id: int) -> Any:
+        """Decode one record by its position in the snapshot"""
+        if not 0 <= record_id < self._record_count:
+            raise IndexError(record_id)
+        start = _OFFSET.unpack_from(self._map, self._record_offsets + _OFFSET.size * record_id)[0]
+        return self._decode(self._record_data + start)[0]
+
+    def group_record(self, group: str, position: int) -> Any:
+        """Decode one record of a group without decoding the rest"""
+        return self.record(self._groups[group][position])
+
+    def __getitem__(self, group: str) -> List:
+        return [self.record(record_id) for record_id in self._groups[group]]
+
+    def __contains__(self, group) -> bool:
+        return group in self._groups
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._groups)
+
+    def __len__(self) -> int:
+        return len(self._groups)
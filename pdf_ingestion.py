@@ -0,0 +1,124 @@
+# pdf_ingestion.py - Headless parallel PDF resume ingestion
+import logging
+import os
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+from resume_parser import EmptyPDFTextError, extract_pdf_text
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 60
+
+class PDFTimeoutError(BaseException):
+    """
+    Raised inside a worker when a single file exceeds its time budget.
+    Derives from BaseException so the per-page `except Exception` handlers
+    in the extractor cannot swallow it.
+    """
+
+def _raise_timeout(signum, frame):
+    raise PDFTimeoutError("PDF extraction timed out")
+
+def iter_pdf_paths(source: Union[str, Iterable[str]], recursive: bool = True) -> Iterator[str]:
+    """
+    Yield PDF paths from a directory (sorted, optionally recursive) or pass
+    through an iterable of paths unchanged
+    """
+    if isinstance(source, (str, os.PathLike)) and os.path.isdir(source):
+        if recursive:
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith('.pdf'):
+                        yield os.path.join(root, name)
+        else:
+            for name in sorted(os.listdir(source)):
+                path = os.path.join(source, name)
+                if name.lower().endswith('.pdf') and os.path.isfile(path):
+                    yield path
+    elif isinstance(source, (str, os.PathLike)):
+        yield str(source)
+    else:
+        yield from source
+
+def extract_pdf_file(path: str, timeout: Optional[float] = DEFAULT_TIMEOUT,
+                     extract_options: Optional[Dict] = None) -> Dict:
+    """
+    Extract text from one PDF file and return a result record instead of
+    raising. Runs in worker processes; the timeout is enforced with SIGALRM
+    where the platform supports it. extract_options are passed through to
+    extract_pdf_text (e.g. max_pages, max_chars).
+    """
+    started = time.perf_counter()
+    record = {'path': path, 'status': 'ok', 'text': '', 'error': None}
+
+    use_alarm = bool(timeout) and hasattr(signal, 'setitimer')
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        with open(path, 'rb') as f:
+            file_content = f.read()
+        record['text'] = extract_pdf_text(file_content, **(extract_options or {}))
+    except PDFTimeoutError as e:
+        record['status'] = 'timeout'
+        record['error'] = str(e)
+    except EmptyPDFTextError as e:
+        record['status'] = 'empty'
+        record['error'] = str(e)
+    except Exception as e:
+        record['status'] = 'error'
+        record['error'] = str(e)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    record['elapsed'] = time.perf_counter() - started
+    return record
+
+def ingest_pdfs(source: Union[str, Iterable[str]], workers: Optional[int] = None,
+                timeout: Optional[float] = DEFAULT_TIMEOUT, max_pending: Optional[int] = None,
+                extract_options: Optional[Dict] = None) -> Iterator[Dict]:
+    """
+    Extract text from many PDFs in a process pool, yielding one record per
+    file as soon as it completes (not in input order).
+
+    Each record holds 'path', 'status' ('ok', 'empty', 'timeout' or
+    'error'), 'text', 'error' and 'elapsed'. At most `max_pending` files are
+    in flight at once so arbitrarily long iterators stream in bounded memory.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 4
+    paths = iter(iter_pdf_paths(source))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+
+        def submit_next():
+            for path in paths:
+                pending[executor.submit(extract_pdf_file, path, timeout, extract_options)] = path
+                return True
+            return False
+
+        while len(pending) < max_pending and submit_next():
+            pass
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    record = future.result()
+                except Exception as e:
+                    # Worker crashed (e.g. killed) rather than returning a record
+                    logger.error(f"Worker failed on {path}: {str(e)}")
+                    record = {'path': path, 'status': 'error', 'text': '', 'error': str(e), 'elapsed': None}
+                yield record
+                submit_next()
@@ -0,0 +1,210 @@
+# resume_cache.py - Content-addressed cache for parsed resumes
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from resume_parser import extract_text_from_pdf, extract_sections, extract_contact_info
+from utils import extract_skills
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bump when parsing or extraction output changes so stale entries are ignored
+CACHE_VERSION = 1
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_DISK_BYTES = 100 * 1024 * 1024
+
+def resume_cache_key(file_content: bytes) -> str:
+    """Content hash used as the cache key for a resume file"""
+    return hashlib.sha256(file_content).hexdigest()
+
+def parse_resume_text(text: str) -> Dict:
+    """Run the per-resume extraction steps over already extracted text"""
+    return {
+        'version': CACHE_VERSION,
+        'text': text,
+        'skills': extract_skills(text),
+        'sections': extract_sections(text),
+        'contact_info': extract_contact_info(text)
+    }
+
+class ResumeCache:
+    """
+    Two-tier cache of parsed resumes keyed by a hash of the PDF bytes.
+
+    The memory tier is an LRU of recent entries. The optional disk tier keeps
+    one JSON file per entry and evicts the least recently used files once
+    their total size exceeds max_disk_bytes.
+
+    Records are copied in and out, so callers may change what they get or
+    put without touching the cached entry.
+    """
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, disk_dir: Optional[str] = None,
+                 max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._disk_index = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        if disk_dir:
+            self.use_disk_dir(disk_dir)
+
+    def use_disk_dir(self, disk_dir: str) -> None:
+        """Enable the disk tier in disk_dir, indexing entries already there"""
+        with self._lock:
+            os.makedirs(disk_dir, exist_ok=True)
+            self.disk_dir = disk_dir
+            self._disk_index.clear()
+            self._disk_bytes = 0
+            self._load_disk_index()
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _load_disk_index(self):
+        entries = []
+        for name in os.listdir(self.disk_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.disk_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, name[:-len('.json')], stat.st_size))
+
+        # Oldest first, so eviction pops from the front
+        for mtime, key, size in sorted(entries):
+            self._disk_index[key] = size
+            self._disk_bytes += size
+
+    def _read_disk(self, key):
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r') as f:
+                record = json.load(f)
+            os.utime(path)
+            size = os.path.getsize(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable resume cache entry {key}: {str(e)}")
+            self._remove_disk(key)
+            return None
+
+        self._disk_bytes += size - self._disk_index.pop(key, 0)
+        self._disk_index[key] = size
+        return record
+
+    def _write_disk(self, key, record):
+        path = self._disk_path(key)
+        temp_path = None
+        try:
+            # A private temp file per write, so concurrent writers of one key
+            # never share a half-written file; the last replace wins whole
+            fd, temp_path = tempfile.mkstemp(dir=self.disk_dir, prefix=f".{key}.", suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(record, f)
+            os.replace(temp_path, path)
+            size = os.path.getsize(path)
+        except OSError as e:
+            logger.error(f"Error writing resume cache entry {key}: {str(e)}")
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return
+
+        self._disk_bytes += size - self._disk_index.pop(key, 0)
+        self._disk_index[key] = size
+
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk_index) > 1:
+            oldest_key = next(iter(self._disk_index))
+            self._remove_disk(oldest_key)
+
+    def _remove_disk(self, key):
+        size = self._disk_index.pop(key, 0)
+        self._disk_bytes -= size
+        try:
+            os.remove(self._disk_path(key))
+        except OSError:
+            pass
+
+    def _remember(self, key, record):
+        self._memory[key] = record
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Look up a parsed resume, promoting disk hits into memory"""
+        with self._lock:
+            record = self._memory.get(key)
+            if record is not None:
+                self._memory.move_to_end(key)
+                return copy.deepcopy(record)
+
+            # Another process sharing disk_dir may have written the entry
+            # since the index was loaded
+            if self.disk_dir and (key in self._disk_index or os.path.exists(self._disk_path(key))):
+                record = self._read_disk(key)
+                if record is not None and record.get('version') == CACHE_VERSION:
+                    self._remember(key, record)
+                    return copy.deepcopy(record)
+
+            return None
+
+    def put(self, key: str, record: Dict) -> None:
+        """Store a parsed resume in both tiers"""
+        with self._lock:
+            self._remember(key, copy.deepcopy(record))
+            if self.disk_dir:
+                self._write_disk(key, record)
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._memory.clear()
+            if self.disk_dir:
+                for key in list(self._disk_index):
+                    self._remove_disk(key)
+
+# Shared resume cache; set RESUME_CACHE_DIR to enable the disk tier
+resume_cache = ResumeCache(disk_dir=os.environ.get('RESUME_CACHE_DIR'))
+
+def get_parsed_resume(uploaded_file, cache: Optional[ResumeCache] = None) -> Dict:
+    """
+    Get text, skills, sections and contact info for an uploaded PDF,
+    parsing it only if the same bytes have not been seen before. Failed
+    extractions are not cached, so their messages are shown again.
+    """
+    cache = resume_cache if cache is None else cache
+
+    if hasattr(uploaded_file, 'getvalue'):
+        file_content = uploaded_file.getvalue()
+    elif hasattr(uploaded_file, 'read'):
+        file_content = uploaded_file.read()
+        uploaded_file.seek(0)  # Reset file pointer
+    else:
+        file_content = uploaded_file
+
+    key = resume_cache_key(file_content)
+    record = cache.get(key)
+    if record is not None:
+        return record
+
+    text = extract_text_from_pdf(file_content)
+    record = parse_resume_text(text)
+    if text:
+        cache.put(key, record)
+    return record
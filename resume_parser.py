@@ -3,6 +3,7 @@ import pdfplumber
 import streamlit as st
 import logging
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 import re
 
@@ -10,58 +11,147 @@ import re
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def extract_text_from_pdf(uploaded_file):
+class PDFExtractionError(Exception):
+    """Raised when text cannot be extracted from a PDF"""
+
+class EmptyPDFTextError(PDFExtractionError):
+    """Raised when a PDF opens fine but contains no readable text"""
+
+# Pages handed to each worker when extracting pages in parallel
+PAGES_PER_TASK = 4
+
+def _extract_page_texts(pdf, start, end):
+    """Extract text from pages [start, end) of an open PDF, skipping failures"""
+    page_texts = []
+    for page_num in range(start, end):
+        try:
+            page_text = pdf.pages[page_num].extract_text()
+            if page_text:
+                page_texts.append(page_text)
+            else:
+                logger.warning(f"No text found on page {page_num + 1}")
+        except Exception as e:
+            logger.error(f"Error extracting text from page {page_num + 1}: {str(e)}")
+            continue
+    return page_texts
+
+def _extract_page_range(file_content, start, end):
+    """Worker entry point: open the PDF bytes and extract one page range"""
+    with pdfplumber.open(BytesIO(file_content)) as pdf:
+        return _extract_page_texts(pdf, start, end)
+
+def _collect_page_texts(pdf, page_count, max_chars):
+    """Gather page texts in page order, stopping once max_chars is reached"""
+    page_texts = []
+    char_count = 0
+    for page_num in range(page_count):
+        for page_text in _extract_page_texts(pdf, page_num, page_num + 1):
+            page_texts.append(page_text)
+            char_count += len(page_text) + 1
+        if max_chars and char_count >= max_chars:
+            break
+    return page_texts
+
+def _collect_page_texts_parallel(file_content, page_count, page_workers, max_chars):
     """
-    Enhanced PDF text extraction with error handling and cleaning
+    Extract page ranges in worker processes and consume them in page order,
+    so the character cap can cancel ranges that are no longer needed
+    """
+    page_texts = []
+    char_count = 0
+    ranges = [(start, min(start + PAGES_PER_TASK, page_count)) for start in range(0, page_count, PAGES_PER_TASK)]
+    with ProcessPoolExecutor(max_workers=page_workers) as executor:
+        futures = [executor.submit(_extract_page_range, file_content, start, end) for start, end in ranges]
+        for index, future in enumerate(futures):
+            for page_text in future.result():
+                page_texts.append(page_text)
+                char_count += len(page_text) + 1
+            if max_chars and char_count >= max_chars:
+                for remaining in futures[index + 1:]:
+                    remaining.cancel()
+                break
+    return page_texts
+
+def extract_pdf_text(file_content, parallel=False, page_workers=None, max_pages=None, max_chars=None):
+    """
+    Extract and clean text from raw PDF bytes without any UI side effects.
+    Raises PDFExtractionError when the PDF cannot be read and
+    EmptyPDFTextError when it holds no readable text.
+
+    Set parallel=True to extract page ranges in worker processes, which
+    helps long documents. max_pages and max_chars stop extraction early
+    once that many pages or raw characters have been read.
     """
-    if uploaded_file is None:
-        return ""
-    
-    text = ""
     try:
-        # Read the file content
-        if hasattr(uploaded_file, 'read'):
-            file_content = uploaded_file.read()
-            uploaded_file.seek(0)  # Reset file pointer
-        else:
-            file_content = uploaded_file
-        
         # Create BytesIO object for pdfplumber
         pdf_file = BytesIO(file_content)
         
         with pdfplumber.open(pdf_file) as pdf:
+            page_count = len(pdf.pages)
+            
             # Check if PDF has pages
-            if len(pdf.pages) == 0:
-                st.error("❌ The PDF file appears to be empty or corrupted.")
-                return ""
+            if page_count == 0:
+                raise PDFExtractionError("The PDF file appears to be empty or corrupted.")
+            
+            if max_pages:
+                page_count = min(page_count, max_pages)
             
             # Extract text from each page
-            for page_num, page in enumerate(pdf.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                    else:
-                        logger.warning(f"No text found on page {page_num + 1}")
-                except Exception as e:
-                    logger.error(f"Error extracting text from page {page_num + 1}: {str(e)}")
-                    continue
+            if parallel and page_count > PAGES_PER_TASK:
+                page_texts = _collect_page_texts_parallel(file_content, page_count, page_workers, max_chars)
+            else:
+                page_texts = _collect_page_texts(pdf, page_count, max_chars)
     
+    except PDFExtractionError:
+        raise
     except Exception as e:
         error_msg = f"Error reading PDF file: {str(e)}"
         logger.error(error_msg)
-        st.error(f"❌ {error_msg}")
-        return ""
+        raise PDFExtractionError(error_msg) from e
+    
+    text = "\n".join(page_texts)
+    if max_chars:
+        text = text[:max_chars]
     
     # Clean and process the extracted text
     cleaned_text = clean_extracted_text(text)
     
     if not cleaned_text.strip():
-        st.warning("⚠️ No readable text found in the PDF. Please ensure the PDF contains text (not just images).")
-        return ""
+        raise EmptyPDFTextError("No readable text found in the PDF. Please ensure the PDF contains text (not just images).")
     
     return cleaned_text
 
+def extract_text_from_pdf(uploaded_file, **extract_options):
+    """
+    Enhanced PDF text extraction with error handling and cleaning.
+    extract_options are passed through to extract_pdf_text (parallel,
+    page_workers, max_pages, max_chars).
+    """
+    if uploaded_file is None:
+        return ""
+    
+    try:
+        # Read the file content
+        if hasattr(uploaded_file, 'read'):
+            file_content = uploaded_file.read()
+            uploaded_file.seek(0)  # Reset file pointer
+        else:
+            file_content = uploaded_file
+        
+        return extract_pdf_text(file_content, **extract_options)
+    
+    except EmptyPDFTextError as e:
+        st.warning(f"⚠️ {e}")
+        return ""
+    except PDFExtractionError as e:
+        st.error(f"❌ {e}")
+        return ""
+    except Exception as e:
+        error_msg = f"Error reading PDF file: {str(e)}"
+        logger.error(error_msg)
+        st.error(f"❌ {error_msg}")
+        return ""
+
 def clean_extracted_text(text):
     """
     Clean and normalize extracted text
@@ -136,52 +226,61 @@ def extract_contact_info(text):
     
     return contact_info
 
+# Common section headers
+SECTION_PATTERNS = {
+    'education': r'(education|academic|qualification|degree)',
+    'experience': r'(experience|employment|work|career|professional)',
+    'skills': r'(skills|competencies|technical|technologies)',
+    'projects': r'(projects|portfolio|work samples)',
+    'certifications': r'(certifications?|certificates?|licenses?)',
+    'summary': r'(summary|objective|profile|about)'
+}
+
+_COMPILED_SECTION_PATTERNS = {name: re.compile(pattern) for name, pattern in SECTION_PATTERNS.items()}
+
+# One combined pattern that tells whether a line looks like any section header
+_SECTION_HEADER_PATTERN = re.compile('|'.join(SECTION_PATTERNS.values()))
+
+MAX_SECTION_HEADER_LENGTH = 50
+MAX_SECTION_LINES = 10
+
 def extract_sections(text):
     """
     Extract different sections from resume
     """
     sections = {}
+    seen_sections = set()
+    current_sections = []
+    section_content = []
     
-    # Common section headers
-    section_patterns = {
-        'education': r'(education|academic|qualification|degree)',
-        'experience': r'(experience|employment|work|career|professional)',
-        'skills': r'(skills|competencies|technical|technologies)',
-        'projects': r'(projects|portfolio|work samples)',
-        'certifications': r'(certifications?|certificates?|licenses?)',
-        'summary': r'(summary|objective|profile|about)'
-    }
+    def flush():
+        if section_content:
+            for section_name in current_sections:
+                sections[section_name] = '\n'.join(section_content)
     
-    text_lower = text.lower()
-    lines = text.split('\n')
+    # Single sweep: each line is labelled once as header or content
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        
+        line_lower = line.lower()
+        if len(line) < MAX_SECTION_HEADER_LENGTH and _SECTION_HEADER_PATTERN.search(line_lower):
+            flush()
+            # Only the first header for each section counts; a header line
+            # can open several sections at once
+            current_sections = [
+                section_name for section_name, pattern in _COMPILED_SECTION_PATTERNS.items()
+                if section_name not in seen_sections and pattern.search(line_lower)
+            ]
+            seen_sections.update(current_sections)
+            section_content = []
+        elif current_sections and len(section_content) < MAX_SECTION_LINES:
+            section_content.append(line)
     
-    for section_name, pattern in section_patterns.items():
-        for i, line in enumerate(lines):
-            if re.search(pattern, line.lower()) and len(line.strip()) < 50:
-                # Found a section header, extract content until next section
-                section_content = []
-                for j in range(i + 1, len(lines)):
-                    next_line = lines[j].strip()
-                    if not next_line:
-                        continue
-                    
-                    # Check if this might be another section header
-                    is_next_section = False
-                    for other_pattern in section_patterns.values():
-                        if re.search(other_pattern, next_line.lower()) and len(next_line) < 50:
-                            is_next_section = True
-                            break
-                    
-                    if is_next_section:
-                        break
-                    
-                    section_content.append(next_line)
-                
-                if section_content:
-                    sections[section_name] = '\n'.join(section_content[:10])  # Limit length
-                break
+    flush()
     
-    return sections
+    return {section_name: sections[section_name] for section_name in SECTION_PATTERNS if section_name in sections}
 
 def validate_resume_quality(text):
     """
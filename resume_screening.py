@@ -0,0 +1,436 @@
+# resume_screening.py - Offline batch screening of resumes against roles
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Set
+
+from ats_checker import get_ats_scores_for_roles
+from job_export import LIST_SEPARATOR
+from pdf_ingestion import DEFAULT_TIMEOUT, extract_pdf_file, iter_pdf_paths
+from skill_matcher import get_detailed_skill_analysis, role_registry
+from utils import extract_skills
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SCREENING_FORMATS = ('jsonl', 'csv')
+CHECKPOINT_VERSION = 1
+
+# Times a resume may take down its worker process before it is given up on
+MAX_WORKER_CRASHES = 2
+
+# One row per (resume, role); a resume that could not be screened gets a
+# single row with its status and error and no role
+SCREENING_COLUMNS = [
+    'resume_id', 'source', 'status', 'error', 'role', 'match_score', 'ats_score', 'skills_count',
+    'skills', 'matched_skills', 'missing_skills', 'ats_feedback'
+]
+
+def iter_resume_items(source: str) -> Iterator[Dict]:
+    """
+    Yield {'resume_id', 'path'} or {'resume_id', 'text'} items from a folder
+    of PDFs (ids are paths relative to the folder), a single PDF, or a JSONL
+    file of {"id", "text"} or {"id", "path"} objects (relative paths are
+    resolved against the JSONL file; ids default to the line number)
+    """
+    if os.path.isdir(source):
+        for path in iter_pdf_paths(source):
+            yield {'resume_id': os.path.relpath(path, source), 'path': path}
+        return
+    if source.lower().endswith('.pdf'):
+        yield {'resume_id': os.path.basename(source), 'path': source}
+        return
+
+    base_dir = os.path.dirname(os.path.abspath(source))
+    with open(source, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping invalid JSON on line {line_number} of {source}")
+                continue
+            if not isinstance(entry, dict) or not isinstance(entry.get('text', entry.get('path')), str):
+                logger.warning(f"Skipping line {line_number} of {source}: needs a 'text' or 'path' string")
+                continue
+
+            item = {'resume_id': str(entry.get('id', line_number))}
+            if isinstance(entry.get('text'), str):
+                item['text'] = entry['text']
+            else:
+                item['path'] = os.path.join(base_dir, entry['path'])
+            yield item
+
+def screen_resume(item: Dict, roles: Sequence[str], timeout: Optional[float] = DEFAULT_TIMEOUT) -> Dict:
+    """
+    Parse one resume item and score it against every role. Runs in worker
+    processes and returns a result record instead of raising: 'resume_id',
+    'status' ('ok', 'empty', 'timeout' or 'error'), 'error', 'rows' (see
+    SCREENING_COLUMNS) and 'elapsed'.
+    """
+    started = time.perf_counter()
+    result = {'resume_id': item['resume_id'], 'status': 'ok', 'error': None}
+    source = item.get('path')
+
+    if 'text' in item:
+        text = item['text']
+        if not text.strip():
+            result['status'], result['error'] = 'empty', "Resume text is empty"
+    else:
+        extracted = extract_pdf_file(item['path'], timeout)
+        text = extracted['text']
+        result['status'], result['error'] = extracted['status'], extracted['error']
+
+    rows = []
+    if result['status'] == 'ok':
+        try:
+            skills = extract_skills(text)
+            ats_results = get_ats_scores_for_roles(text, roles)
+            for role in roles:
+                analysis = get_detailed_skill_analysis(skills, role)
+                ats_score, ats_feedback = ats_results[role]
+                rows.append({
+                    'resume_id': item['resume_id'],
+                    'source': source,
+                    'status': 'ok',
+                    'error': None,
+                    'role': role,
+                    'match_score': analysis.get('overall_score'),
+                    'ats_score': ats_score,
+                    'skills_count': len(skills),
+                    'skills': skills,
+                    'matched_skills': analysis.get('matched_skills', []),
+                    'missing_skills': analysis.get('missing_skills', []),
+                    'ats_feedback': ats_feedback
+                })
+        except Exception as e:
+            rows = []
+            result['status'], result['error'] = 'error', str(e)
+
+    if not rows:
+        rows.append({column: None for column in SCREENING_COLUMNS})
+        rows[0].update(resume_id=item['resume_id'], source=source, status=result['status'],
+                       error=result['error'])
+
+    result['rows'] = rows
+    result['elapsed'] = time.perf_counter() - started
+    return result
+
+def _failed_result(item: Dict, status: str, error: str) -> Dict:
+    row = {column: None for column in SCREENING_COLUMNS}
+    row.update(resume_id=item['resume_id'], source=item.get('path'), status=status, error=error)
+    return {'resume_id': item['resume_id'], 'status': status, 'error': error, 'rows': [row], 'elapsed': None}
+
+def run_screening(items: Iterator[Dict], roles: Sequence[str], workers: Optional[int] = None,
+                  timeout: Optional[float] = DEFAULT_TIMEOUT, max_pending: Optional[int] = None,
+                  max_crashes: int = MAX_WORKER_CRASHES) -> Iterator[Dict]:
+    """
+    Screen resume items in a process pool, yielding one result per resume
+    as soon as it completes (not in input order). At most `max_pending`
+    resumes are in flight, so long inputs stream in bounded memory.
+
+    A worker process that dies breaks the whole pool, so the pool is
+    rebuilt and the resumes that were in flight are retried one at a time
+    to find the one that crashed. A resume that crashes its worker
+    `max_crashes` times gets a 'crashed' result; the others are screened
+    as usual.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 4
+    items = iter(items)
+    roles = tuple(roles)
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = {}
+    # Items in flight when the pool broke, retried alone to find the culprit
+    suspects = deque()
+    crashes = {}
+    try:
+        def submit(item):
+            pending[executor.submit(screen_resume, item, roles, timeout)] = item
+
+        def fill():
+            # A pool only breaks with work in flight, so a suspect is always
+            # submitted to a fresh pool
+            if suspects:
+                if not pending:
+                    submit(suspects.popleft())
+                return
+            while len(pending) < max_pending:
+                item = next(items, None)
+                if item is None:
+                    return
+                try:
+                    submit(item)
+                except BrokenProcessPool:
+                    # The pool broke before its futures reported it
+                    suspects.append(item)
+                    return
+
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            broken = []
+            for future in done:
+                item = pending.pop(future)
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    broken.append(item)
+                    continue
+                except Exception as e:
+                    # The call itself failed, e.g. the item could not be pickled
+                    logger.error(f"Worker failed on {item['resume_id']}: {str(e)}")
+                    result = _failed_result(item, 'error', str(e))
+                yield result
+
+            if broken:
+                # Every other future of a broken pool fails too; keep the
+                # results that finished first
+                for future in wait(pending)[0]:
+                    item = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        broken.append(item)
+                        continue
+                    except Exception as e:
+                        result = _failed_result(item, 'error', str(e))
+                    yield result
+
+            if broken:
+                executor.shutdown(wait=True, cancel_futures=True)
+                executor = ProcessPoolExecutor(max_workers=workers)
+                if len(broken) == 1:
+                    item = broken[0]
+                    crashes[item['resume_id']] = crashes.get(item['resume_id'], 0) + 1
+                    if crashes[item['resume_id']] >= max_crashes:
+                        error = f"Worker process crashed {crashes[item['resume_id']]} times"
+                        logger.error(f"Giving up on {item['resume_id']}: {error}")
+                        yield _failed_result(item, 'crashed', error)
+                    else:
+                        suspects.appendleft(item)
+                else:
+                    logger.warning(f"Worker process crashed; retrying {len(broken)} resumes one at a time")
+                    suspects.extend(broken)
+            fill()
+    finally:
+        # Interrupted runs drop queued work instead of finishing it
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return LIST_SEPARATOR.join(str(item) for item in value)
+    return value
+
+class ScreeningWriter:
+    """Writes screening rows to a binary stream as JSONL or CSV, one resume at a time"""
+    def __init__(self, output: BinaryIO, fmt: str = 'jsonl'):
+        if fmt not in SCREENING_FORMATS:
+            raise ValueError(f"Unknown screening format: {fmt}. Use one of {', '.join(SCREENING_FORMATS)}")
+        self.output = output
+        self.fmt = fmt
+
+    def write_header(self) -> None:
+        if self.fmt == 'csv':
+            self._write_csv([SCREENING_COLUMNS])
+
+    def write_rows(self, rows: List[Dict]) -> None:
+        if self.fmt == 'csv':
+            self._write_csv([_csv_value(row.get(column)) for column in SCREENING_COLUMNS] for row in rows)
+        else:
+            lines = [json.dumps({column: row.get(column) for column in SCREENING_COLUMNS}, ensure_ascii=False)
+                     for row in rows]
+            self.output.write(('\n'.join(lines) + '\n').encode('utf-8'))
+        self.output.flush()
+
+    def _write_csv(self, rows) -> None:
+        buffer = io.StringIO(newline='')
+        csv.writer(buffer).writerows(rows)
+        self.output.write(buffer.getvalue().encode('utf-8'))
+
+class ScreeningCheckpoint:
+    """
+    Append-only log of screened resumes for restarting a run after a crash.
+
+    The first line records the output format, the roles and the output size
+    after its header. Each later line records a resume id and the output
+    size once that resume's rows were flushed, so a restart truncates any
+    rows written after the last checkpoint and skips the resumes already
+    done. A torn last line is ignored.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def load(self) -> Optional[Dict]:
+        """The saved state as {'format', 'roles', 'offset', 'done'}, or None if there is none"""
+        if not os.path.exists(self.path):
+            return None
+        state = None
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if state is None:
+                    if entry.get('version') != CHECKPOINT_VERSION:
+                        raise ValueError(f"{self.path} is not a version {CHECKPOINT_VERSION} screening checkpoint")
+                    state = {'format': entry['format'], 'roles': entry['roles'], 'offset': entry['offset'],
+                             'done': set()}
+                else:
+                    state['done'].add(entry['resume_id'])
+                    state['offset'] = entry['offset']
+        return state
+
+    def start(self, fmt: str, roles: Sequence[str], offset: int, done: Set[str] = frozenset()) -> None:
+        """Rewrite the log for a new or restarted run, then keep it open for appends"""
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'version': CHECKPOINT_VERSION, 'format': fmt, 'roles': list(roles),
+                                'offset': offset}) + '\n')
+            for resume_id in sorted(done):
+                f.write(json.dumps({'resume_id': resume_id, 'offset': offset}) + '\n')
+        os.replace(temp_path, self.path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def record(self, resume_id: str, offset: int) -> None:
+        self._file.write(json.dumps({'resume_id': resume_id, 'offset': offset}) + '\n')
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+def screen_resumes(source: str, output: str, roles: Optional[List[str]] = None, fmt: str = 'jsonl',
+                   workers: Optional[int] = None, timeout: Optional[float] = DEFAULT_TIMEOUT,
+                   checkpoint: Optional[str] = None, resume: bool = False) -> Dict:
+    """
+    Screen every resume in `source` against `roles` (all known roles by
+    default) and stream the rows to `output` ('-' for stdout). With a
+    `checkpoint` path, progress is logged as each resume is written, and
+    `resume=True` continues an interrupted run from it. Returns a summary:
+    'screened', 'skipped', 'failed' counts by status, 'rows', 'elapsed'
+    and 'resumes_per_second'.
+    """
+    roles = list(roles or role_registry.role_names())
+    if output == '-' and checkpoint:
+        raise ValueError("Checkpoints need an output file, not stdout")
+
+    state = None
+    checkpointer = ScreeningCheckpoint(checkpoint) if checkpoint else None
+    if checkpointer is not None and resume:
+        state = checkpointer.load()
+        if state is None:
+            logger.info(f"No checkpoint at {checkpoint}; starting a new run")
+        elif state['format'] != fmt or state['roles'] != roles:
+            raise ValueError(f"{checkpoint} was written for a different format or role list")
+        elif not os.path.exists(output):
+            raise ValueError(f"Cannot resume: {output} is missing")
+
+    if output == '-':
+        stream = sys.stdout.buffer
+    elif state is not None:
+        stream = open(output, 'r+b')
+        stream.truncate(state['offset'])
+        stream.seek(state['offset'])
+    else:
+        stream = open(output, 'wb')
+
+    writer = ScreeningWriter(stream, fmt)
+    done = set()
+    if state is None:
+        writer.write_header()
+        stream.flush()
+    else:
+        done = state['done']
+        logger.info(f"Resuming after {len(done)} screened resumes")
+    if checkpointer is not None:
+        checkpointer.start(fmt, roles, stream.tell(), done)
+
+    summary = {'screened': 0, 'skipped': 0, 'failed': {}, 'rows': 0}
+    started = time.perf_counter()
+
+    def pending_items():
+        for item in iter_resume_items(source):
+            if item['resume_id'] in done:
+                summary['skipped'] += 1
+            else:
+                yield item
+
+    try:
+        for result in run_screening(pending_items(), roles, workers, timeout):
+            writer.write_rows(result['rows'])
+            if checkpointer is not None:
+                checkpointer.record(result['resume_id'], stream.tell())
+            summary['screened'] += 1
+            summary['rows'] += len(result['rows'])
+            if result['status'] != 'ok':
+                summary['failed'][result['status']] = summary['failed'].get(result['status'], 0) + 1
+    finally:
+        elapsed = time.perf_counter() - started
+        summary['elapsed'] = elapsed
+        summary['resumes_per_second'] = summary['screened'] / elapsed if elapsed > 0 else 0.0
+        if checkpointer is not None:
+            checkpointer.close()
+        if stream is not sys.stdout.buffer:
+            stream.close()
+    return summary
+
+def format_summary(summary: Dict) -> str:
+    failed = ', '.join(f"{status}: {count}" for status, count in sorted(summary['failed'].items())) or 'none'
+    return (f"Screened {summary['screened']} resumes ({summary['rows']} rows) in {summary['elapsed']:.1f}s, "
+            f"{summary['resumes_per_second']:.1f} resumes/s; skipped {summary['skipped']} already screened; "
+            f"failed: {failed}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Screen resumes against roles without the Streamlit app")
+    parser.add_argument('source', help="Folder of PDFs, a PDF, or a JSONL file of {id, text|path} objects")
+    parser.add_argument('--roles', help="Comma-separated roles (default: every known role)")
+    parser.add_argument('--output', '-o', default='-', help="Output path, or - for stdout")
+    parser.add_argument('--format', '-f', choices=SCREENING_FORMATS, default='jsonl')
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="Seconds allowed per PDF")
+    parser.add_argument('--checkpoint', help="Checkpoint path (default: OUTPUT.checkpoint for file output)")
+    parser.add_argument('--no-checkpoint', action='store_true', help="Do not keep a checkpoint")
+    parser.add_argument('--resume', action='store_true', help="Continue an interrupted run from its checkpoint")
+    args = parser.parse_args(argv)
+
+    roles = [role.strip() for role in args.roles.split(',') if role.strip()] if args.roles else None
+    unknown = [role for role in roles or [] if role_registry.get(role) is None]
+    if unknown:
+        parser.error(f"Unknown roles: {', '.join(unknown)}")
+
+    checkpoint = None
+    if not args.no_checkpoint and args.output != '-':
+        checkpoint = args.checkpoint or f"{args.output}.checkpoint"
+    if args.resume and checkpoint is None:
+        parser.error("--resume needs a checkpoint, so write to a file with --output")
+
+    try:
+        summary = screen_resumes(args.source, args.output, roles, args.format, args.workers, args.timeout,
+                                 checkpoint, args.resume)
+    except KeyboardInterrupt:
+        print("Interrupted; rerun with --resume to continue", file=sys.stderr)
+        return 130
+    except ValueError as e:
+        parser.error(str(e))
+    print(format_summary(summary), file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,514 @@
+# scoring_service.py - Headless JSON API over the scoring modules
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ats_checker import get_ats_scores_for_roles
+from job_scraper import ORDER_BY_ID, job_scraper
+from resume_cache import parse_resume_text, resume_cache, resume_cache_key
+from resume_parser import EmptyPDFTextError, PDFExtractionError, extract_pdf_text
+from skill_matcher import role_registry, role_scoring_engine
+from utils import extract_skills, get_skills_by_category
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8600
+DEFAULT_MAX_BATCH = 32
+DEFAULT_BATCH_DELAY = 0.002  # seconds a request waits for others to join its batch
+DEFAULT_MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_BATCH_REQUESTS = 1000
+MAX_HEADER_BYTES = 64 * 1024
+
+class ServiceError(Exception):
+    """A request failure reported to the client with an HTTP status"""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def _json_bytes(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+def _error_body(message: str) -> bytes:
+    return _json_bytes({'error': message})
+
+def _optional(payload: Dict, name: str, kind: type, default: Any = None) -> Any:
+    value = payload.get(name)
+    if value is None:
+        return default
+    if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+        raise ServiceError(400, f"'{name}' must be a {kind.__name__}")
+    return value
+
+def _optional_number(payload: Dict, name: str) -> Optional[float]:
+    value = payload.get(name)
+    if value is not None and (not isinstance(value, (int, float)) or isinstance(value, bool)):
+        raise ServiceError(400, f"'{name}' must be a number")
+    return value
+
+def _optional_strings(payload: Dict, name: str) -> Optional[List[str]]:
+    values = _optional(payload, name, list)
+    if values is not None and not all(isinstance(value, str) for value in values):
+        raise ServiceError(400, f"'{name}' must be a list of strings")
+    return values
+
+def _cached_resume(resume_id: str) -> Dict:
+    record = resume_cache.get(resume_id)
+    if record is None:
+        raise ServiceError(404, f"Unknown resume_id {resume_id}; upload the resume again")
+    return record
+
+def _resume_text(payload: Dict) -> str:
+    """Resume text from 'text' or from a previously uploaded 'resume_id'"""
+    text = _optional(payload, 'text', str)
+    if text is not None:
+        return text
+    resume_id = _optional(payload, 'resume_id', str)
+    if resume_id is not None:
+        return _cached_resume(resume_id)['text']
+    raise ServiceError(400, "Provide 'text' or 'resume_id'")
+
+def _resume_skills(payload: Dict) -> List[str]:
+    """Skills from 'skills', or extracted from 'text' or an uploaded 'resume_id'"""
+    skills = _optional_strings(payload, 'skills')
+    if skills is not None:
+        return skills
+    if payload.get('text') is None and payload.get('resume_id') is not None:
+        return _cached_resume(_optional(payload, 'resume_id', str))['skills']
+    return extract_skills(_resume_text(payload))
+
+def handle_resume(pdf_bytes: bytes) -> Dict:
+    """Parse an uploaded PDF and keep it in the resume cache under its content hash"""
+    if not pdf_bytes:
+        raise ServiceError(400, "Send the PDF file as the request body")
+    resume_id = resume_cache_key(pdf_bytes)
+    record = resume_cache.get(resume_id)
+    if record is None:
+        try:
+            text = extract_pdf_text(pdf_bytes)
+        except EmptyPDFTextError as e:
+            raise ServiceError(422, str(e))
+        except PDFExtractionError as e:
+            raise ServiceError(400, str(e))
+        record = parse_resume_text(text)
+        resume_cache.put(resume_id, record)
+    return {
+        'resume_id': resume_id,
+        'text': record['text'],
+        'skills': record['skills'],
+        'sections': record['sections'],
+        'contact_info': record['contact_info']
+    }
+
+def handle_skills(payload: Dict) -> Dict:
+    """Skills found in a resume, with their categories"""
+    skills = extract_skills(_resume_text(payload))
+    return {'skills': skills, 'categories': get_skills_by_category(skills)}
+
+def handle_role_scores(payload: Dict) -> Dict:
+    """Role match scores, best first, optionally limited to 'roles' and the 'top' few"""
+    skills = _resume_skills(payload)
+    roles = _optional_strings(payload, 'roles')
+    top = _optional(payload, 'top', int)
+
+    scores = role_scoring_engine.score_roles(skills, roles)
+    ranked = sorted(scores.items(), key=lambda item: -item[1])
+    best = {'role': ranked[0][0], 'score': ranked[0][1]} if ranked and ranked[0][1] > 0 else None
+    if top is not None:
+        ranked = ranked[:max(top, 0)]
+    return {
+        'skills': skills,
+        'scores': [{'role': role, 'score': score} for role, score in ranked],
+        'best_role': best
+    }
+
+def handle_ats(payload: Dict) -> Dict:
+    """ATS score and feedback for a 'role', several 'roles', or every known role"""
+    text = _resume_text(payload)
+    roles = _optional_strings(payload, 'roles')
+    if roles is None:
+        role = _optional(payload, 'role', str)
+        roles = [role] if role is not None else role_registry.role_names()
+
+    results = get_ats_scores_for_roles(text, roles)
+    return {'results': [{'role': role, 'score': score, 'feedback': feedback}
+                        for role, (score, feedback) in results.items()]}
+
+def handle_job_search(payload: Dict) -> Dict:
+    """
+    One page of jobs: ranked by 'skills' (or a resume's skills), from a
+    'company', or matching the job filters. Pass 'next_cursor' back as
+    'cursor' for the following page.
+    """
+    page_size = _optional(payload, 'page_size', int, 20)
+    cursor = _optional(payload, 'cursor', str)
+    order_by = _optional(payload, 'order_by', str, ORDER_BY_ID)
+    company = _optional(payload, 'company', str)
+
+    try:
+        if any(payload.get(name) is not None for name in ('skills', 'text', 'resume_id')):
+            return job_scraper.search_jobs_by_skills_page(_resume_skills(payload), page_size, cursor)
+        if company is not None:
+            return job_scraper.get_company_jobs_page(company, page_size, cursor, order_by)
+        return job_scraper.search_jobs_with_filters_page(
+            role=_optional(payload, 'role', str),
+            location=_optional(payload, 'location', str),
+            experience=_optional(payload, 'experience', str),
+            salary_min=_optional(payload, 'salary_min', int),
+            company_size=_optional(payload, 'company_size', str),
+            job_type=_optional(payload, 'job_type', str),
+            salary_max=_optional(payload, 'salary_max', int),
+            page_size=page_size,
+            cursor=cursor,
+            order_by=order_by,
+            experience_min=_optional_number(payload, 'experience_min'),
+            experience_max=_optional_number(payload, 'experience_max')
+        )
+    except ValueError as e:
+        raise ServiceError(400, str(e))
+
+# Handler name -> function; handlers run in the worker pool
+HANDLERS = {
+    'resume': handle_resume,
+    'skills': handle_skills,
+    'roles': handle_role_scores,
+    'ats': handle_ats,
+    'jobs': handle_job_search
+}
+
+# POST path -> handler name
+ROUTES = {
+    '/v1/resumes': 'resume',
+    '/v1/skills': 'skills',
+    '/v1/roles/score': 'roles',
+    '/v1/ats': 'ats',
+    '/v1/jobs/search': 'jobs'
+}
+
+# Only JSON endpoints can be batched; uploads carry a raw PDF body
+BATCHABLE_ROUTES = {path: name for path, name in ROUTES.items() if name != 'resume'}
+
+def _call_handler(name: str, payload: Any) -> Tuple[int, bytes]:
+    try:
+        if name != 'resume':
+            if isinstance(payload, bytes):
+                try:
+                    payload = json.loads(payload) if payload else {}
+                except ValueError:
+                    raise ServiceError(400, "Request body is not valid JSON")
+            if not isinstance(payload, dict):
+                raise ServiceError(400, "Request body must be a JSON object")
+        return 200, _json_bytes(HANDLERS[name](payload))
+    except ServiceError as e:
+        return e.status, _error_body(e.message)
+    except Exception:
+        logger.exception(f"Error handling {name} request")
+        return 500, _error_body("Internal server error")
+
+def run_batch(calls: List[Tuple[str, Any]]) -> List[Tuple[int, bytes]]:
+    """
+    Run (handler name, payload) calls in one worker task. Payloads are raw
+    request bodies or decoded JSON objects. Returns (status, JSON body) per
+    call, already encoded so the event loop only writes bytes.
+    """
+    return [_call_handler(name, payload) for name, payload in calls]
+
+def _init_worker(resume_cache_dir: Optional[str] = None) -> None:
+    # Share uploads between worker processes through one disk tier, and open
+    # the job store before the first request instead of during it
+    if resume_cache_dir and not resume_cache.disk_dir:
+        resume_cache.use_disk_dir(resume_cache_dir)
+    job_scraper.job_store
+
+class RequestBatcher:
+    """
+    Groups concurrent handler calls into shared worker tasks. A call waits
+    at most `max_delay` seconds for others to join, and a batch is sent as
+    soon as it holds `max_batch` calls, so the per-task cost of the pool is
+    paid once per few requests rather than once per request. A batch is
+    split evenly over the pool's `workers`, so its calls run side by side
+    instead of queueing behind each other in one task.
+    """
+    def __init__(self, executor: Executor, max_batch: int = DEFAULT_MAX_BATCH,
+                 max_delay: float = DEFAULT_BATCH_DELAY, workers: int = 1):
+        self.executor = executor
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max_delay
+        self.workers = max(1, workers)
+        self._pending: List[Tuple[str, Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+
+    async def submit(self, name: str, payload: Any) -> Tuple[int, bytes]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((name, payload, future))
+        if len(self._pending) >= self.max_batch or self.max_delay <= 0:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        task_size = -(-len(batch) // self.workers)
+        for start in range(0, len(batch), max(task_size, 1)):
+            task = asyncio.get_running_loop().create_task(self._run(batch[start:start + task_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[str, Any, asyncio.Future]]) -> None:
+        calls = [(name, payload) for name, payload, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self.executor, run_batch, calls)
+        except Exception:
+            logger.exception(f"Worker failed on a batch of {len(batch)} requests")
+            results = [(500, _error_body("Internal server error"))] * len(batch)
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+class ScoringService:
+    """
+    Async HTTP/1.1 JSON service for resume upload, skill extraction, role
+    scoring, ATS scoring and job search, without the Streamlit app.
+
+    The event loop only parses requests and writes responses. Handlers run
+    in a pool of `workers` processes (or threads with executor='thread'),
+    and concurrent requests are batched into pool tasks spread over the
+    workers. Endpoints:
+
+        GET  /health
+        POST /v1/resumes        raw PDF body -> resume_id, skills, sections
+        POST /v1/skills         {text | resume_id}
+        POST /v1/roles/score    {skills | text | resume_id, roles?, top?}
+        POST /v1/ats            {text | resume_id, role? | roles?}
+        POST /v1/jobs/search    {skills | text | resume_id | company | filters, page_size?, cursor?}
+        POST /v1/batch          {requests: [{path, body}, ...]}
+
+    Worker processes share uploaded resumes through the resume cache's disk
+    tier: RESUME_CACHE_DIR when it is set, otherwise a temporary directory
+    removed when the service stops.
+    """
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: Optional[int] = None,
+                 executor: str = 'process', max_batch: int = DEFAULT_MAX_BATCH,
+                 batch_delay: float = DEFAULT_BATCH_DELAY, max_body_bytes: int = DEFAULT_MAX_BODY_BYTES):
+        if executor not in ('process', 'thread'):
+            raise ValueError(f"Unknown executor: {executor}")
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.executor_kind = executor
+        self.max_batch = max_batch
+        self.batch_delay = batch_delay
+        self.max_body_bytes = max_body_bytes
+        self._executor: Optional[Executor] = None
+        self._batcher: Optional[RequestBatcher] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._temp_cache_dir: Optional[str] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        """Start the worker pool and listen; returns the base URL"""
+        if self.executor_kind == 'process':
+            cache_dir = resume_cache.disk_dir
+            if not cache_dir:
+                cache_dir = self._temp_cache_dir = tempfile.mkdtemp(prefix='resume-cache-')
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(cache_dir,))
+        else:
+            _init_worker()
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._batcher = RequestBatcher(self._executor, self.max_batch, self.batch_delay, self.workers)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  limit=MAX_HEADER_BYTES)
+        # Port 0 picks a free port
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Scoring service listening on {self.base_url} with {self.workers} {self.executor_kind} workers")
+        return self.base_url
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._temp_cache_dir is not None:
+            shutil.rmtree(self._temp_cache_dir, ignore_errors=True)
+            self._temp_cache_dir = None
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict, bytes]]:
+        # Returns (method, path, headers, body), or None when the client hung up
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise ServiceError(431, "Request headers too large")
+
+        lines = head.decode('latin-1').split('\r\n')
+        parts = lines[0].split(' ')
+        if len(parts) != 3 or not parts[2].startswith('HTTP/1.'):
+            raise ServiceError(400, "Malformed request line")
+        method, target, version = parts
+
+        headers = {'version': version}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, separator, value = line.partition(':')
+            if not separator:
+                raise ServiceError(400, "Malformed header line")
+            headers[name.strip().lower()] = value.strip()
+
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            raise ServiceError(411, "Send a Content-Length instead of a chunked body")
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise ServiceError(400, "Invalid Content-Length")
+        if length < 0:
+            raise ServiceError(400, "Invalid Content-Length")
+        if length > self.max_body_bytes:
+            raise ServiceError(413, f"Request body is larger than {self.max_body_bytes} bytes")
+        body = await reader.readexactly(length) if length else b''
+        return method, urlsplit(target).path, headers, body
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, bytes]:
+        if path == '/health':
+            if method != 'GET':
+                return 405, _error_body("Use GET")
+            return 200, _json_bytes({'status': 'ok', 'workers': self.workers, 'executor': self.executor_kind})
+
+        if path != '/v1/batch' and path not in ROUTES:
+            return 404, _error_body(f"Unknown endpoint {path}")
+        if method != 'POST':
+            return 405, _error_body("Use POST")
+        if path in ROUTES:
+            return await self._batcher.submit(ROUTES[path], body)
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400, _error_body("Request body is not valid JSON")
+        requests = payload.get('requests') if isinstance(payload, dict) else None
+        if not isinstance(requests, list):
+            return 400, _error_body("'requests' must be a list")
+        if len(requests) > MAX_BATCH_REQUESTS:
+            return 413, _error_body(f"At most {MAX_BATCH_REQUESTS} requests per batch")
+
+        calls = []
+        for request in requests:
+            path = request.get('path') if isinstance(request, dict) else None
+            if not isinstance(path, str):
+                calls.append(self._immediate(400, _error_body("Each request needs a 'path' string")))
+                continue
+            name = BATCHABLE_ROUTES.get(path)
+            if name is None:
+                calls.append(self._immediate(404, _error_body("Unknown or unbatchable path")))
+            else:
+                body = request.get('body')
+                calls.append(self._batcher.submit(name, {} if body is None else body))
+        results = await asyncio.gather(*calls)
+
+        # Bodies come back encoded, so they are spliced in rather than re-encoded
+        responses = b','.join(b'{"status":%d,"body":%s}' % (status, result_body) for status, result_body in results)
+        return 200, b'{"responses":[' + responses + b']}'
+
+    @staticmethod
+    async def _immediate(status: int, body: bytes) -> Tuple[int, bytes]:
+        return status, body
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, body: bytes, keep_alive: bool) -> None:
+        head = (f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except ServiceError as e:
+                    # The stream position is unknown after a bad request, so close
+                    self._write_response(writer, e.status, _error_body(e.message), keep_alive=False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+
+                method, path, headers, body = request
+                connection = headers.get('connection', '').lower()
+                if headers['version'] == 'HTTP/1.0':
+                    keep_alive = connection == 'keep-alive'
+                else:
+                    keep_alive = connection != 'close'
+
+                try:
+                    status, response_body = await self._dispatch(method, path, body)
+                except Exception:
+                    logger.exception(f"Error dispatching {method} {path}")
+                    status, response_body = 500, _error_body("Internal server error")
+                self._write_response(writer, status, response_body, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve resume, role, ATS and job scoring as a JSON API")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=None, help="Worker pool size (default: CPU count)")
+    parser.add_argument('--executor', choices=('process', 'thread'), default='process')
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH,
+                        help="Most requests grouped before being split over the workers")
+    parser.add_argument('--batch-delay-ms', type=float, default=DEFAULT_BATCH_DELAY * 1000,
+                        help="How long a request waits for others to join its batch")
+    parser.add_argument('--max-body-mb', type=float, default=DEFAULT_MAX_BODY_BYTES / (1024 * 1024))
+    args = parser.parse_args(argv)
+
+    service = ScoringService(args.host, args.port, args.workers, args.executor, args.max_batch,
+                             args.batch_delay_ms / 1000, int(args.max_body_mb * 1024 * 1024))
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
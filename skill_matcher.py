@@ -1,50 +1,330 @@
 # skill_matcher.py - Enhanced skill matching
 import json
 import os
-from utils import calculate_skill_score, get_skills_by_category
+import threading
+from collections import defaultdict
+import numpy as np
+from scipy import sparse
+from learning_planner import order_skills
+from utils import SKILL_ALIASES, SKILLS_DATABASE, get_skills_by_category
+
+SKILL_CATEGORIES = ['core_skills', 'tools', 'advanced_skills']
+
+# Skills extract_skills can report, lowercased
+KNOWN_SKILLS = frozenset(
+    [skill.lower() for skills in SKILLS_DATABASE.values() for skill in skills] +
+    [skill.lower() for skill in SKILL_ALIASES.values()]
+)
+
+# Weight categories differently
+CATEGORY_WEIGHTS = {
+    'core_skills': 0.5,
+    'tools': 0.3,
+    'advanced_skills': 0.2
+}
+
+class RoleRequirements:
+    """
+    Pre-processed skill requirements for a single role
+    """
+    def __init__(self, name, role_data):
+        self.name = name
+        self.data = role_data
+        self.categories = {}
+        self.category_sets = {}
+
+        if isinstance(role_data, dict):
+            # New enhanced format
+            self.is_legacy = False
+            required_skills = []
+            for category in SKILL_CATEGORIES:
+                if category not in role_data:
+                    continue
+                skills = list(role_data[category])
+                self.categories[category] = skills
+                self.category_sets[category] = frozenset(skill.lower() for skill in skills)
+                required_skills.extend(skills)
+        else:
+            # Old format (list of skills)
+            self.is_legacy = True
+            required_skills = list(role_data)
+
+        self.required_skills = required_skills
+        self.required_set = frozenset(skill.lower() for skill in required_skills)
+
+        # Positions of each required skill, and the partial matches of every
+        # known skill worked out up front
+        self._positions = defaultdict(list)
+        for position, skill in enumerate(skill.lower() for skill in required_skills):
+            self._positions[skill].append(position)
+        self._related = {}
+        for skill in KNOWN_SKILLS | self.required_set:
+            related = self._related_positions(skill)
+            if related:
+                self._related[skill] = related
+
+    def _related_positions(self, user_skill):
+        # Positions of required skills that contain, or are contained in,
+        # a different user skill
+        return [position for skill, positions in self._positions.items()
+                if skill != user_skill and (user_skill in skill or skill in user_skill)
+                for position in positions]
+
+    def _partially_matched(self, user_skills_lower):
+        positions = set()
+        for user_skill in user_skills_lower:
+            if user_skill in self._related:
+                positions.update(self._related[user_skill])
+            elif user_skill not in KNOWN_SKILLS and user_skill not in self.required_set:
+                positions.update(self._related_positions(user_skill))
+        return positions
+
+    def skill_score(self, user_skills):
+        """
+        utils.calculate_skill_score against this role's required skills.
+        Partial matches of known skills are looked up, not compared with
+        every required skill.
+        """
+        if not self.required_skills:
+            return 100
+        user_skills_lower = {skill.lower() for skill in user_skills}
+        total_matches = len(user_skills_lower & self.required_set)
+        total_matches += 0.5 * len(self._partially_matched(user_skills_lower))
+        return min(100, int((total_matches / len(self.required_skills)) * 100))
+
+    def split_skills(self, skills, user_skills_lower):
+        """Split skills into (matched, missing) keeping their original order"""
+        matched = [skill for skill in skills if skill.lower() in user_skills_lower]
+        missing = [skill for skill in skills if skill.lower() not in user_skills_lower]
+        return matched, missing
+
+class RoleRegistry:
+    """
+    Process-wide cache of job role requirements.
+
+    The roles file is parsed once and only re-read when its modification
+    time changes, so matching against it is pure in-memory work.
+    """
+    def __init__(self, data_path=None):
+        if data_path is None:
+            data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "job_roles_data.json")
+        self.data_path = data_path
+        self._roles = {}
+        self._mtime = None
+        self._lock = threading.Lock()
+        self.version = 0
+
+    def _refresh(self):
+        mtime = os.path.getmtime(self.data_path)
+        if mtime == self._mtime:
+            return
+
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            with open(self.data_path, "r") as f:
+                job_data = json.load(f)
+            self._roles = {name: RoleRequirements(name, role_data) for name, role_data in job_data.items()}
+            self._mtime = mtime
+            self.version += 1
+
+    def get(self, job_role):
+        """Get the requirements for a role, or None if it is unknown"""
+        self._refresh()
+        return self._roles.get(job_role)
+
+    def roles(self):
+        """Get all role requirements keyed by role name"""
+        self._refresh()
+        return dict(self._roles)
+
+    def role_names(self):
+        """Get the names of all known roles"""
+        self._refresh()
+        return list(self._roles)
+
+    def current_version(self):
+        """Get the version of the loaded roles, reloading the file if it changed"""
+        self._refresh()
+        return self.version
+
+class RoleScoringEngine:
+    """
+    Scores a set of user skills against every role at once.
+
+    Each role's core_skills/tools/advanced_skills become rows of a sparse
+    matrix over the skill vocabulary, so per-category match counts for all
+    roles come from a single sparse matrix-vector product. Scores use the
+    same category weights as get_detailed_skill_analysis.
+    """
+    def __init__(self, registry):
+        self.registry = registry
+        self._version = None
+        self._lock = threading.Lock()
+
+    def _ensure_current(self):
+        version = self.registry.current_version()
+        if version == self._version:
+            return
+
+        with self._lock:
+            if version == self._version:
+                return
+            self._build(self.registry.roles())
+            self._version = version
+
+    def _build(self, roles):
+        scored_roles = [role for role in roles.values() if not role.is_legacy]
+        role_count = len(scored_roles)
+
+        vocabulary = {}
+        rows = []
+        columns = []
+        sizes = np.zeros((len(SKILL_CATEGORIES), role_count), dtype=np.int64)
+        present = np.zeros((len(SKILL_CATEGORIES), role_count), dtype=bool)
+
+        for category_index, category in enumerate(SKILL_CATEGORIES):
+            for role_index, role in enumerate(scored_roles):
+                if category not in role.categories:
+                    continue
+                skills = role.categories[category]
+                present[category_index, role_index] = True
+                sizes[category_index, role_index] = len(skills)
+                row = category_index * role_count + role_index
+                for skill in skills:
+                    rows.append(row)
+                    columns.append(vocabulary.setdefault(skill.lower(), len(vocabulary)))
+
+        # Duplicate (row, column) entries are summed, matching how repeated
+        # skills in a category are counted by the per-role analysis
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, columns)),
+            shape=(len(SKILL_CATEGORIES) * role_count, len(vocabulary))
+        )
+        self.vocabulary = vocabulary
+        self.role_names = [role.name for role in scored_roles]
+        self.role_index = {name: index for index, name in enumerate(self.role_names)}
+        self.legacy_roles = [role.name for role in roles.values() if role.is_legacy]
+        self.sizes = sizes
+        self.present = present
+
+    def encode(self, user_skills):
+        """Encode user skills as a binary vector over the skill vocabulary"""
+        self._ensure_current()
+        vector = np.zeros(len(self.vocabulary), dtype=np.int64)
+        for skill in user_skills:
+            index = self.vocabulary.get(skill.lower())
+            if index is not None:
+                vector[index] = 1
+        return vector
+
+    def encode_many(self, skill_lists):
+        """Encode several skill lists as a sparse (users x vocabulary) matrix"""
+        self._ensure_current()
+        rows = []
+        columns = []
+        for row, user_skills in enumerate(skill_lists):
+            for index in {self.vocabulary.get(skill.lower()) for skill in user_skills}:
+                if index is not None:
+                    rows.append(row)
+                    columns.append(index)
+        return sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, columns)),
+            shape=(len(skill_lists), len(self.vocabulary))
+        )
+
+    def score_vector(self, user_vector):
+        """Weighted overall scores for every scored role, in role_names order"""
+        return self.score_matrix(np.asarray(user_vector).reshape(1, -1))[0]
+
+    def score_matrix(self, user_matrix):
+        """
+        Weighted overall scores for several users at once, as a
+        (users x roles) array with columns in role_names order
+        """
+        self._ensure_current()
+        role_count = len(self.role_names)
+        counts = self.matrix @ user_matrix.T
+        if sparse.issparse(counts):
+            counts = counts.toarray()
+        counts = np.asarray(counts).reshape(len(SKILL_CATEGORIES), role_count, -1)
+
+        total_score = np.zeros(counts.shape[1:])
+        total_weight = np.zeros(counts.shape[1:])
+        for category_index, category in enumerate(SKILL_CATEGORIES):
+            sizes = self.sizes[category_index][:, None]
+            present = self.present[category_index][:, None]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                category_score = np.where(sizes > 0, (counts[category_index] / sizes) * 100, 100.0)
+            weight = CATEGORY_WEIGHTS.get(category, 0.33)
+            total_score += np.where(present, category_score * weight, 0.0)
+            total_weight += np.where(present, weight, 0.0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            overall = np.where(total_weight > 0, total_score / total_weight, 0.0)
+        return overall.astype(np.int64).T
+
+    def score_roles(self, user_skills, roles=None):
+        """
+        Score user skills against roles, returning {role: overall_score}
+        in the order the roles were given
+        """
+        scores = self.score_vector(self.encode(user_skills))
+
+        if roles is None:
+            roles = self.role_names + self.legacy_roles
+
+        results = {}
+        for role in roles:
+            index = self.role_index.get(role)
+            if index is not None:
+                results[role] = int(scores[index])
+            elif role in self.legacy_roles:
+                # Old list-format roles keep their match_skills score
+                results[role] = match_skills(user_skills, role)[2]
+        return results
+
+    def best_role(self, user_skills, roles=None):
+        """
+        Get the highest scoring role as (role, score), or (None, 0) when no
+        role scores above zero
+        """
+        best_role = None
+        best_score = 0
+        for role, score in self.score_roles(user_skills, roles).items():
+            if score > best_score:
+                best_score = score
+                best_role = role
+        return best_role, best_score
+
+# Shared role registry
+role_registry = RoleRegistry()
+
+# Shared all-roles scoring engine
+role_scoring_engine = RoleScoringEngine(role_registry)
+
+def find_best_role(user_skills, roles=None):
+    """
+    Find the best matching role for the given skills
+    """
+    return role_scoring_engine.best_role(user_skills, roles)
 
 def match_skills(user_skills, job_role):
     """
     Enhanced skill matching with detailed analysis
     """
     try:
-        # Load job roles data
-        data_path = os.path.join("assets", "job_roles_data.json")
-        with open(data_path, "r") as f:
-            job_data = json.load(f)
+        role = role_registry.get(job_role)
         
-        if job_role not in job_data:
+        if role is None:
             return [], user_skills, 0
         
-        role_data = job_data[job_role]
-        
-        # Extract all required skills from different categories
-        required_skills = []
-        if isinstance(role_data, dict):
-            # New enhanced format
-            required_skills.extend(role_data.get('core_skills', []))
-            required_skills.extend(role_data.get('tools', []))
-            required_skills.extend(role_data.get('advanced_skills', []))
-        else:
-            # Old format (list of skills)
-            required_skills = role_data
-        
         # Find matches and missing skills
-        user_skills_lower = [skill.lower() for skill in user_skills]
-        required_skills_lower = [skill.lower() for skill in required_skills]
-        
-        matched = []
-        for skill in required_skills:
-            if skill.lower() in user_skills_lower:
-                matched.append(skill)
-        
-        missing = []
-        for skill in required_skills:
-            if skill.lower() not in user_skills_lower:
-                missing.append(skill)
+        user_skills_lower = {skill.lower() for skill in user_skills}
+        matched, missing = role.split_skills(role.required_skills, user_skills_lower)
         
         # Calculate match percentage using enhanced scoring
-        match_percent = calculate_skill_score(user_skills, required_skills)
+        match_percent = role.skill_score(user_skills)
         
         return matched, missing, match_percent
         
@@ -57,16 +337,12 @@ def get_detailed_skill_analysis(user_skills, job_role):
     Get detailed analysis of skill matching
     """
     try:
-        data_path = os.path.join("assets", "job_roles_data.json")
-        with open(data_path, "r") as f:
-            job_data = json.load(f)
+        role = role_registry.get(job_role)
         
-        if job_role not in job_data:
+        if role is None:
             return {}
         
-        role_data = job_data[job_role]
-        
-        if not isinstance(role_data, dict):
+        if role.is_legacy:
             # Handle old format
             matched, missing, score = match_skills(user_skills, job_role)
             return {
@@ -85,27 +361,15 @@ def get_detailed_skill_analysis(user_skills, job_role):
             'recommendations': []
         }
         
-        skill_categories = ['core_skills', 'tools', 'advanced_skills']
-        user_skills_lower = [skill.lower() for skill in user_skills]
+        user_skills_lower = {skill.lower() for skill in user_skills}
         
         total_score = 0
         total_weight = 0
         
-        for category in skill_categories:
-            if category not in role_data:
-                continue
-                
-            category_skills = role_data[category]
-            category_matched = []
-            category_missing = []
-            
-            for skill in category_skills:
-                if skill.lower() in user_skills_lower:
-                    category_matched.append(skill)
-                    analysis['matched_skills'].append(skill)
-                else:
-                    category_missing.append(skill)
-                    analysis['missing_skills'].append(skill)
+        for category, category_skills in role.categories.items():
+            category_matched, category_missing = role.split_skills(category_skills, user_skills_lower)
+            analysis['matched_skills'].extend(category_matched)
+            analysis['missing_skills'].extend(category_missing)
             
             # Calculate category score
             if category_skills:
@@ -113,14 +377,7 @@ def get_detailed_skill_analysis(user_skills, job_role):
             else:
                 category_score = 100
             
-            # Weight categories differently
-            weights = {
-                'core_skills': 0.5,
-                'tools': 0.3,
-                'advanced_skills': 0.2
-            }
-            
-            weight = weights.get(category, 0.33)
+            weight = CATEGORY_WEIGHTS.get(category, 0.33)
             total_score += category_score * weight
             total_weight += weight
             
@@ -134,7 +391,7 @@ def get_detailed_skill_analysis(user_skills, job_role):
         analysis['overall_score'] = int(total_score / total_weight) if total_weight > 0 else 0
         
         # Generate recommendations
-        analysis['recommendations'] = generate_skill_recommendations(analysis, role_data)
+        analysis['recommendations'] = generate_skill_recommendations(analysis, role.data)
         
         return analysis
         
@@ -188,17 +445,19 @@ def get_role_comparison(user_skills, roles_to_compare=None):
         roles_to_compare = ["Data Analyst", "Backend Developer", "ML Engineer", "Frontend Developer", "DevOps Engineer"]
     
     comparison_results = {}
+    scores = role_scoring_engine.score_roles(user_skills, roles_to_compare)
+    user_skills_lower = {skill.lower() for skill in user_skills}
     
-    for role in roles_to_compare:
-        analysis = get_detailed_skill_analysis(user_skills, role)
-        if analysis:
-            comparison_results[role] = {
-                'score': analysis['overall_score'],
-                'matched_count': len(analysis['matched_skills']),
-                'missing_count': len(analysis['missing_skills']),
-                'top_matches': analysis['matched_skills'][:5],
-                'key_missing': analysis['missing_skills'][:3]
-            }
+    for role_name, score in scores.items():
+        role = role_registry.get(role_name)
+        matched, missing = role.split_skills(role.required_skills, user_skills_lower)
+        comparison_results[role_name] = {
+            'score': score,
+            'matched_count': len(matched),
+            'missing_count': len(missing),
+            'top_matches': matched[:5],
+            'key_missing': missing[:3]
+        }
     
     # Sort by score
     sorted_roles = sorted(comparison_results.items(), key=lambda x: x[1]['score'], reverse=True)
@@ -319,10 +578,11 @@ def generate_learning_path(missing_skills):
     }
     
     path = []
-    missing_lower = [skill.lower() for skill in missing_skills]
+    # Prerequisites first within each level
+    missing_lower = order_skills(skill.lower() for skill in missing_skills)
     
     for level, skills in learning_order.items():
-        level_skills = [skill for skill in skills if skill in missing_lower]
+        level_skills = [skill for skill in missing_lower if skill in skills]
         if level_skills:
             path.append({
                 'level': level.title(),
@@ -0,0 +1,496 @@
+# sqlite_job_store.py - Persistent job posting storage backed by SQLite
+import json
+import logging
+import pathlib
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from job_store import (ORDER_BY_ID, ORDER_BY_POSTED_DATE, JobNumbers, is_entry_level_job, is_remote_job,
+                       job_text, location_matches, parse_job_numbers, posted_day, text_terms)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bytes of the database file SQLite may read through mmap instead of read()
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+
+# Stored in PRAGMA user_version; bump it whenever SCHEMA changes
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    role TEXT NOT NULL,
+    location_key TEXT NOT NULL,
+    company_key TEXT NOT NULL,
+    company_size_key TEXT NOT NULL,
+    job_type_key TEXT NOT NULL,
+    experience_key TEXT NOT NULL,
+    posted_date TEXT NOT NULL,  -- Normalized YYYY-MM-DD, '' when undated
+    salary_min INTEGER,
+    salary_max INTEGER,
+    experience_min REAL,
+    experience_max REAL,
+    is_remote INTEGER NOT NULL,
+    is_entry_level INTEGER NOT NULL,
+    requirement_count INTEGER NOT NULL,
+    external_key TEXT,
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_external_key ON jobs (external_key) WHERE external_key IS NOT NULL;
+CREATE INDEX IF NOT EXISTS jobs_role ON jobs (role);
+CREATE INDEX IF NOT EXISTS jobs_location ON jobs (location_key);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company_key);
+CREATE INDEX IF NOT EXISTS jobs_company_size ON jobs (company_size_key);
+CREATE INDEX IF NOT EXISTS jobs_job_type ON jobs (job_type_key);
+CREATE INDEX IF NOT EXISTS jobs_experience ON jobs (experience_key);
+-- Descending, so rowid order breaks ties in a forward scan for trending queries
+CREATE INDEX IF NOT EXISTS jobs_posted_date ON jobs (posted_date DESC);
+CREATE INDEX IF NOT EXISTS jobs_salary_min ON jobs (salary_min);
+CREATE INDEX IF NOT EXISTS jobs_salary_max ON jobs (salary_max);
+CREATE INDEX IF NOT EXISTS jobs_experience_min ON jobs (experience_min);
+CREATE INDEX IF NOT EXISTS jobs_experience_max ON jobs (experience_max);
+CREATE INDEX IF NOT EXISTS jobs_entry_level ON jobs (is_entry_level);
+
+CREATE TABLE IF NOT EXISTS job_skills (
+    skill TEXT NOT NULL,
+    job_id INTEGER NOT NULL,
+    PRIMARY KEY (skill, job_id)
+) WITHOUT ROWID;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5 (title, description, requirements);
+
+-- Distinct column values with their posting counts, in first-seen order
+CREATE TABLE IF NOT EXISTS job_facets (
+    facet TEXT NOT NULL,
+    value TEXT NOT NULL,
+    job_count INTEGER NOT NULL,
+    UNIQUE (facet, value)
+);
+
+CREATE TABLE IF NOT EXISTS job_counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Every table SCHEMA creates, dropped before a rebuild
+SCHEMA_TABLES = ('jobs', 'job_skills', 'jobs_fts', 'job_facets', 'job_counters')
+
+# Lowercased columns matched by substring through their facet values
+SUBSTRING_FACETS = {
+    'location': 'location_key',
+    'company': 'company_key',
+    'company_size': 'company_size_key',
+    'job_type': 'job_type_key',
+    'experience': 'experience_key'
+}
+
+def _fts_query(text: str) -> str:
+    # Quote every term so user input cannot use FTS5 query syntax
+    return ' '.join(f'"{term}"' for term in text_terms(text))
+
+class ReadOnlyStoreError(Exception):
+    """Raised when writing to a store opened read-only over a catalog snapshot"""
+
+class SQLiteJobStore:
+    """
+    Job postings stored in a SQLite database, with the same interface as
+    InMemoryJobStore.
+
+    Filter columns, parsed salary and experience bounds and the posting date
+    are indexed columns; the full posting is kept as JSON and only decoded
+    for returned rows. Title, description and requirements are indexed with
+    FTS5. Filtering, ordering and pagination run in SQL, so catalogs far
+    larger than memory can be queried. Distinct values and market
+    aggregates are kept as running counts in the database.
+
+    A read-only store opens a prebuilt catalog snapshot as immutable and
+    memory-mapped, so SQLite reads pages straight from the OS page cache,
+    one copy shared by every process on the host. Writing to it raises
+    ReadOnlyStoreError.
+
+    The schema version is kept in PRAGMA user_version. A writable database
+    from another version is rebuilt from its stored postings, keeping their
+    ids and external keys; a snapshot from another version is rejected.
+    """
+    def __init__(self, db_path: str, location_mapping: Dict[str, List[str]], read_only: bool = False,
+                 mmap_size: int = DEFAULT_MMAP_SIZE):
+        self.db_path = db_path
+        self.location_mapping = location_mapping
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        if read_only:
+            uri = pathlib.Path(db_path).resolve().as_uri() + '?mode=ro&immutable=1'
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+            self._check_schema()
+
+    def _check_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
+            return
+        if self.read_only:
+            raise ValueError(f"{self.db_path} has job store schema version {version}, expected "
+                             f"{SCHEMA_VERSION}; rebuild it with `python catalog_snapshot.py build`")
+
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        rows = []
+        if columns:
+            key_column = 'external_key' if 'external_key' in columns else 'NULL'
+            rows = self._conn.execute(f"SELECT id, role, {key_column}, data FROM jobs ORDER BY id").fetchall()
+            logger.info(f"Rebuilding {self.db_path} from schema version {version} to {SCHEMA_VERSION} "
+                        f"({len(rows)} jobs)")
+
+        # One transaction, so a failed rebuild leaves the old database as it was
+        drops = ''.join(f"DROP TABLE IF EXISTS {table};\n" for table in SCHEMA_TABLES)
+        self._conn.executescript(f"BEGIN;\n{drops}{SCHEMA}\nPRAGMA user_version = {SCHEMA_VERSION};")
+        cursor = self._conn.cursor()
+        for job_id, role, key, data in rows:
+            self._insert(cursor, role, json.loads(data), key, job_id)
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise ReadOnlyStoreError(f"{self.db_path} is a read-only catalog snapshot")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        return self._counter('jobs')
+
+    def _counter(self, name: str) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM job_counters WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else 0
+
+    def _add_counter(self, cursor, name: str, delta: int) -> None:
+        cursor.execute(
+            "INSERT INTO job_counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+            (name, delta)
+        )
+
+    def _add_facet(self, cursor, facet: str, value: str, delta: int) -> None:
+        cursor.execute(
+            "INSERT INTO job_facets (facet, value, job_count) VALUES (?, ?, ?) "
+            "ON CONFLICT (facet, value) DO UPDATE SET job_count = job_count + excluded.job_count",
+            (facet, value, delta)
+        )
+        if delta < 0:
+            cursor.execute("DELETE FROM job_facets WHERE facet = ? AND value = ? AND job_count <= 0", (facet, value))
+
+    def _update_aggregates(self, cursor, role: str, job: Dict, numbers: JobNumbers, delta: int) -> None:
+        self._add_facet(cursor, 'role', role, delta)
+        self._add_facet(cursor, 'location_display', job.get('location', 'Unknown'), delta)
+        self._add_facet(cursor, 'company_size_display', job.get('company_size', 'Unknown'), delta)
+        for field in SUBSTRING_FACETS:
+            self._add_facet(cursor, field, job.get(field, '').lower(), delta)
+
+        self._add_counter(cursor, 'jobs', delta)
+        if numbers.salary_min is not None:
+            # Twice the midpoint, so the running total stays an exact integer
+            self._add_counter(cursor, 'salary_midpoint_total', delta * (numbers.salary_min + numbers.salary_max))
+            self._add_counter(cursor, 'salary_count', delta)
+        if is_remote_job(job, self.location_mapping):
+            self._add_counter(cursor, 'remote_jobs', delta)
+        if is_entry_level_job(job):
+            self._add_counter(cursor, 'entry_level_jobs', delta)
+
+    def _insert(self, cursor, role: str, job: Dict, key: Optional[str] = None, job_id: Optional[int] = None) -> int:
+        numbers = parse_job_numbers(job)
+        requirements = {requirement.lower() for requirement in job.get('requirements', [])}
+        # A None id is assigned by AUTOINCREMENT
+        cursor.execute(
+            "INSERT INTO jobs (id, role, location_key, company_key, company_size_key, job_type_key, "
+            "experience_key, posted_date, salary_min, salary_max, experience_min, experience_max, "
+            "is_remote, is_entry_level, requirement_count, external_key, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (job_id, role, job.get('location', '').lower(), job.get('company', '').lower(),
+             job.get('company_size', '').lower(), job.get('job_type', '').lower(),
+             job.get('experience', '').lower(), posted_day(job),
+             numbers.salary_min, numbers.salary_max, numbers.experience_min, numbers.experience_max,
+             int(is_remote_job(job, self.location_mapping)), int(is_entry_level_job(job)),
+             len(job.get('requirements', [])), key, json.dumps(job))
+        )
+        job_id = cursor.lastrowid
+
+        cursor.executemany("INSERT INTO job_skills (skill, job_id) VALUES (?, ?)",
+                           [(requirement, job_id) for requirement in requirements])
+        text = job_text(job)
+        cursor.execute("INSERT INTO jobs_fts (rowid, title, description, requirements) VALUES (?, ?, ?, ?)",
+                       (job_id, text['title'], text['description'], text['requirements']))
+        self._update_aggregates(cursor, role, job, numbers, 1)
+        return job_id
+
+    def load(self, job_database: Dict[str, List[Dict]]) -> None:
+        """Add every posting from a {role: [job, ...]} mapping in one transaction"""
+        self._check_writable()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            for role, jobs in job_database.items():
+                for job in jobs:
+                    self._insert(cursor, role, job)
+
+    def add_job(self, role: str, job: Dict, key: Optional[str] = None) -> int:
+        """Store a posting and return its id"""
+        self._check_writable()
+        with self._lock, self._conn:
+            return self._insert(self._conn.cursor(), role, job, key)
+
+    def _delete(self, cursor, job_id: int) -> Optional[Dict]:
+        row = cursor.execute("SELECT role, data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        role, job = row[0], json.loads(row[1])
+
+        cursor.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        cursor.execute("DELETE FROM job_skills WHERE job_id = ?", (job_id,))
+        cursor.execute("DELETE FROM jobs_fts WHERE rowid = ?", (job_id,))
+        self._update_aggregates(cursor, role, job, parse_job_numbers(job), -1)
+        return job
+
+    def remove_job(self, job_id: int) -> Optional[Dict]:
+        """Delete a posting and its index entries"""
+        self._check_writable()
+        with self._lock, self._conn:
+            return self._delete(self._conn.cursor(), job_id)
+
+    def upsert_job(self, role: str, job: Dict, key: str) -> int:
+        """
+        Add a posting identified by an external key, replacing the posting
+        stored under that key if it changed. Returns the posting's id, which
+        is unchanged when the posting is.
+        """
+        self._check_writable()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            row = cursor.execute("SELECT id, role, data FROM jobs WHERE external_key = ?", (key,)).fetchone()
+            if row is not None:
+                if row[1] == role and json.loads(row[2]) == job:
+                    return row[0]
+                self._delete(cursor, row[0])
+            return self._insert(cursor, role, job, key)
+
+    def key_id(self, key: str) -> Optional[int]:
+        """Id of the posting stored under an external key"""
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM jobs WHERE external_key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _query_ids(self, sql: str, parameters: Iterable = ()) -> List[int]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute(sql, list(parameters))]
+
+    def get(self, job_id: int) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_role(self, job_id: int) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT role FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def get_numbers(self, job_id: int) -> Optional[JobNumbers]:
+        """Parsed salary (USD per year) and experience (years) for a posting"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT salary_min, salary_max, experience_min, experience_max FROM jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+        return JobNumbers(*row) if row else None
+
+    def jobs(self, job_ids: Iterable[int]) -> List[Dict]:
+        job_ids = list(job_ids)
+        with self._lock:
+            rows = self._conn.execute("SELECT id, data FROM jobs WHERE id IN (SELECT value FROM json_each(?))",
+                                      (json.dumps(job_ids),))
+            found = {job_id: json.loads(data) for job_id, data in rows}
+        return [found[job_id] for job_id in job_ids if job_id in found]
+
+    def roles(self) -> List[str]:
+        return self._facet_values('role')
+
+    def _facet_values(self, facet: str) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT value FROM job_facets WHERE facet = ? ORDER BY rowid", (facet,))
+            return [row[0] for row in rows]
+
+    def _facet_counts(self, facet: str) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT value, job_count FROM job_facets WHERE facet = ? ORDER BY rowid", (facet,)
+            )
+            return dict(rows.fetchall())
+
+    def market_stats(self) -> Dict:
+        """Aggregates over the current postings, read from running counts"""
+        with self._lock:
+            counters = dict(self._conn.execute("SELECT name, value FROM job_counters").fetchall())
+        salary_count = counters.get('salary_count', 0)
+        return {
+            'total_jobs': counters.get('jobs', 0),
+            'location_distribution': self._facet_counts('location_display'),
+            'company_size_distribution': self._facet_counts('company_size_display'),
+            'average_salary': counters.get('salary_midpoint_total', 0) / (2 * salary_count) if salary_count else 0,
+            'remote_jobs': counters.get('remote_jobs', 0),
+            'entry_level_jobs': counters.get('entry_level_jobs', 0)
+        }
+
+    @staticmethod
+    def _limit_clause(limit: Optional[int], offset: int) -> str:
+        if limit is None and not offset:
+            return ""
+        return f" LIMIT {-1 if limit is None else int(limit)} OFFSET {int(offset)}"
+
+    def _ordered_ids(self, clauses: List[str], parameters: List, order_by: str, after: Optional[Tuple],
+                     limit: Optional[int], offset: int) -> List[int]:
+        # Keyset pagination: the cursor becomes a range condition on the sort key
+        clauses = list(clauses)
+        parameters = list(parameters)
+        if order_by == ORDER_BY_POSTED_DATE:
+            if after:
+                clauses.append("posted_date <= ? AND (posted_date < ? OR id > ?)")
+                parameters.extend([after[0], after[0], after[1]])
+            order_clause = " ORDER BY posted_date DESC, id"
+        else:
+            if after:
+                clauses.append("id > ?")
+                parameters.append(after[0])
+            order_clause = " ORDER BY id"
+
+        sql = "SELECT id FROM jobs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        return self._query_ids(sql + order_clause + self._limit_clause(limit, offset), parameters)
+
+    def job_ids(self, role: Optional[str] = None, limit: Optional[int] = None, offset: int = 0,
+                after: Optional[Tuple] = None) -> List[int]:
+        """
+        Posting ids in insertion order, optionally for one role. `after` is
+        an ORDER_BY_ID cursor key; only ids past it are returned.
+        """
+        clauses, parameters = (["role = ?"], [role]) if role is not None else ([], [])
+        return self._ordered_ids(clauses, parameters, ORDER_BY_ID, after, limit, offset)
+
+    def trending_ids(self, limit: Optional[int] = None, offset: int = 0,
+                     after: Optional[Tuple] = None) -> List[int]:
+        """Posting ids, most recently posted first, past an ORDER_BY_POSTED_DATE cursor key"""
+        return self._ordered_ids([], [], ORDER_BY_POSTED_DATE, after, limit, offset)
+
+    def entry_level_ids(self, limit: Optional[int] = None, offset: int = 0,
+                        after: Optional[Tuple] = None) -> List[int]:
+        """Ids of entry-level postings in insertion order"""
+        return self._ordered_ids(["is_entry_level = 1"], [], ORDER_BY_ID, after, limit, offset)
+
+    def company_ids(self, company_name: str, limit: Optional[int] = None, offset: int = 0,
+                    order_by: str = ORDER_BY_ID, after: Optional[Tuple] = None) -> List[int]:
+        """Ids of postings whose company contains company_name"""
+        return self.search(company=company_name, limit=limit, offset=offset, order_by=order_by, after=after)
+
+    def posted_before(self, day: str) -> List[int]:
+        """Ids of dated postings posted earlier than day (YYYY-MM-DD)"""
+        return self._query_ids("SELECT id FROM jobs WHERE posted_date != '' AND posted_date < ? ORDER BY id", (day,))
+
+    def posted_since(self, day: str, limit: Optional[int] = None, offset: int = 0,
+                     after: Optional[Tuple] = None) -> List[int]:
+        """Ids of postings posted on or after day (YYYY-MM-DD), newest first"""
+        return self._ordered_ids(["posted_date >= ?"], [day], ORDER_BY_POSTED_DATE, after, limit, offset)
+
+    def _substring_values(self, field: str, value: str) -> List[str]:
+        # Match against the distinct values, then filter postings through the index
+        value = value.lower()
+        if field == 'location':
+            return [key for key in self._facet_values(field)
+                    if location_matches(self.location_mapping, value, key)]
+        with self._lock:
+            rows = self._conn.execute("SELECT value FROM job_facets WHERE facet = ? AND instr(value, ?) > 0",
+                                      (field, value))
+            return [row[0] for row in rows]
+
+    def search(self, role: str = None, location: str = None, experience: str = None,
+               salary_min: int = None, company_size: str = None, job_type: str = None,
+               salary_max: int = None, text: str = None, limit: Optional[int] = None,
+               offset: int = 0, company: str = None, order_by: str = ORDER_BY_ID,
+               after: Optional[Tuple] = None, experience_min: float = None,
+               experience_max: float = None) -> List[int]:
+        """
+        Ids of postings matching every given filter, in insertion order or
+        newest first (ORDER_BY_POSTED_DATE), past the `after` cursor key.
+        Salary bounds are in US dollars per year and experience bounds in
+        years, as in InMemoryJobStore.search; `text` must match every word
+        somewhere in the title, description or requirements.
+        """
+        clauses = []
+        parameters = []
+        if role:
+            clauses.append("role = ?")
+            parameters.append(role)
+
+        substring_filters = {'location': location, 'experience': experience, 'company_size': company_size,
+                             'job_type': job_type, 'company': company}
+        for field, value in substring_filters.items():
+            if not value:
+                continue
+            keys = self._substring_values(field, value)
+            if not keys:
+                return []
+            clauses.append(f"{SUBSTRING_FACETS[field]} IN (SELECT value FROM json_each(?))")
+            parameters.append(json.dumps(keys))
+
+        if salary_min:
+            clauses.append("salary_min >= ?")
+            parameters.append(salary_min)
+        if salary_max:
+            clauses.append("salary_max <= ?")
+            parameters.append(salary_max)
+        if experience_min is not None:
+            clauses.append("experience_min >= ?")
+            parameters.append(experience_min)
+        if experience_max is not None:
+            clauses.append("experience_max <= ?")
+            parameters.append(experience_max)
+        if text:
+            query = _fts_query(text)
+            if query:
+                clauses.append("id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+                parameters.append(query)
+
+        return self._ordered_ids(clauses, parameters, order_by, after, limit, offset)
+
+    def scored_jobs_for_skills(self, skills: Iterable[str], limit: int = 10,
+                               after: Optional[Tuple] = None) -> List[Tuple[int, float]]:
+        """
+        (id, score) for the postings whose requirements best match the given
+        skills, scored as matched distinct skills / number of requirements
+        and past the `after` (score, id) cursor key; ties keep insertion order
+        """
+        skills = sorted({skill.lower() for skill in skills})
+        having = ""
+        parameters = [json.dumps(skills)]
+        if after:
+            having = " HAVING score < ? OR (score = ? AND job_skills.job_id > ?)"
+            parameters.extend([after[0], after[0], after[1]])
+        parameters.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_skills.job_id, CAST(COUNT(*) AS REAL) / jobs.requirement_count AS score "
+                "FROM job_skills JOIN jobs ON jobs.id = job_skills.job_id "
+                "WHERE job_skills.skill IN (SELECT value FROM json_each(?)) "
+                "GROUP BY job_skills.job_id" + having + " "
+                "ORDER BY score DESC, job_skills.job_id "
+                "LIMIT ?",
+                parameters
+            )
+            return rows.fetchall()
+
+    def top_jobs_for_skills(self, skills: Iterable[str], limit: int = 10) -> List[int]:
+        """Ids of the postings whose requirements best match the given skills"""
+        return [job_id for job_id, _ in self.scored_jobs_for_skills(skills, limit)]
@@ -0,0 +1,15 @@
+from ats_checker import ATS_TERMS, _count_terms
+
+def count_each(text):
+    return {term: text.count(term) for term in ATS_TERMS if text.count(term)}
+
+def test_single_scan_counts_match_per_term_counts():
+    texts = [
+        "led and managed a team; was responsible for analytical thinking and data analysis",
+        "experienceexperience  skills:skills education/work history led-led",
+        "analyticalanalytical thinking, sqlsql, machine learning engineer, rest api apis",
+        "",
+        " | ".join(sorted(ATS_TERMS)),
+    ]
+    for text in texts:
+        assert _count_terms(text) == count_each(text)
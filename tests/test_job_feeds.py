@@ -0,0 +1,152 @@
+import pytest
+
+from feed_stub_server import StubFeedServer
+from job_feeds import FeedIngestor
+from job_store import InMemoryJobStore
+
+LOCATION_MAPPING = {'remote': ['remote', 'work from home']}
+
+def make_job(job_id, title='Data Analyst', salary='$60,000 - $80,000'):
+    return {
+        'id': job_id, 'company': 'Acme', 'title': title, 'location': 'Remote', 'salary': salary,
+        'experience': '1-3 years', 'posted_date': '2026-10-01', 'requirements': ['python', 'sql'],
+        'company_size': 'Startup', 'job_type': 'Full-time'
+    }
+
+@pytest.fixture
+def store():
+    return InMemoryJobStore(LOCATION_MAPPING)
+
+@pytest.fixture
+def server():
+    with StubFeedServer() as stub:
+        yield stub
+
+def test_unchanged_feed_is_not_modified_by_etag(server, store):
+    server.set_feed('/a.json', {'Data Analyst': [make_job(1)]})
+    ingestor = FeedIngestor(store, rate_per_host=None)
+    url = server.url('/a.json')
+
+    first, = ingestor.refresh_feeds([url])
+    second, = ingestor.refresh_feeds([url])
+
+    assert first['status'] == 'updated' and first['added'] == 1
+    assert second['status'] == 'not_modified' and second['http_status'] == 304
+    assert server.requests[-1]['headers'].get('If-None-Match') == server.get_feed('/a.json')['etag']
+    assert len(store) == 1
+
+def test_unchanged_feed_is_not_modified_by_last_modified(server, store):
+    server.set_feed('/a.json', {'Data Analyst': [make_job(1)]})
+    ingestor = FeedIngestor(store, rate_per_host=None)
+    url = server.url('/a.json')
+    ingestor.refresh_feeds([url])
+
+    # Only the date validator is sent back
+    del ingestor._validators[url]['If-None-Match']
+    result, = ingestor.refresh_feeds([url])
+
+    assert result['status'] == 'not_modified'
+    headers = server.requests[-1]['headers']
+    assert 'If-None-Match' not in headers and 'If-Modified-Since' in headers
+
+def test_changed_feed_is_fetched_again(server, store):
+    server.set_feed('/a.json', {'Data Analyst': [make_job(1)]})
+    ingestor = FeedIngestor(store, rate_per_host=None)
+    url = server.url('/a.json')
+    ingestor.refresh_feeds([url])
+
+    server.set_feed('/a.json', {'Data Analyst': [make_job(1, title='Senior Data Analyst')]})
+    result, = ingestor.refresh_feeds([url])
+
+    assert result['http_status'] == 200 and result['updated'] == 1
+    assert [job['title'] for job in store.jobs(store.job_ids())] == ['Senior Data Analyst']
+
+def test_requests_to_one_host_are_rate_limited(server, store):
+    paths = [f'/feed-{index}.json' for index in range(5)]
+    for index, path in enumerate(paths):
+        server.set_feed(path, {'Data Analyst': [make_job(index)]})
+    ingestor = FeedIngestor(store, rate_per_host=10.0)
+
+    ingestor.refresh_feeds([server.url(path) for path in paths])
+
+    times = sorted(request['time'] for request in server.requests)
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert len(times) == 5
+    assert min(gaps) >= 0.08
+
+def test_rate_limit_holds_when_the_pool_is_saturated(store):
+    # A feed on another host fills the pool alongside the first feed, so
+    # the rest queue for a connection and are all freed at the same moment
+    paths = [f'/feed-{index}.json' for index in range(4)]
+    with StubFeedServer({path: {'Data Analyst': [make_job(index)]} for index, path in enumerate(paths)},
+                        delay=0.3) as server:
+        other_host = server.url(paths[1]).replace('127.0.0.1', 'localhost')
+        ingestor = FeedIngestor(store, concurrency=2, rate_per_host=10.0)
+        ingestor.refresh_feeds([server.url(paths[0]), other_host, server.url(paths[2]), server.url(paths[3])])
+
+    times = sorted(request['time'] for request in server.requests if request['path'] != paths[1])
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert len(times) == 3
+    assert min(gaps) >= 0.08
+
+def test_concurrent_requests_are_bounded_by_the_pool(store):
+    paths = [f'/feed-{index}.json' for index in range(8)]
+    with StubFeedServer({path: {'Data Analyst': [make_job(index)]} for index, path in enumerate(paths)},
+                        delay=0.1) as server:
+        ingestor = FeedIngestor(store, concurrency=3, rate_per_host=None)
+        results = ingestor.refresh_feeds([server.url(path) for path in paths])
+
+    assert all(result['status'] == 'updated' for result in results)
+    assert 1 < server.max_in_flight <= 3
+
+def test_upserts_and_removals_are_counted(server, store):
+    url = server.url('/a.json')
+    server.set_feed('/a.json', {'Data Analyst': [make_job(1), make_job(2), make_job(3)]})
+    ingestor = FeedIngestor(store, rate_per_host=None)
+    first, = ingestor.refresh_feeds([url])
+
+    # 1 unchanged, 2 changed, 3 dropped, 4 new
+    server.set_feed('/a.json', {'Data Analyst': [make_job(1), make_job(2, salary='$90,000 - $99,000'),
+                                                 make_job(4)]})
+    second, = ingestor.refresh_feeds([url])
+
+    assert (first['added'], first['updated'], first['unchanged'], first['removed']) == (3, 0, 0, 0)
+    assert (second['added'], second['updated'], second['unchanged'], second['removed']) == (1, 1, 1, 1)
+    assert sorted(job['id'] for job in store.jobs(store.job_ids())) == [1, 2, 4]
+
+def test_malformed_entries_are_skipped(server, store):
+    server.set_feed('/a.json', {'Data Analyst': 'not a list', 'Backend Developer': [42, make_job(1)]})
+    result, = FeedIngestor(store, rate_per_host=None).refresh_feeds([server.url('/a.json')])
+
+    assert result['status'] == 'updated'
+    assert result['skipped'] == 2 and result['added'] == 1
+    assert len(store) == 1
+
+def test_bad_feeds_fail_alone(server, store):
+    server.set_feed('/good.json', {'Data Analyst': [make_job(1)]})
+    server.set_feed('/list.json', [make_job(2)])
+    server.set_feed('/garbled.json', b'{"Data Analyst": [')
+    urls = [server.url(path) for path in ('/good.json', '/list.json', '/garbled.json', '/missing.json')]
+
+    results = FeedIngestor(store, rate_per_host=None).refresh_feeds(urls)
+
+    assert [result['status'] for result in results] == ['updated', 'error', 'error', 'error']
+    assert results[3]['http_status'] == 404
+    assert len(store) == 1
+
+def test_unexpected_errors_are_recorded_per_feed(server):
+    class FailingStore(InMemoryJobStore):
+        def upsert_job(self, role, job, key):
+            if role == 'Broken':
+                raise RuntimeError("store unavailable")
+            return super().upsert_job(role, job, key)
+
+    store = FailingStore(LOCATION_MAPPING)
+    server.set_feed('/good.json', {'Data Analyst': [make_job(1)]})
+    server.set_feed('/broken.json', {'Broken': [make_job(2)]})
+
+    good, broken = FeedIngestor(store, rate_per_host=None).refresh_feeds(
+        [server.url('/good.json'), server.url('/broken.json')])
+
+    assert good['status'] == 'updated' and good['added'] == 1
+    assert broken['status'] == 'error' and 'store unavailable' in broken['error']
@@ -0,0 +1,169 @@
+import base64
+import random
+
+import pytest
+
+from job_scraper import JobScraper
+from job_store import (ORDER_BY_ID, ORDER_BY_POSTED_DATE, InMemoryJobStore, encode_cursor, job_text,
+                       location_matches, parse_experience_range, parse_salary_range, posted_day, text_terms)
+
+LOCATION_MAPPING = {'remote': ['Remote', 'Work from Home'], 'bangalore': ['Bangalore', 'Bengaluru']}
+ROLES = ['Data Analyst', 'ML Engineer', 'Web Developer']
+LOCATIONS = ['Remote', 'Work from Home', 'Bangalore', 'Bengaluru', 'Mumbai', 'Pune']
+SALARIES = ['$40,000 - $60,000', '$85,000 - $125,000', '₹6.5 - 9.5 LPA', '$150,000', '']
+EXPERIENCES = ['0-1 years', '1-3 years', '2-4 years', '5+ years', 'Entry level', '']
+COMPANIES = ['Acme Analytics', 'Globex', 'Initech Labs', 'Umbrella Tech']
+SKILLS = ['python', 'sql', 'react', 'docker', 'tableau', 'pytorch']
+
+def make_jobs(seed, count):
+    rng = random.Random(seed)
+    jobs = []
+    for number in range(count):
+        jobs.append((rng.choice(ROLES), {
+            'company': rng.choice(COMPANIES),
+            'title': f"{rng.choice(['Senior', 'Junior', 'Lead'])} {rng.choice(['Engineer', 'Analyst'])} {number}",
+            'location': rng.choice(LOCATIONS),
+            'salary': rng.choice(SALARIES),
+            'experience': rng.choice(EXPERIENCES),
+            # Many postings share a day, and some have no usable date
+            'posted_date': rng.choice([f'2026-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}', '', 'soon']),
+            'requirements': rng.sample(SKILLS, rng.randint(1, 3)),
+            'company_size': rng.choice(['Startup', 'Mid-size', 'Large']),
+            'job_type': rng.choice(['Full-time', 'Contract', 'Internship'])
+        }))
+    return jobs
+
+@pytest.fixture
+def catalog():
+    """A store with some postings removed, and the {id: (role, job)} it should hold"""
+    store = InMemoryJobStore(LOCATION_MAPPING)
+    live = {}
+    for role, job in make_jobs(seed=7, count=300):
+        live[store.add_job(role, job)] = (role, job)
+    for job_id in list(live)[::7]:
+        store.remove_job(job_id)
+        del live[job_id]
+    return store, live
+
+def brute_force(live, order_by=ORDER_BY_ID, role=None, location=None, experience=None, salary_min=None,
+                salary_max=None, company_size=None, job_type=None, company=None, text=None,
+                experience_min=None, experience_max=None):
+    def matches(role_of, job):
+        salary_low, salary_high = parse_salary_range(job['salary'])
+        experience_low, experience_high = parse_experience_range(job['experience'])
+        terms = set(text_terms(' '.join(job_text(job).values())))
+        return all([
+            not role or role_of == role,
+            not location or location_matches(LOCATION_MAPPING, location.lower(), job['location'].lower()),
+            not experience or experience.lower() in job['experience'].lower(),
+            not salary_min or (salary_low is not None and salary_low >= salary_min),
+            not salary_max or (salary_high is not None and salary_high <= salary_max),
+            experience_min is None or (experience_low is not None and experience_low >= experience_min),
+            experience_max is None or (experience_high is not None and experience_high <= experience_max),
+            not company_size or company_size.lower() in job['company_size'].lower(),
+            not job_type or job_type.lower() in job['job_type'].lower(),
+            not company or company.lower() in job['company'].lower(),
+            not text or set(text_terms(text)) <= terms,
+        ])
+
+    job_ids = [job_id for job_id, (role_of, job) in sorted(live.items()) if matches(role_of, job)]
+    if order_by == ORDER_BY_POSTED_DATE:
+        # Newest first, undated last, ties in id order
+        job_ids.sort(key=lambda job_id: posted_day(live[job_id][1]), reverse=True)
+    return job_ids
+
+def random_filters(rng):
+    choices = {
+        'role': ROLES, 'location': ['remote', 'bangalore', 'mumbai', 'nowhere'],
+        'experience': ['years', '1-3', 'entry'], 'salary_min': [10000, 50000, 100000],
+        'salary_max': [60000, 125000], 'company_size': ['startup', 'large', 'size'],
+        'job_type': ['full', 'contract'], 'company': ['tech', 'acme', 'a'],
+        'text': ['python', 'senior engineer', 'sql docker', 'unknownword'],
+        'experience_min': [0, 1, 2, 5], 'experience_max': [1, 3, 4],
+    }
+    return {name: rng.choice(values) for name, values in choices.items() if rng.random() < 0.3}
+
+@pytest.mark.parametrize('order_by', [ORDER_BY_ID, ORDER_BY_POSTED_DATE])
+def test_search_matches_brute_force_filtering(catalog, order_by):
+    store, live = catalog
+    rng = random.Random(order_by)
+    for _ in range(300):
+        filters = random_filters(rng)
+        expected = brute_force(live, order_by, **filters)
+        assert store.search(order_by=order_by, **filters) == expected, filters
+
+        # Small pages take the ordered walk, large ones the materialized path
+        limit, offset = rng.choice([1, 3, 50]), rng.randint(0, 4)
+        page = store.search(order_by=order_by, limit=limit, offset=offset, **filters)
+        assert page == expected[offset:offset + limit], filters
+
+        # Resuming past a row, often close enough to the end to run out of postings
+        if expected:
+            row = rng.choice(expected)
+            after = (row,) if order_by == ORDER_BY_ID else (posted_day(live[row][1]), row)
+            rest = expected[expected.index(row) + 1:]
+            page = store.search(order_by=order_by, limit=limit, offset=offset, after=after, **filters)
+            assert page == rest[offset:offset + limit], filters
+
+@pytest.mark.parametrize('order_by', [ORDER_BY_ID, ORDER_BY_POSTED_DATE])
+def test_cursor_pages_cover_the_results_once(catalog, order_by):
+    store, live = catalog
+    scraper = JobScraper(job_store=store)
+    rng = random.Random(order_by)
+    for _ in range(40):
+        filters = {name: value for name, value in random_filters(rng).items()
+                   if name not in ('company', 'text')}
+        expected = [store.get(job_id) for job_id in brute_force(live, order_by, **filters)]
+        page_size = rng.choice([1, 4, 25])
+
+        jobs, cursor, pages = [], None, 0
+        while True:
+            page = scraper.search_jobs_with_filters_page(page_size=page_size, cursor=cursor,
+                                                         order_by=order_by, **filters)
+            assert len(page['jobs']) <= page_size
+            jobs.extend(page['jobs'])
+            pages += 1
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+
+        assert jobs == expected, filters
+        assert pages == max(1, -(-len(expected) // page_size))
+
+def test_cursor_survives_removal_of_its_row(catalog):
+    store, live = catalog
+    scraper = JobScraper(job_store=store)
+    first = scraper.search_jobs_with_filters_page(page_size=5, order_by=ORDER_BY_POSTED_DATE)
+    expected = brute_force(live, ORDER_BY_POSTED_DATE)
+
+    # The cursor is a sort key, so it still works once its posting is gone
+    store.remove_job(expected[4])
+    second = scraper.search_jobs_with_filters_page(page_size=5, cursor=first['next_cursor'],
+                                                   order_by=ORDER_BY_POSTED_DATE)
+    assert second['jobs'] == [store.get(job_id) for job_id in expected[5:10]]
+
+@pytest.mark.parametrize('cursor', [
+    'not a cursor!',
+    base64.urlsafe_b64encode(b'not json').decode('ascii'),
+    base64.urlsafe_b64encode(b'{"order": "id"}').decode('ascii'),
+    base64.urlsafe_b64encode(b'["id"]').decode('ascii'),
+])
+def test_invalid_cursor_is_rejected(catalog, cursor):
+    scraper = JobScraper(job_store=catalog[0])
+    with pytest.raises(ValueError, match='Invalid page cursor'):
+        scraper.search_jobs_with_filters_page(cursor=cursor)
+
+def test_cursor_from_another_ordering_is_rejected(catalog):
+    scraper = JobScraper(job_store=catalog[0])
+    page = scraper.search_jobs_with_filters_page(page_size=2, order_by=ORDER_BY_POSTED_DATE)
+    with pytest.raises(ValueError, match='ordering'):
+        scraper.search_jobs_with_filters_page(cursor=page['next_cursor'], order_by=ORDER_BY_ID)
+    with pytest.raises(ValueError, match='ordering'):
+        scraper.search_jobs_with_filters_page(cursor=encode_cursor('score', [0.5, 3]))
+
+def test_bad_page_request_is_rejected(catalog):
+    scraper = JobScraper(job_store=catalog[0])
+    with pytest.raises(ValueError, match='page_size'):
+        scraper.search_jobs_with_filters_page(page_size=0)
+    with pytest.raises(ValueError, match='Unknown job ordering'):
+        scraper.search_jobs_with_filters_page(order_by='salary')
@@ -0,0 +1,32 @@
+import pytest
+
+from learning_planner import SKILL_DEPENDENCIES, LearningPlanner, learning_planner
+
+# The prerequisites get_learning_path has always shown
+BASELINE_DEPENDENCIES = {
+    'python': [],
+    'sql': [],
+    'machine learning': ['python', 'statistics'],
+    'tensorflow': ['python', 'machine learning'],
+    'pytorch': ['python', 'machine learning'],
+    'data visualization': ['python'],
+    'react': ['javascript', 'html', 'css'],
+    'docker': ['linux basics'],
+    'kubernetes': ['docker'],
+    'aws': ['linux basics'],
+    'django': ['python'],
+    'flask': ['python']
+}
+
+def test_dependencies_match_the_baseline_learning_path():
+    assert SKILL_DEPENDENCIES == BASELINE_DEPENDENCIES
+
+def test_order_puts_transitive_prerequisites_first():
+    skills = ['Kubernetes', 'deep learning', 'TensorFlow', 'Python', 'statistics', 'Docker', 'linux basics']
+    assert learning_planner.order(skills) == [
+        'Python', 'statistics', 'TensorFlow', 'linux basics', 'Docker', 'Kubernetes', 'deep learning'
+    ]
+
+def test_cycle_is_rejected():
+    with pytest.raises(ValueError):
+        LearningPlanner(dependencies={'a': ['b'], 'b': ['a']})
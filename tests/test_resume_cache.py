@@ -0,0 +1,37 @@
+import json
+import os
+import threading
+
+from resume_cache import CACHE_VERSION, ResumeCache
+
+def make_record(number):
+    return {'version': CACHE_VERSION, 'text': f'resume {number} ' * 2000, 'skills': ['python', str(number)]}
+
+def test_cached_records_are_copies(tmp_path):
+    cache = ResumeCache(disk_dir=str(tmp_path))
+    record = make_record(1)
+    cache.put('key', record)
+    record['skills'].append('changed after put')
+    cache.get('key')['skills'].append('changed after get')
+
+    assert cache.get('key')['skills'] == ['python', '1']
+    assert ResumeCache(disk_dir=str(tmp_path)).get('key')['skills'] == ['python', '1']
+
+def test_concurrent_writers_of_one_key_leave_a_whole_entry(tmp_path):
+    # Separate caches over one directory, like worker processes sharing it
+    caches = [ResumeCache(disk_dir=str(tmp_path)) for _ in range(8)]
+
+    def write(number):
+        for _ in range(20):
+            caches[number].put('key', make_record(number))
+
+    threads = [threading.Thread(target=write, args=(number,)) for number in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(os.listdir(tmp_path)) == ['key.json']
+    with open(tmp_path / 'key.json') as f:
+        record = json.load(f)
+    assert record == make_record(int(record['skills'][1]))
@@ -0,0 +1,95 @@
+import json
+import os
+
+import resume_screening
+from resume_screening import ScreeningCheckpoint, run_screening, screen_resumes
+
+ROLES = ['Data Analyst']
+RESUME_TEXT = "Data analyst skilled in Python, SQL, Excel and Tableau with 3 years of experience."
+
+screen_resume = resume_screening.screen_resume
+
+def crash_on_marked(item, roles, timeout):
+    # Takes the worker process down with it, like a segfault in a PDF parser
+    if item['resume_id'].startswith('crash'):
+        os._exit(1)
+    # Crashes only the first time, when its marker file does not exist yet
+    if 'marker' in item and not os.path.exists(item['marker']):
+        open(item['marker'], 'w').close()
+        os._exit(1)
+    return screen_resume(item, roles, timeout)
+
+def write_source(path, resume_ids):
+    with open(path, 'w', encoding='utf-8') as f:
+        for resume_id in resume_ids:
+            f.write(json.dumps({'id': resume_id, 'text': RESUME_TEXT}) + '\n')
+    return str(path)
+
+def read_rows(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def test_resume_skips_checkpointed_resumes_and_drops_unrecorded_rows(tmp_path):
+    resume_ids = [f'r{number}' for number in range(6)]
+    source = write_source(tmp_path / 'resumes.jsonl', resume_ids)
+    output, checkpoint = str(tmp_path / 'out.jsonl'), str(tmp_path / 'out.checkpoint')
+
+    summary = screen_resumes(source, output, ROLES, workers=2, checkpoint=checkpoint)
+    assert summary['screened'] == 6 and summary['failed'] == {}
+
+    # Simulate a crash after the third resume was recorded and while the
+    # fourth one's rows were being written
+    with open(checkpoint, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    with open(checkpoint, 'w', encoding='utf-8') as f:
+        f.writelines(lines[:4])
+    offset = json.loads(lines[3])['offset']
+    with open(output, 'r+b') as f:
+        f.truncate(offset)
+        f.seek(offset)
+        f.write(b'{"resume_id": "torn"')
+    done = ScreeningCheckpoint(checkpoint).load()['done']
+    assert len(done) == 3
+
+    summary = screen_resumes(source, output, ROLES, workers=2, checkpoint=checkpoint, resume=True)
+    assert summary['skipped'] == 3 and summary['screened'] == 3
+
+    rows = read_rows(output)
+    assert sorted(row['resume_id'] for row in rows) == resume_ids
+    assert all(row['status'] == 'ok' for row in rows)
+    assert ScreeningCheckpoint(checkpoint).load()['done'] == set(resume_ids)
+
+def test_crashing_resume_fails_alone(monkeypatch):
+    monkeypatch.setattr(resume_screening, 'screen_resume', crash_on_marked)
+    items = [{'resume_id': f'r{number}', 'text': RESUME_TEXT} for number in range(20)]
+    items.insert(5, {'resume_id': 'crash', 'text': RESUME_TEXT})
+
+    results = {result['resume_id']: result for result in run_screening(iter(items), ROLES, workers=2)}
+
+    assert len(results) == 21
+    assert results['crash']['status'] == 'crashed'
+    assert all(results[f'r{number}']['status'] == 'ok' for number in range(20))
+
+def test_resume_that_crashed_once_is_retried(tmp_path, monkeypatch):
+    monkeypatch.setattr(resume_screening, 'screen_resume', crash_on_marked)
+    items = [{'resume_id': f'r{number}', 'text': RESUME_TEXT} for number in range(6)]
+    items[2]['marker'] = str(tmp_path / 'crashed')
+
+    results = {result['resume_id']: result for result in run_screening(iter(items), ROLES, workers=2)}
+
+    assert os.path.exists(items[2]['marker'])
+    assert sorted(results) == [item['resume_id'] for item in items]
+    assert all(result['status'] == 'ok' for result in results.values())
+
+def test_given_up_resume_is_checkpointed_with_the_rest(tmp_path, monkeypatch):
+    monkeypatch.setattr(resume_screening, 'screen_resume', crash_on_marked)
+    source = write_source(tmp_path / 'resumes.jsonl', ['r0', 'crash', 'r1', 'r2'])
+    output, checkpoint = str(tmp_path / 'out.jsonl'), str(tmp_path / 'out.checkpoint')
+
+    summary = screen_resumes(source, output, ROLES, workers=2, checkpoint=checkpoint)
+
+    assert summary['screened'] == 4 and summary['failed'] == {'crashed': 1}
+    rows = {row['resume_id']: row for row in read_rows(output)}
+    assert rows['crash']['status'] == 'crashed'
+    assert all(rows[resume_id]['status'] == 'ok' for resume_id in ('r0', 'r1', 'r2'))
+    assert ScreeningCheckpoint(checkpoint).load()['done'] == {'r0', 'r1', 'r2', 'crash'}
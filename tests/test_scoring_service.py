@@ -0,0 +1,67 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from scoring_service import RequestBatcher, ScoringService
+
+RESUME_TEXT = "Data analyst skilled in Python, SQL, Excel and Tableau."
+
+async def post(service, path, payload):
+    reader, writer = await asyncio.open_connection(service.host, service.port)
+    body = json.dumps(payload).encode('utf-8')
+    writer.write(f"POST {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n"
+                 f"Connection: close\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, response_body = response.partition(b'\r\n\r\n')
+    return int(head.split(b' ')[1]), json.loads(response_body)
+
+def run_with_service(scenario):
+    async def main():
+        service = ScoringService(port=0, workers=2, executor='thread')
+        await service.start()
+        try:
+            return await scenario(service)
+        finally:
+            await service.stop()
+    return asyncio.run(main())
+
+def test_batch_items_without_a_string_path_get_their_own_error():
+    requests = [{'path': [1]}, {'body': {}}, 'not an object', {'path': '/v1/nowhere'},
+                {'path': '/v1/skills', 'body': {'text': RESUME_TEXT}}]
+    status, body = run_with_service(lambda service: post(service, '/v1/batch', {'requests': requests}))
+
+    assert status == 200
+    assert [response['status'] for response in body['responses']] == [400, 400, 400, 404, 200]
+    assert 'python' in body['responses'][4]['body']['skills']
+
+def test_unexpected_dispatch_error_is_a_500_response(monkeypatch):
+    async def broken_dispatch(method, path, body):
+        raise RuntimeError("boom")
+
+    async def scenario(service):
+        monkeypatch.setattr(service, '_dispatch', broken_dispatch)
+        return await post(service, '/v1/skills', {'text': RESUME_TEXT})
+
+    status, body = run_with_service(scenario)
+    assert status == 500 and body == {'error': 'Internal server error'}
+
+def test_batch_is_split_over_the_workers():
+    async def scenario():
+        batches = []
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            batcher = RequestBatcher(executor, max_batch=10, max_delay=0.05, workers=4)
+            original_run = batcher._run
+
+            async def recording_run(batch):
+                batches.append(len(batch))
+                await original_run(batch)
+
+            batcher._run = recording_run
+            results = await asyncio.gather(*(batcher.submit('skills', {'text': RESUME_TEXT}) for _ in range(10)))
+        return batches, results
+
+    batches, results = asyncio.run(scenario())
+    assert sorted(batches) == [1, 3, 3, 3]
+    assert all(status == 200 for status, _ in results)
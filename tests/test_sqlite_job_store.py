@@ -0,0 +1,68 @@
+import sqlite3
+
+import pytest
+
+from sqlite_job_store import SCHEMA_VERSION, ReadOnlyStoreError, SQLiteJobStore
+
+LOCATION_MAPPING = {'remote': ['remote', 'work from home']}
+
+def make_job(title, experience='1-3 years'):
+    return {
+        'company': 'Acme', 'title': title, 'location': 'Remote', 'salary': '$60,000 - $80,000',
+        'experience': experience, 'posted_date': '2026-10-01', 'requirements': ['python', 'sql'],
+        'company_size': 'Startup', 'job_type': 'Full-time'
+    }
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'jobs.db')
+    store = SQLiteJobStore(path, LOCATION_MAPPING)
+    store.add_job('Data Analyst', make_job('Analyst'))
+    store.add_job('ML Engineer', make_job('Engineer', '5+ years'))
+    store.upsert_job('Data Analyst', make_job('Feed Analyst'), 'feed:1')
+    store.remove_job(1)
+    store.close()
+    return path
+
+def test_new_database_records_schema_version(db_path):
+    connection = sqlite3.connect(db_path)
+    assert connection.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    connection.close()
+
+def test_outdated_database_is_rebuilt_keeping_ids_and_keys(db_path):
+    # An older schema: no version, and the experience columns hold nothing
+    connection = sqlite3.connect(db_path)
+    connection.execute("UPDATE jobs SET experience_min = NULL, experience_max = NULL")
+    connection.execute("DELETE FROM job_counters")
+    connection.execute("PRAGMA user_version = 0")
+    connection.commit()
+    connection.close()
+
+    store = SQLiteJobStore(db_path, LOCATION_MAPPING)
+    assert len(store) == 2
+    assert store.search() == [2, 3]
+    assert store.get(2)['title'] == 'Engineer'
+    assert store.key_id('feed:1') == 3
+    assert store.search(experience_min=5) == [2]
+    assert store.add_job('Data Analyst', make_job('Next')) == 4
+    store.close()
+
+def test_snapshot_from_another_version_is_rejected(db_path):
+    connection = sqlite3.connect(db_path)
+    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    connection.commit()
+    connection.close()
+
+    with pytest.raises(ValueError, match='schema version'):
+        SQLiteJobStore(db_path, LOCATION_MAPPING, read_only=True)
+
+def test_snapshot_rejects_writes(db_path):
+    store = SQLiteJobStore(db_path, LOCATION_MAPPING, read_only=True)
+    with pytest.raises(ReadOnlyStoreError):
+        store.add_job('Data Analyst', make_job('Analyst'))
+    with pytest.raises(ReadOnlyStoreError):
+        store.remove_job(2)
+    with pytest.raises(ReadOnlyStoreError):
+        store.upsert_job('Data Analyst', make_job('Analyst'), 'feed:2')
+    assert len(store) == 2
+    store.close()
@@ -0,0 +1,10 @@
+from utils import SkillAutomaton
+
+def test_count_all_counts_substrings_without_overlaps():
+    automaton = SkillAutomaton({'aa': 'aa', 'data': 'data', 'data analysis': 'data analysis'})
+    text = "aaaaa metadata, data analysis"
+
+    assert automaton.count_all(text) == {
+        'aa': text.count('aa'), 'data': text.count('data'), 'data analysis': 1
+    }
+    assert automaton.count_all("") == {}
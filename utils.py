@@ -1,19 +1,5 @@
 # utils.py - Enhanced skill extraction
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-import streamlit as st
-
-# Download required NLTK data
-@st.cache_data
-def download_nltk_data():
-    try:
-        nltk.download('punkt', quiet=True)
-        nltk.download('stopwords', quiet=True)
-        nltk.download('averaged_perceptron_tagger', quiet=True)
-    except:
-        pass
 
 # Comprehensive skills database
 SKILLS_DATABASE = {
@@ -80,65 +66,175 @@ def normalize_skill(skill):
     skill_lower = skill.lower().strip()
     return SKILL_ALIASES.get(skill_lower, skill_lower)
 
+# Characters that can appear inside a skill name; every other run of
+# characters collapses to a single space before matching
+_SKILL_TEXT_PATTERN = re.compile(r'[^\w.+#/\-]+')
+
+def normalize_skill_text(text):
+    """Lowercase text and collapse separators the same way skill patterns are"""
+    return _SKILL_TEXT_PATTERN.sub(' ', text.lower())
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+class SkillAutomaton:
+    """
+    Aho-Corasick automaton over skill names and aliases.
+
+    Built once from the skills vocabulary, it reports every skill in a text
+    with a single left-to-right pass, so extraction cost depends on the text
+    length rather than on the size of the vocabulary.
+    """
+
+    def __init__(self, patterns):
+        # patterns: mapping of surface form -> canonical skill
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._lengths = []
+        self._skills = []
+        # Per-state transitions with failure links folded in; built on first use
+        self._transitions = None
+
+        for surface, skill in patterns.items():
+            surface = normalize_skill_text(surface).strip()
+            if not surface:
+                continue
+            self._add_pattern(surface, skill)
+
+        self._build_failure_links()
+
+    def _add_pattern(self, surface, skill):
+        state = 0
+        for char in surface:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+
+        self._output[state].append(len(self._skills))
+        self._lengths.append(len(surface))
+        self._skills.append(skill)
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                # Inherit matches that end at the failure state
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _build_transitions(self):
+        # Breadth-first, so a state's failure target is resolved before it
+        order = [0]
+        head = 0
+        while head < len(order):
+            order.extend(self._goto[order[head]].values())
+            head += 1
+
+        transitions = [None] * len(self._goto)
+        for state in order:
+            moves = dict(transitions[self._fail[state]]) if state else {}
+            moves.update(self._goto[state])
+            transitions[state] = moves
+        return transitions
+
+    def find_all(self, text):
+        """Return canonical skills found in text, in order of first appearance"""
+        if not text:
+            return []
+
+        text = normalize_skill_text(text)
+        goto, fail, output = self._goto, self._fail, self._output
+        lengths, skills = self._lengths, self._skills
+        text_length = len(text)
+
+        found = {}
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if not output[state]:
+                continue
+
+            # Only accept matches that sit on word boundaries
+            if index + 1 < text_length and _is_word_char(text[index + 1]):
+                continue
+            for pattern_id in output[state]:
+                start = index + 1 - lengths[pattern_id]
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                found.setdefault(skills[pattern_id], None)
+
+        return list(found)
+
+    def count_all(self, text):
+        """
+        Count every pattern in text as given, anywhere rather than only on
+        word boundaries, with a pattern's occurrences not overlapping each
+        other (as str.count does), in one pass. Returns {skill: count} for
+        the skills that occur.
+        """
+        if self._transitions is None:
+            self._transitions = self._build_transitions()
+        transitions, output = self._transitions, self._output
+        lengths, skills = self._lengths, self._skills
+
+        counts = {}
+        # Pattern id -> first text position a new occurrence may start at
+        next_start = {}
+        state = 0
+        for index, char in enumerate(text):
+            state = transitions[state].get(char, 0)
+            if not output[state]:
+                continue
+
+            for pattern_id in output[state]:
+                start = index + 1 - lengths[pattern_id]
+                if start >= next_start.get(pattern_id, 0):
+                    next_start[pattern_id] = index + 1
+                    skill = skills[pattern_id]
+                    counts[skill] = counts.get(skill, 0) + 1
+
+        return counts
+
+def build_skill_automaton(skills_database=None, aliases=None):
+    """Build a skill automaton from a skills database and alias table"""
+    skills_database = SKILLS_DATABASE if skills_database is None else skills_database
+    aliases = SKILL_ALIASES if aliases is None else aliases
+
+    patterns = {}
+    for skills in skills_database.values():
+        for skill in skills:
+            patterns[skill] = skill
+    for alias, actual_skill in aliases.items():
+        patterns.setdefault(alias, actual_skill)
+
+    return SkillAutomaton(patterns)
+
+# Precompiled matcher shared by every extract_skills call
+SKILL_AUTOMATON = build_skill_automaton()
+
 def extract_skills(text):
     """Enhanced skill extraction with better matching"""
     if not text:
         return []
     
-    download_nltk_data()
-    
-    # Convert to lowercase for matching
-    text_lower = text.lower()
-    
-    # Remove special characters but keep spaces, dots, and hyphens
-    cleaned_text = re.sub(r'[^\w\s\.\-]', ' ', text_lower)
-    
-    detected_skills = set()
-    
-    # Method 1: Direct substring matching
-    for skill in ALL_SKILLS:
-        if skill in cleaned_text:
-            detected_skills.add(skill)
-    
-    # Method 2: Token-based matching (for compound skills)
-    try:
-        tokens = word_tokenize(cleaned_text)
-        stop_words = set(stopwords.words('english'))
-        filtered_tokens = [token for token in tokens if token not in stop_words and len(token) > 2]
-        
-        # Check for multi-word skills
-        text_for_ngrams = ' '.join(filtered_tokens)
-        for skill in ALL_SKILLS:
-            if len(skill.split()) > 1 and skill in text_for_ngrams:
-                detected_skills.add(skill)
-    except:
-        pass
-    
-    # Method 3: Check aliases
-    for alias, actual_skill in SKILL_ALIASES.items():
-        if alias in cleaned_text:
-            detected_skills.add(actual_skill)
-    
-    # Method 4: Pattern matching for specific formats
-    patterns = {
-        r'\b(python|java|javascript|c\+\+|c#)\b': lambda m: m.group(1).lower(),
-        r'\b(react|angular|vue)\.?js\b': lambda m: m.group(1).lower(),
-        r'\b(node)\.?js\b': 'node.js',
-        r'\b(tensorflow|pytorch|keras)\b': lambda m: m.group(1).lower(),
-        r'\b(aws|azure|gcp)\b': lambda m: m.group(1).lower(),
-    }
-    
-    for pattern, skill_func in patterns.items():
-        matches = re.finditer(pattern, cleaned_text, re.IGNORECASE)
-        for match in matches:
-            if callable(skill_func):
-                skill = skill_func(match)
-            else:
-                skill = skill_func
-            if skill in ALL_SKILLS:
-                detected_skills.add(skill)
-    
-    return list(detected_skills)
+    return SKILL_AUTOMATON.find_all(text)
 
 def get_skill_category(skill):
     """Get the category of a skill"""